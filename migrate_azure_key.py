@@ -1,7 +1,14 @@
 import os
+import stat
+import tempfile
 import yaml
 import keyring
 
+try:
+    from yaml import CSafeLoader as _Loader, CSafeDumper as _Dumper
+except ImportError:
+    from yaml import SafeLoader as _Loader, SafeDumper as _Dumper
+
 
 def get_nested(dct, keys, default=None):
     current = dct
@@ -25,8 +32,15 @@ def migrate_azure_key(config_path: str = 'config.yaml') -> None:
     if not os.path.exists(config_path):
         raise FileNotFoundError(f"Config file not found: {config_path}")
 
-    with open(config_path, 'r', encoding='utf-8') as f:
-        config = yaml.safe_load(f) or {}
+    with open(config_path, 'rb') as f:
+        data = f.read()
+
+    # Skip YAML parsing entirely when the key cannot be present
+    if b'azure_openai_api_key' not in data:
+        print('No azure_openai_api_key found in config. Nothing to migrate.')
+        return
+
+    config = yaml.load(data, Loader=_Loader) or {}
 
     api = get_nested(config, ['model_options', 'api'], default={})
     azure_key = api.get('azure_openai_api_key')
@@ -40,15 +54,26 @@ def migrate_azure_key(config_path: str = 'config.yaml') -> None:
     print('Saved Azure key to keyring under service=whisperwriter, name=azure_openai_transcription')
 
     # Remove from config
-    api['azure_openai_api_key'] = None
-    if 'model_options' not in config:
-        config['model_options'] = {}
-    if 'api' not in config['model_options']:
-        config['model_options']['api'] = {}
-    config['model_options']['api'] = api
-
-    with open(config_path, 'w', encoding='utf-8') as f:
-        yaml.dump(config, f, allow_unicode=True)
+    config.setdefault('model_options', {}).setdefault('api', {})['azure_openai_api_key'] = None
+
+    # Write to a temporary file next to the config and swap it in atomically
+    config_dir = os.path.dirname(os.path.abspath(config_path))
+    with tempfile.NamedTemporaryFile(
+        'w', encoding='utf-8', dir=config_dir, suffix='.tmp', delete=False, buffering=65536
+    ) as f:
+        tmp_path = f.name
+        try:
+            yaml.dump(config, f, Dumper=_Dumper, allow_unicode=True)
+            # The data must be on disk before the rename, or a crash could leave an empty config
+            f.flush()
+            os.fsync(f.fileno())
+            # NamedTemporaryFile creates the file as 0600; keep the permissions of the original config
+            os.chmod(tmp_path, stat.S_IMODE(os.stat(config_path).st_mode))
+        except Exception:
+            f.close()
+            os.remove(tmp_path)
+            raise
+    os.replace(tmp_path, config_path)
     print('Removed key from config.yaml and saved changes.')
 
 
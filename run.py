@@ -1,50 +1,85 @@
 import os
+import re
 import sys
 from pathlib import Path
 import subprocess
 from dotenv import load_dotenv
-import glob
+
+CUDA_PATH_CACHE = Path.home() / '.whisperwriter' / 'cuda_path.txt'
+CUDA_VERSION_DIR_RE = re.compile(r'^v(12)\.(\d+)(?:\.(\d+))?$')
+
+def load_cached_cuda_path():
+    """Return the CUDA path cached by a previous launch if it still exists."""
+    try:
+        cached_path = CUDA_PATH_CACHE.read_text(encoding='utf-8').strip()
+    except OSError:
+        return None
+    return cached_path if cached_path and os.path.isdir(cached_path) else None
+
+def save_cached_cuda_path(cuda_path):
+    """Remember the discovered CUDA path for the next launch."""
+    try:
+        CUDA_PATH_CACHE.parent.mkdir(parents=True, exist_ok=True)
+        CUDA_PATH_CACHE.write_text(cuda_path, encoding='utf-8')
+    except OSError as e:
+        print(f'Could not cache CUDA path: {e}')
+
+def find_system_cuda_path():
+    """Find the newest system CUDA 12.x installation, or None if there is none."""
+    # Find all CUDA installations in a version-agnostic way
+    cuda_base_path = r"C:\Program Files\NVIDIA GPU Computing Toolkit\CUDA"
+    if not os.path.exists(cuda_base_path):
+        print('NVIDIA CUDA Toolkit folder not found')
+        return None
+
+    # Find the newest v12.x folder in a single directory pass
+    newest_version = None
+    newest_path = None
+    with os.scandir(cuda_base_path) as entries:
+        for entry in entries:
+            match = CUDA_VERSION_DIR_RE.match(entry.name)
+            if not match or not entry.is_dir(follow_symlinks=False):
+                continue
+            version = (int(match[1]), int(match[2]), int(match[3] or 0))
+            if newest_version is None or version > newest_version:
+                newest_version, newest_path = version, entry.path
+
+    if not newest_path:
+        print('No CUDA 12.x installation found in system')
+        return None
+    return newest_path
 
 def set_cuda_paths():
     """Set up CUDA paths for GPU support."""
     try:
-        # Find all CUDA installations in a version-agnostic way
-        cuda_base_path = r"C:\Program Files\NVIDIA GPU Computing Toolkit\CUDA"
-        if os.path.exists(cuda_base_path):
-            # Get all v12.x folders, sorted by version number (newest first)
-            cuda_versions = glob.glob(os.path.join(cuda_base_path, "v12.*"))
-            cuda_versions.sort(key=lambda x: [int(n) for n in x.split('v')[1].split('.')], reverse=True)
-            
-            if cuda_versions:
-                system_cuda_path = cuda_versions[0]  # Use the newest version
-                cuda_version = os.path.basename(system_cuda_path)[1:]  # Remove 'v' prefix
-                print(f'Found system CUDA version: {cuda_version}')
-                
-                # Use system CUDA
-                paths_to_add = [
-                    os.path.join(system_cuda_path, 'bin'),
-                    os.path.join(system_cuda_path, 'libnvvp'),
-                ]
-                
-                # Add cuDNN paths if present
-                cudnn_path = os.path.join(system_cuda_path, 'cudnn')
-                if os.path.exists(cudnn_path):
-                    paths_to_add.append(os.path.join(cudnn_path, 'bin'))
-                
-                print(f'Using system CUDA from: {system_cuda_path}')
-            else:
-                print('No CUDA 12.x installation found in system')
+        system_cuda_path = load_cached_cuda_path()
+        if not system_cuda_path:
+            system_cuda_path = find_system_cuda_path()
+            if not system_cuda_path:
                 return check_bundled_cuda()
-        else:
-            print('NVIDIA CUDA Toolkit folder not found')
-            return check_bundled_cuda()
+            save_cached_cuda_path(system_cuda_path)
+
+        cuda_version = os.path.basename(system_cuda_path)[1:]  # Remove 'v' prefix
+        print(f'Found system CUDA version: {cuda_version}')
+        
+        # Use system CUDA
+        paths_to_add = [
+            os.path.join(system_cuda_path, 'bin'),
+            os.path.join(system_cuda_path, 'libnvvp'),
+        ]
+        
+        # Add cuDNN paths if present
+        cudnn_path = os.path.join(system_cuda_path, 'cudnn')
+        if os.path.exists(cudnn_path):
+            paths_to_add.append(os.path.join(cudnn_path, 'bin'))
+        
+        print(f'Using system CUDA from: {system_cuda_path}')
             
-        # Update environment variables
-        env_vars = ['CUDA_PATH', f'CUDA_PATH_V{cuda_version.replace(".", "_")}', 'PATH']
-        for env_var in env_vars:
-            current_value = os.environ.get(env_var, '')
-            new_value = os.pathsep.join(paths_to_add + [current_value] if current_value else paths_to_add)
-            os.environ[env_var] = new_value
+        # Update environment variables: CUDA_PATH* point at the toolkit root, PATH gets the binaries
+        os.environ['CUDA_PATH'] = system_cuda_path
+        os.environ[f'CUDA_PATH_V{cuda_version.replace(".", "_")}'] = system_cuda_path
+        current_path = os.environ.get('PATH', '')
+        os.environ['PATH'] = os.pathsep.join(paths_to_add + [current_path] if current_path else paths_to_add)
             
         print('CUDA paths set up successfully')
         
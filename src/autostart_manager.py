@@ -4,42 +4,61 @@ AutostartManager - Handles autostart functionality for Windows systems.
 import os
 import sys
 import platform
-import subprocess
+from functools import wraps
 from pathlib import Path
+if platform.system() == 'Windows':
+    import pywintypes
+    import win32com.client
+
+
+def _cache_found(func):
+    """
+    Cache the result of a path lookup once it finds something. A None result is not
+    cached, so a folder or file that appears later is still picked up.
+    """
+    found = []
+
+    @wraps(func)
+    def wrapper():
+        if found:
+            return found[0]
+        result = func()
+        if result is not None:
+            found.append(result)
+        return result
+
+    wrapper.cache_clear = found.clear
+    return wrapper
 
 
 class AutostartManager:
     """Manages autostart functionality for WhisperWriter on Windows."""
     
     APP_NAME = "WhisperWriter"
+    _IS_WINDOWS = platform.system() == 'Windows'
     
     @staticmethod
     def is_windows():
         """Check if the current platform is Windows."""
-        return platform.system() == 'Windows'
+        return AutostartManager._IS_WINDOWS
     
     @staticmethod
+    @_cache_found
     def get_startup_folder():
         """Get the Windows startup folder path for the current user."""
         if not AutostartManager.is_windows():
             return None
         
-        try:
-            # Use shell:startup to get the startup folder
-            result = subprocess.run(
-                ['cmd', '/c', 'echo %APPDATA%'],
-                capture_output=True,
-                text=True,
-                check=True
-            )
-            appdata = result.stdout.strip()
-            startup_folder = os.path.join(appdata, 'Microsoft', 'Windows', 'Start Menu', 'Programs', 'Startup')
-            startup_folder = startup_folder.replace('/', '\\')  # Ensure Windows path separators
-            return startup_folder if os.path.exists(startup_folder) else None
-        except (subprocess.CalledProcessError, FileNotFoundError):
+        appdata = os.environ.get('APPDATA')
+        if not appdata:
             return None
+        
+        startup_folder = os.path.join(appdata, 'Microsoft', 'Windows', 'Start Menu', 'Programs', 'Startup')
+        startup_folder = startup_folder.replace('/', '\\')  # Ensure Windows path separators
+        return startup_folder if os.path.exists(startup_folder) else None
     
     @staticmethod
+    @_cache_found
     def get_shortcut_path():
         """Get the full path to the autostart shortcut."""
         startup_folder = AutostartManager.get_startup_folder()
@@ -49,6 +68,7 @@ class AutostartManager:
         return shortcut_path.replace('/', '\\') if AutostartManager.is_windows() else shortcut_path
     
     @staticmethod
+    @_cache_found
     def get_target_executable():
         """Get the target executable/script to run on startup."""
         # Get the project root directory (where run_project.bat is located)
@@ -85,23 +105,14 @@ class AutostartManager:
             return False, "Could not determine shortcut path"
         
         try:
-            # Use PowerShell to create the shortcut
+            # Create the shortcut in-process through the WScript.Shell COM object
             target_dir = os.path.dirname(target_executable)
-            ps_script = f'''
-$WshShell = New-Object -comObject WScript.Shell
-$Shortcut = $WshShell.CreateShortcut("{shortcut_path}")
-$Shortcut.TargetPath = "{target_executable}"
-$Shortcut.WorkingDirectory = "{target_dir}"
-$Shortcut.Description = "WhisperWriter - Voice Transcription Tool"
-$Shortcut.Save()
-'''
-            
-            result = subprocess.run(
-                ['powershell', '-Command', ps_script],
-                capture_output=True,
-                text=True,
-                check=True
-            )
+            shell = win32com.client.Dispatch("WScript.Shell")
+            shortcut = shell.CreateShortcut(shortcut_path)
+            shortcut.TargetPath = target_executable
+            shortcut.WorkingDirectory = target_dir
+            shortcut.Description = "WhisperWriter - Voice Transcription Tool"
+            shortcut.Save()
             
             # Verify the shortcut was created
             if os.path.exists(shortcut_path):
@@ -109,7 +120,7 @@ $Shortcut.Save()
             else:
                 return False, "Shortcut creation failed"
                 
-        except (subprocess.CalledProcessError, FileNotFoundError) as e:
+        except pywintypes.com_error as e:
             return False, f"Failed to create autostart shortcut: {str(e)}"
     
     @staticmethod
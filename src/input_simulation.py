@@ -1,5 +1,8 @@
+import ctypes
 import subprocess
 import os
+import sys
+import shutil
 import signal
 import threading
 import time
@@ -45,6 +48,21 @@ IMAGE_CLIPBOARD_FORMATS = {
     win32con.CF_METAFILEPICT,
 }
 
+# Formats Windows synthesizes from a sibling format. When one of the listed
+# source formats was captured, the synthesized copy is skipped and recreated by
+# Windows after the source format is restored. Sources are listed before the
+# formats that depend on them.
+SYNTHESIZED_CLIPBOARD_FORMATS = {
+    win32con.CF_TEXT: (win32con.CF_UNICODETEXT,),
+    win32con.CF_OEMTEXT: (win32con.CF_UNICODETEXT, win32con.CF_TEXT),
+    win32con.CF_DIB: (win32con.CF_DIBV5,),
+    win32con.CF_BITMAP: (win32con.CF_DIBV5, win32con.CF_DIB),
+    win32con.CF_METAFILEPICT: (win32con.CF_ENHMETAFILE,),
+}
+
+# Registered clipboard formats that carry rich text and can be written back as captured
+RICH_TEXT_CLIPBOARD_FORMAT_NAMES = ('HTML Format', 'Rich Text Format')
+
 IMAGE_CLIPBOARD_FORMAT_HINTS = (
     'bitmap',
     'dib',
@@ -59,6 +77,60 @@ IMAGE_CLIPBOARD_FORMAT_HINTS = (
 TEXT_ONLY_CLIPBOARD_RESTORE_DELAY = 0.2
 RICH_CONTENT_CLIPBOARD_RESTORE_DELAY = 0.5
 IMAGE_CLIPBOARD_ASYNC_RESTORE_DELAY = 2.0
+CLIPBOARD_READ_POLL_INTERVAL = 0.005
+YDOTOOL_SOCKET_NAME = '.ydotool_socket'
+YDOTOOL_FALLBACK_SOCKET_DIR = '/tmp'
+YDOTOOLD_STARTUP_TIMEOUT = 1.0
+
+INPUT_KEYBOARD = 1
+KEYEVENTF_EXTENDEDKEY = 0x0001
+KEYEVENTF_KEYUP = 0x0002
+VK_CONTROL = 0x11
+VK_DELETE = 0x2E
+VK_V = 0x56
+
+
+class _MOUSEINPUT(ctypes.Structure):
+    _fields_ = [
+        ('dx', ctypes.c_long),
+        ('dy', ctypes.c_long),
+        ('mouseData', ctypes.c_ulong),
+        ('dwFlags', ctypes.c_ulong),
+        ('time', ctypes.c_ulong),
+        ('dwExtraInfo', ctypes.c_size_t),
+    ]
+
+
+class _KEYBDINPUT(ctypes.Structure):
+    _fields_ = [
+        ('wVk', ctypes.c_ushort),
+        ('wScan', ctypes.c_ushort),
+        ('dwFlags', ctypes.c_ulong),
+        ('time', ctypes.c_ulong),
+        ('dwExtraInfo', ctypes.c_size_t),
+    ]
+
+
+class _HARDWAREINPUT(ctypes.Structure):
+    _fields_ = [
+        ('uMsg', ctypes.c_ulong),
+        ('wParamL', ctypes.c_ushort),
+        ('wParamH', ctypes.c_ushort),
+    ]
+
+
+class _INPUTUNION(ctypes.Union):
+    # The mouse member sets the union size SendInput expects, even though only key events are sent
+    _fields_ = [('mi', _MOUSEINPUT), ('ki', _KEYBDINPUT), ('hi', _HARDWAREINPUT)]
+
+
+class _INPUT(ctypes.Structure):
+    _fields_ = [('type', ctypes.c_ulong), ('union', _INPUTUNION)]
+
+
+def _keyboard_input(virtual_key, flags=0):
+    return _INPUT(type=INPUT_KEYBOARD, union=_INPUTUNION(ki=_KEYBDINPUT(wVk=virtual_key, dwFlags=flags)))
+
 
 def run_command_or_exit_on_failure(command):
     """
@@ -80,25 +152,78 @@ class InputSimulator:
 
     _clipboard_restore_generation = 0
     _clipboard_restore_lock = threading.Lock()
+    _rich_text_clipboard_formats = None
 
     def __init__(self):
         """
         Initialize the InputSimulator with the specified configuration.
         """
         self.input_method = ConfigManager.get_config_value('post_processing', 'input_method')
+        self.clipboard_threshold = ConfigManager.get_config_value('post_processing', 'clipboard_threshold') or 40
+        self.writing_key_press_delay = ConfigManager.get_config_value('post_processing', 'writing_key_press_delay') or 0
         self.dotool_process = None
+        self.ydotoold_process = None
 
         if self.input_method == 'pynput':
             self.keyboard = PynputController()
+        elif self.input_method == 'ydotool':
+            self._initialize_ydotool()
         elif self.input_method == 'dotool':
             self._initialize_dotool()
 
+    @staticmethod
+    def get_ydotool_socket_path():
+        """
+        Return the socket path ydotool uses: $YDOTOOL_SOCKET, else .ydotool_socket in
+        $XDG_RUNTIME_DIR, else in /tmp.
+        """
+        socket_path = os.environ.get('YDOTOOL_SOCKET')
+        if socket_path:
+            return socket_path
+        runtime_dir = os.environ.get('XDG_RUNTIME_DIR') or YDOTOOL_FALLBACK_SOCKET_DIR
+        return os.path.join(runtime_dir, YDOTOOL_SOCKET_NAME)
+
+    def _initialize_ydotool(self):
+        """
+        Start a ydotoold daemon if none is running, so each ydotool call only talks to its socket.
+        """
+        socket_path = self.get_ydotool_socket_path()
+        if os.path.exists(socket_path) or not shutil.which('ydotoold'):
+            return
+
+        try:
+            self.ydotoold_process = subprocess.Popen(
+                ['ydotoold', f'--socket-path={socket_path}'],
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+            )
+        except OSError as e:
+            ConfigManager.console_print(f"Unable to start ydotoold: {e}")
+            return
+
+        deadline = time.monotonic() + YDOTOOLD_STARTUP_TIMEOUT
+        while not os.path.exists(socket_path) and time.monotonic() < deadline:
+            if self.ydotoold_process.poll() is not None:
+                ConfigManager.console_print("ydotoold exited during startup; ydotool will run without a session daemon.")
+                self.ydotoold_process = None
+                return
+            time.sleep(0.01)
+
+    def _terminate_ydotoold(self):
+        """
+        Terminate the ydotoold daemon if it was started by this simulator.
+        """
+        if self.ydotoold_process:
+            self.ydotoold_process.terminate()
+            self.ydotoold_process = None
+
     def _initialize_dotool(self):
         """
         Initialize the dotool process for input simulation.
         """
-        self.dotool_process = subprocess.Popen("dotool", stdin=subprocess.PIPE, text=True)
-        assert self.dotool_process.stdin is not None
+        self.dotool_process = subprocess.Popen("dotool", stdin=subprocess.PIPE)
+        if self.dotool_process.stdin is None:
+            raise RuntimeError("dotool stdin unavailable")
 
     def _terminate_dotool(self):
         """
@@ -115,11 +240,8 @@ class InputSimulator:
         Args:
             text (str): The text to type.
         """
-        # Get the character threshold from config, default to 1000 if not set
-        char_threshold = ConfigManager.get_config_value('post_processing', 'clipboard_threshold') or 1000
-        
         # Use clipboard for long text
-        if len(text) > char_threshold:
+        if len(text) > self.clipboard_threshold:
             if self._paste_with_clipboard_preservation(text):
                 return
 
@@ -127,7 +249,7 @@ class InputSimulator:
 
     def typewrite_direct(self, text):
         """Type text without using the clipboard."""
-        interval = ConfigManager.get_config_value('post_processing', 'writing_key_press_delay')
+        interval = self.writing_key_press_delay
         if self.input_method == 'pynput':
             self._typewrite_pynput(text, interval)
         elif self.input_method == 'ydotool':
@@ -135,6 +257,28 @@ class InputSimulator:
         elif self.input_method == 'dotool':
             self._typewrite_dotool(text, interval)
     
+    @staticmethod
+    def send_delete_and_paste():
+        """
+        Delete the selection and press Ctrl+V with a single SendInput call.
+
+        Windows inserts the six key events into the input stream as one uninterrupted burst, so
+        keys the user presses meanwhile cannot land inside the chord. Returns False where
+        SendInput is unavailable or did not accept every event.
+        """
+        if sys.platform != 'win32':
+            return False
+        events = (_INPUT * 6)(
+            _keyboard_input(VK_DELETE, KEYEVENTF_EXTENDEDKEY),
+            _keyboard_input(VK_DELETE, KEYEVENTF_EXTENDEDKEY | KEYEVENTF_KEYUP),
+            _keyboard_input(VK_CONTROL),
+            _keyboard_input(VK_V),
+            _keyboard_input(VK_V, KEYEVENTF_KEYUP),
+            _keyboard_input(VK_CONTROL, KEYEVENTF_KEYUP),
+        )
+        sent = ctypes.windll.user32.SendInput(len(events), events, ctypes.sizeof(_INPUT))
+        return sent == len(events)
+
     @staticmethod
     def safe_open_clipboard(max_retries=5, delay=0.1):
         """
@@ -221,10 +365,11 @@ class InputSimulator:
 
             win32clipboard.EmptyClipboard()
             restored_formats = cls.restore_open_clipboard_formats(saved_formats)
-            ConfigManager.console_print(
-                f"{success_message}: {cls.describe_clipboard_formats(restored_formats)}",
-                verbose=True,
-            )
+            if ConfigManager.get_verbose_mode():
+                ConfigManager.console_print(
+                    f"{success_message}: {cls.describe_clipboard_formats(restored_formats)}",
+                    verbose=True,
+                )
             return True
         finally:
             cls.safe_close_clipboard()
@@ -269,21 +414,131 @@ class InputSimulator:
         """Return the async restore delay used for clipboard image content."""
         return IMAGE_CLIPBOARD_ASYNC_RESTORE_DELAY
 
+    @staticmethod
+    def get_window_owner(hwnd):
+        """Return the (thread id, process id) that owns a window, or None if it cannot be determined."""
+        if not hwnd or sys.platform != 'win32':
+            return None
+        process_id = ctypes.c_ulong()
+        thread_id = ctypes.windll.user32.GetWindowThreadProcessId(hwnd, ctypes.byref(process_id))
+        if not thread_id:
+            return None
+        return thread_id, process_id.value
+
+    @classmethod
+    def get_foreground_window_owner(cls):
+        """Return the (thread id, process id) of the foreground window, which receives the paste."""
+        if sys.platform != 'win32':
+            return None
+        return cls.get_window_owner(ctypes.windll.user32.GetForegroundWindow())
+
+    @classmethod
+    def wait_for_clipboard_read(cls, timeout):
+        """
+        Wait until the paste target has opened and released the clipboard, or until the timeout elapses.
+        Returns True if a clipboard read by the paste target was observed before the timeout.
+
+        Only an opener owned by the foreground window's thread or process counts: clipboard
+        history tools open the clipboard as soon as it changes, usually before the target has
+        handled Ctrl+V, and restoring after their read would paste the old clipboard.
+        """
+        deadline = time.monotonic() + timeout
+        target_owner = cls.get_foreground_window_owner()
+        reader_seen = False
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            try:
+                open_window = win32clipboard.GetOpenClipboardWindow()
+            except Exception:
+                open_window = 0
+            if open_window:
+                owner = cls.get_window_owner(open_window)
+                if target_owner and owner and (owner[0] == target_owner[0] or owner[1] == target_owner[1]):
+                    reader_seen = True
+            elif reader_seen:
+                return True
+            time.sleep(min(CLIPBOARD_READ_POLL_INTERVAL, remaining))
+
     @classmethod
     def capture_open_clipboard_formats(cls):
-        """Capture all readable clipboard formats while the clipboard is already open."""
-        saved_formats = {}
+        """Capture readable clipboard formats while the clipboard is already open.
+
+        Formats that Windows can synthesize from another captured format are skipped,
+        so large images are copied once instead of once per equivalent format.
+        """
+        available_formats = []
         format_id = win32clipboard.EnumClipboardFormats(0)
         while format_id:
+            available_formats.append(format_id)
+            format_id = win32clipboard.EnumClipboardFormats(format_id)
+
+        captured = {}
+
+        def capture(format_id):
             try:
-                saved_formats[format_id] = win32clipboard.GetClipboardData(format_id)
+                data = win32clipboard.GetClipboardData(format_id)
             except Exception as exc:
                 ConfigManager.console_print(
                     f"Skipping clipboard format {cls.get_clipboard_format_name(format_id)}({format_id}): {exc}",
                     verbose=True,
                 )
-            format_id = win32clipboard.EnumClipboardFormats(format_id)
-        return saved_formats
+                return
+            if isinstance(data, int):
+                # Handle-based formats (CF_BITMAP, CF_PALETTE, ...) return clipboard-owned GDI handles
+                # that are destroyed by EmptyClipboard, so they cannot be restored later.
+                ConfigManager.console_print(
+                    f"Skipping clipboard format {cls.get_clipboard_format_name(format_id)}({format_id}): handle is owned by the clipboard",
+                    verbose=True,
+                )
+                return
+            captured[format_id] = data
+
+        for format_id in available_formats:
+            if format_id not in SYNTHESIZED_CLIPBOARD_FORMATS:
+                capture(format_id)
+        for format_id, sources in SYNTHESIZED_CLIPBOARD_FORMATS.items():
+            if format_id in available_formats and not any(source in captured for source in sources):
+                capture(format_id)
+
+        # Keep the original enumeration order so paste targets see the same preferred format.
+        return {format_id: captured[format_id] for format_id in available_formats if format_id in captured}
+
+    @classmethod
+    def get_rich_text_clipboard_formats(cls):
+        """Return the ids of the registered rich text clipboard formats, registering them on first use."""
+        if cls._rich_text_clipboard_formats is None:
+            cls._rich_text_clipboard_formats = tuple(
+                win32clipboard.RegisterClipboardFormat(name) for name in RICH_TEXT_CLIPBOARD_FORMAT_NAMES
+            )
+        return cls._rich_text_clipboard_formats
+
+    @classmethod
+    def capture_open_clipboard_text_formats(cls):
+        """Capture only text and rich text formats while the clipboard is already open.
+
+        Unlike capture_open_clipboard_formats, nothing outside the allowlist is enumerated or
+        read, so copied images are never marshalled. CF_TEXT and CF_OEMTEXT are only read
+        when there is no CF_UNICODETEXT for Windows to synthesize them from.
+        """
+        format_ids = [win32con.CF_UNICODETEXT]
+        if not win32clipboard.IsClipboardFormatAvailable(win32con.CF_UNICODETEXT):
+            format_ids += [win32con.CF_TEXT, win32con.CF_OEMTEXT]
+        format_ids += cls.get_rich_text_clipboard_formats()
+
+        captured = {}
+        for format_id in format_ids:
+            if not win32clipboard.IsClipboardFormatAvailable(format_id):
+                continue
+            try:
+                captured[format_id] = win32clipboard.GetClipboardData(format_id)
+            except Exception as exc:
+                ConfigManager.console_print(
+                    f"Skipping clipboard format {cls.get_clipboard_format_name(format_id)}({format_id}): {exc}",
+                    verbose=True,
+                )
+        return captured
 
     @classmethod
     def restore_open_clipboard_formats(cls, saved_formats):
@@ -331,10 +586,11 @@ class InputSimulator:
         
         try:
             saved_formats = InputSimulator.capture_open_clipboard_formats()
-            ConfigManager.console_print(
-                f"Clipboard paste captured formats: {InputSimulator.describe_clipboard_formats(saved_formats)}",
-                verbose=True,
-            )
+            if ConfigManager.get_verbose_mode():
+                ConfigManager.console_print(
+                    f"Clipboard paste captured formats: {InputSimulator.describe_clipboard_formats(saved_formats)}",
+                    verbose=True,
+                )
             image_clipboard = InputSimulator.has_image_clipboard_content(saved_formats)
             if image_clipboard:
                 ConfigManager.console_print(
@@ -368,8 +624,7 @@ class InputSimulator:
                 "ydotool", "key", "ctrl+v"
             ])
         elif self.input_method == 'dotool':
-            assert self.dotool_process and self.dotool_process.stdin
-            self.dotool_process.stdin.write("key ctrl+v\n")
+            self.dotool_process.stdin.write(b"key ctrl+v\n")
             self.dotool_process.stdin.flush()
 
         if image_clipboard:
@@ -384,17 +639,13 @@ class InputSimulator:
         # Wait for the target application to read clipboard data before restoring the original clipboard.
         restore_delay = InputSimulator.get_clipboard_restore_delay(saved_formats)
         ConfigManager.console_print(
-            f"Waiting {restore_delay:.2f}s before restoring clipboard after paste.",
+            f"Waiting up to {restore_delay:.2f}s for the paste target to read the clipboard before restoring it.",
             verbose=True,
         )
-        time.sleep(restore_delay)
+        if InputSimulator.wait_for_clipboard_read(restore_delay):
+            ConfigManager.console_print("Paste target released the clipboard; restoring early.", verbose=True)
         
-        # Restore all original clipboard formats
-        if not InputSimulator.safe_open_clipboard():
-            ConfigManager.console_print("Unable to reopen clipboard for restoring original content.")
-            return True
-        InputSimulator.safe_close_clipboard()
-
+        # Restore all original clipboard formats; this opens the clipboard once more, only if unchanged
         InputSimulator.restore_clipboard_if_unchanged(
             saved_formats,
             text,
@@ -412,10 +663,17 @@ class InputSimulator:
             text (str): The text to type.
             interval (float): The interval between keystrokes in seconds.
         """
+        if not interval or interval <= 0:
+            self.keyboard.type(text)
+            return
+
+        press = self.keyboard.press
+        release = self.keyboard.release
+        sleep = time.sleep
         for char in text:
-            self.keyboard.press(char)
-            self.keyboard.release(char)
-            time.sleep(interval)
+            press(char)
+            release(char)
+            sleep(interval)
 
     def _typewrite_ydotool(self, text, interval):
         """
@@ -443,14 +701,15 @@ class InputSimulator:
             text (str): The text to type.
             interval (float): The interval between keystrokes in seconds.
         """
-        assert self.dotool_process and self.dotool_process.stdin
-        self.dotool_process.stdin.write(f"typedelay {interval * 1000}\n")
-        self.dotool_process.stdin.write(f"type {text}\n")
+        command = f"typedelay {interval * 1000}\ntype {text}\n"
+        self.dotool_process.stdin.write(command.encode('utf-8'))
         self.dotool_process.stdin.flush()
 
     def cleanup(self):
         """
-        Perform cleanup operations, such as terminating the dotool process.
+        Perform cleanup operations, such as terminating the dotool or ydotoold process.
         """
         if self.input_method == 'dotool':
             self._terminate_dotool()
+        elif self.input_method == 'ydotool':
+            self._terminate_ydotoold()
@@ -1,7 +1,13 @@
 from abc import ABC, abstractmethod
-from enum import Enum, auto
+from enum import Enum, IntEnum, auto
 from typing import Optional, Callable, Set
+import errno
+import queue
+import selectors
+import signal
+import threading
 import time
+from types import MappingProxyType
 
 from utils import ConfigManager
 
@@ -12,7 +18,7 @@ class InputEvent(Enum):
     MOUSE_PRESS = auto()
     MOUSE_RELEASE = auto()
 
-class KeyCode(Enum):
+class KeyCode(IntEnum):
     """Enum for key codes."""
     # Modifier keys
     CTRL_LEFT = auto()
@@ -130,6 +136,7 @@ class KeyCode(Enum):
     NUMPAD_SUBTRACT = 109
     NUMPAD_DECIMAL = 110
     NUMPAD_DIVIDE = 111
+    NUMPAD_ENTER = auto()
 
     # Additional special characters
     MINUS = auto()
@@ -200,6 +207,138 @@ class KeyCode(Enum):
     MOUSE_SIDE2 = auto()
     MOUSE_SIDE3 = auto()
 
+
+# evdev key event values: 0 = key up, 1 = key down, 2 = key hold (autorepeat).
+# Holds are left out: the key is already pressed, so repeats cannot change any chord state.
+_EVDEV_VALUE_TO_EVENT = {
+    0: InputEvent.KEY_RELEASE,
+    1: InputEvent.KEY_PRESS,
+}
+
+# pynput virtual key codes for the numpad (96-111)
+_PYNPUT_VK_NUMPAD = {
+    96: KeyCode.NUMPAD_0,
+    97: KeyCode.NUMPAD_1,
+    98: KeyCode.NUMPAD_2,
+    99: KeyCode.NUMPAD_3,
+    100: KeyCode.NUMPAD_4,
+    101: KeyCode.NUMPAD_5,
+    102: KeyCode.NUMPAD_6,
+    103: KeyCode.NUMPAD_7,
+    104: KeyCode.NUMPAD_8,
+    105: KeyCode.NUMPAD_9,
+    106: KeyCode.NUMPAD_MULTIPLY,
+    107: KeyCode.NUMPAD_ADD,
+    109: KeyCode.NUMPAD_SUBTRACT,
+    110: KeyCode.NUMPAD_DECIMAL,
+    111: KeyCode.NUMPAD_DIVIDE,
+}
+
+# pynput virtual key codes for the number row (48-57 are 0-9)
+_PYNPUT_VK_NUMBERS = {
+    48: KeyCode.ZERO,
+    49: KeyCode.ONE,
+    50: KeyCode.TWO,
+    51: KeyCode.THREE,
+    52: KeyCode.FOUR,
+    53: KeyCode.FIVE,
+    54: KeyCode.SIX,
+    55: KeyCode.SEVEN,
+    56: KeyCode.EIGHT,
+    57: KeyCode.NINE,
+}
+
+# Every pynput virtual key code we translate directly, checked before the pynput key map.
+# Virtual key codes fit in a byte, so a list indexed by vk avoids hashing on each keystroke.
+_PYNPUT_VK_TABLE: list[Optional[KeyCode]] = [None] * 256
+for _vk, _key_code in {**_PYNPUT_VK_NUMPAD, **_PYNPUT_VK_NUMBERS}.items():
+    _PYNPUT_VK_TABLE[_vk] = _key_code
+del _vk, _key_code
+
+# Printable characters pynput reports as KeyCode.from_char, as (char, KeyCode) pairs;
+# shifted letters are distinct pynput keys and map to the same KeyCode
+_PYNPUT_CHAR_SPEC = (
+    # Number keys
+    ('1', KeyCode.ONE),
+    ('2', KeyCode.TWO),
+    ('3', KeyCode.THREE),
+    ('4', KeyCode.FOUR),
+    ('5', KeyCode.FIVE),
+    ('6', KeyCode.SIX),
+    ('7', KeyCode.SEVEN),
+    ('8', KeyCode.EIGHT),
+    ('9', KeyCode.NINE),
+    ('0', KeyCode.ZERO),
+) + tuple(
+    # Letter keys, both cases
+    (char, KeyCode[char.upper()])
+    for char in 'abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ'
+) + (
+    # Additional special characters
+    ('-', KeyCode.MINUS),
+    ('=', KeyCode.EQUALS),
+    ('[', KeyCode.LEFT_BRACKET),
+    (']', KeyCode.RIGHT_BRACKET),
+    (';', KeyCode.SEMICOLON),
+    ("'", KeyCode.QUOTE),
+    ('`', KeyCode.BACKQUOTE),
+    ('\\', KeyCode.BACKSLASH),
+    (',', KeyCode.COMMA),
+    ('.', KeyCode.PERIOD),
+    ('/', KeyCode.SLASH),
+)
+
+
+# Configuration tokens for modifiers; the generic names accept either side
+_MODIFIER_MAP = {
+    'ctrl': frozenset({KeyCode.CTRL_LEFT, KeyCode.CTRL_RIGHT}),
+    'lctrl': KeyCode.CTRL_LEFT,
+    'rctrl': KeyCode.CTRL_RIGHT,
+    'alt': frozenset({KeyCode.ALT_LEFT, KeyCode.ALT_RIGHT}),
+    'lalt': KeyCode.ALT_LEFT,
+    'ralt': KeyCode.ALT_RIGHT,
+    'shift': frozenset({KeyCode.SHIFT_LEFT, KeyCode.SHIFT_RIGHT}),
+    'lshift': KeyCode.SHIFT_LEFT,
+    'rshift': KeyCode.SHIFT_RIGHT,
+    'meta': frozenset({KeyCode.META_LEFT, KeyCode.META_RIGHT}),
+    'lmeta': KeyCode.META_LEFT,
+    'rmeta': KeyCode.META_RIGHT,
+}
+
+# Configuration tokens for the number row
+_NUMBER_MAP = {
+    '0': KeyCode.ZERO, '1': KeyCode.ONE, '2': KeyCode.TWO,
+    '3': KeyCode.THREE, '4': KeyCode.FOUR, '5': KeyCode.FIVE,
+    '6': KeyCode.SIX, '7': KeyCode.SEVEN, '8': KeyCode.EIGHT,
+    '9': KeyCode.NINE
+}
+
+# Configuration tokens for the numpad
+_NUMPAD_MAP = {
+    'numpad0': KeyCode.NUMPAD_0,
+    'numpad1': KeyCode.NUMPAD_1,
+    'numpad2': KeyCode.NUMPAD_2,
+    'numpad3': KeyCode.NUMPAD_3,
+    'numpad4': KeyCode.NUMPAD_4,
+    'numpad5': KeyCode.NUMPAD_5,
+    'numpad6': KeyCode.NUMPAD_6,
+    'numpad7': KeyCode.NUMPAD_7,
+    'numpad8': KeyCode.NUMPAD_8,
+    'numpad9': KeyCode.NUMPAD_9,
+    'multiply': KeyCode.NUMPAD_MULTIPLY,
+    'add': KeyCode.NUMPAD_ADD,
+    'subtract': KeyCode.NUMPAD_SUBTRACT,
+    'decimal': KeyCode.NUMPAD_DECIMAL,
+    'divide': KeyCode.NUMPAD_DIVIDE,
+}
+
+# The token sets do not overlap, so a single lookup covers all three
+_KEY_TOKEN_MAP = {**_MODIFIER_MAP, **_NUMBER_MAP, **_NUMPAD_MAP}
+
+# Fallback lookup of any KeyCode by name, e.g. 'f1' or 'space'
+_KEYCODE_MEMBERS = KeyCode.__members__
+
+
 class InputBackend(ABC):
     """
     Abstract base class for input backends.
@@ -243,6 +382,14 @@ class InputBackend(ABC):
         """
         pass
 
+def _key_mask(keys) -> int:
+    """Return a bitmask with bit n set for every KeyCode n in keys."""
+    mask = 0
+    for key in keys:
+        mask |= 1 << key
+    return mask
+
+
 class KeyChord:
     """
     Represents a combination of keys that need to be pressed simultaneously.
@@ -251,58 +398,136 @@ class KeyChord:
     def __init__(self, keys: Set[KeyCode | frozenset[KeyCode]]):
         """Initialize the KeyChord."""
         self.keys = keys
-        self.pressed_keys: Set[KeyCode] = set()
+        # Keys are tracked as bitmasks (bit n set for KeyCode n): single keys must all be pressed,
+        # groups need any member pressed
+        self._singleton_mask = _key_mask(key for key in keys if not isinstance(key, frozenset))
+        self._group_masks = tuple(_key_mask(key) for key in keys if isinstance(key, frozenset))
+        self._pressed_mask = 0
+        self._active = self._compute_active()
         if keys:
             self.is_single_key = len(keys) == 1 and isinstance(next(iter(keys)), KeyCode)
             self.target_key = next(iter(keys)) if self.is_single_key else None
         else:
             self.is_single_key = False
             self.target_key = None
-        self.last_trigger_time = 0
-        self.debounce_delay = 0.3
+        self.debounce_delay = 300_000_000  # Nanoseconds
+        # time.monotonic_ns() of the last trigger, seeded so the first press is never debounced
+        self.last_trigger_time = -self.debounce_delay
         self.is_recording = False  # Track recording state
 
-    def update(self, key: KeyCode, event_type: InputEvent) -> bool:
-        """Update the state of pressed keys and check if the chord is active."""
-        current_time = time.time()
+    def update(self, key: KeyCode, event_type: InputEvent) -> tuple[bool, bool]:
+        """
+        Update the state of pressed keys.
+
+        Returns:
+            tuple[bool, bool]: Whether the chord was active before this event, and whether it is
+            active (triggered or still held) after it.
+        """
+        was_active = self._active
         
         if event_type == InputEvent.KEY_PRESS:
-            self.pressed_keys.add(key)
+            self._pressed_mask |= 1 << key
         else:
-            self.pressed_keys.discard(key)
+            self._pressed_mask &= ~(1 << key)
+        self._active = is_active = self._compute_active()
             
         # For single modifier keys, we want to trigger on press and maintain state until release
         if self.is_single_key and key == self.target_key:
             if event_type == InputEvent.KEY_PRESS:
+                current_time = time.monotonic_ns()
                 if current_time - self.last_trigger_time >= self.debounce_delay:
                     self.last_trigger_time = current_time
                     self.is_recording = True
-                    return True
+                    return was_active, True
             elif event_type == InputEvent.KEY_RELEASE:
                 self.is_recording = False
-                return False
-            return self.is_recording
+                return was_active, False
+            return was_active, self.is_recording
             
         # For key combinations
-        is_active = self.is_active()
-        if is_active and current_time - self.last_trigger_time >= self.debounce_delay:
-            self.last_trigger_time = current_time
-            self.is_recording = True
-            return True
-        elif not is_active and self.is_recording:
+        if is_active:
+            current_time = time.monotonic_ns()
+            if current_time - self.last_trigger_time >= self.debounce_delay:
+                self.last_trigger_time = current_time
+                self.is_recording = True
+                return was_active, True
+        elif self.is_recording:
             self.is_recording = False
+            return was_active, False
+        return was_active, self.is_recording
+
+    def _compute_active(self) -> bool:
+        """Check the pressed key mask against the chord requirements."""
+        pressed = self._pressed_mask
+        if pressed & self._singleton_mask != self._singleton_mask:
             return False
-        return self.is_recording
+        for group_mask in self._group_masks:
+            if not pressed & group_mask:
+                return False
+        return True
 
     def is_active(self) -> bool:
         """Check if all keys in the chord are currently pressed."""
-        for key in self.keys:
-            if isinstance(key, frozenset):
-                if not any(k in self.pressed_keys for k in key):
-                    return False
-            elif key not in self.pressed_keys:
-                return False
-        return True
+        return self._active
+
+    def reset(self):
+        """Forget all pressed keys, e.g. after synthetic key events were sent."""
+        self._pressed_mask = 0
+        self._active = self._compute_active()
+
+class SingleKeyTrigger:
+    """
+    Lightweight KeyChord replacement for activation keys made of a single key or modifier group,
+    e.g. 'ctrl' or 'f9'. It only tracks which of its keys are held.
+    """
+
+    def __init__(self, keys: Set[KeyCode | frozenset[KeyCode]]):
+        """Initialize the SingleKeyTrigger."""
+        self.keys = keys
+        key = next(iter(keys))
+        self._members_mask = _key_mask(key if isinstance(key, frozenset) else (key,))
+        self._pressed_mask = 0
+        self.debounce_delay = 300_000_000  # Nanoseconds
+        # time.monotonic_ns() of the last trigger, seeded so the first press is never debounced
+        self.last_trigger_time = -self.debounce_delay
+        self.is_recording = False
+
+    def update(self, key: KeyCode, event_type: InputEvent) -> tuple[bool, bool]:
+        """
+        Update the state of pressed keys.
+
+        Returns:
+            tuple[bool, bool]: Whether the trigger key was held before this event, and whether it is
+            active (triggered or still held) after it.
+        """
+        was_active = self._pressed_mask != 0
+        bit = 1 << key
+        if not bit & self._members_mask:
+            return was_active, self.is_recording
+
+        if event_type == InputEvent.KEY_PRESS:
+            self._pressed_mask |= bit
+        else:
+            self._pressed_mask &= ~bit
+
+        if self._pressed_mask:
+            current_time = time.monotonic_ns()
+            if current_time - self.last_trigger_time >= self.debounce_delay:
+                self.last_trigger_time = current_time
+                self.is_recording = True
+                return was_active, True
+            return was_active, self.is_recording
+
+        self.is_recording = False
+        return was_active, False
+
+    def is_active(self) -> bool:
+        """Check if the trigger key is currently pressed."""
+        return self._pressed_mask != 0
+
+    def reset(self):
+        """Forget all pressed keys, e.g. after synthetic key events were sent."""
+        self._pressed_mask = 0
 
 class KeyListener:
     """
@@ -320,14 +545,19 @@ class KeyListener:
         self.llm_key_chord = None
         self.llm_instruction_key_chord = None
         self.text_cleanup_chord = None
+        self._key_to_chords = {}
+        # Backends only enqueue events; a dispatcher thread runs chord updates and callbacks,
+        # so slow callbacks (recording, LLM cleanup) never hold up the input backend
+        self._event_queue = queue.SimpleQueue()
+        self._dispatch_thread: Optional[threading.Thread] = None
         self.callbacks = {
-            "on_activate": [],
-            "on_deactivate": [],
-            "on_activate_with_llm": [],
-            "on_deactivate_with_llm": [],
-            "on_activate_with_llm_instruction": [],
-            "on_deactivate_with_llm_instruction": [],
-            "on_text_cleanup": []
+            "on_activate": (),
+            "on_deactivate": (),
+            "on_activate_with_llm": (),
+            "on_deactivate_with_llm": (),
+            "on_activate_with_llm_instruction": (),
+            "on_deactivate_with_llm_instruction": (),
+            "on_text_cleanup": ()
         }
         self.load_activation_keys()
         self.initialize_backends()
@@ -393,6 +623,7 @@ class KeyListener:
                 )
                 return False
 
+            self._start_dispatch_thread()
             started = self.active_backend.start()
             self.is_running = getattr(self.active_backend, 'is_running', started is not False)
             if started is False:
@@ -422,6 +653,9 @@ class KeyListener:
             if stopped is False:
                 return False
 
+            # Events queued before the stop must not fire callbacks once the listener is started again
+            self._discard_queued_events()
+
             self.stop_count += 1
             ConfigManager.console_print(
                 f"Key listener stopped on {type(self.active_backend).__name__} (starts={self.start_count}, stops={self.stop_count}).",
@@ -442,10 +676,38 @@ class KeyListener:
         llm_instruction_keys = self.parse_key_combination(llm_instruction_key)
         text_cleanup_keys = self.parse_key_combination(text_cleanup_key)
         
-        self.main_key_chord = KeyChord(main_keys)
-        self.llm_key_chord = KeyChord(llm_keys)
-        self.llm_instruction_key_chord = KeyChord(llm_instruction_keys)
-        self.text_cleanup_chord = KeyChord(text_cleanup_keys)
+        self.main_key_chord = self._create_chord(main_keys)
+        self.llm_key_chord = self._create_chord(llm_keys)
+        self.llm_instruction_key_chord = self._create_chord(llm_instruction_keys)
+        self.text_cleanup_chord = self._create_chord(text_cleanup_keys)
+        self._build_chord_index()
+
+    @staticmethod
+    def _create_chord(keys: Set[KeyCode | frozenset[KeyCode]]) -> KeyChord | SingleKeyTrigger:
+        """Create the chord tracker for a parsed key combination."""
+        if len(keys) == 1:
+            return SingleKeyTrigger(keys)
+        return KeyChord(keys)
+
+    def _build_chord_index(self):
+        """Map every key that takes part in a chord to the chords it affects and their callback dispatchers."""
+        fire = {event: self._make_dispatcher(callbacks) for event, callbacks in self.callbacks.items()}
+        noop = self._make_dispatcher(())
+        chord_events = (
+            (self.main_key_chord, fire.get("on_activate", noop), fire.get("on_deactivate", noop)),
+            (self.llm_key_chord, fire.get("on_activate_with_llm", noop), fire.get("on_deactivate_with_llm", noop)),
+            (self.llm_instruction_key_chord, fire.get("on_activate_with_llm_instruction", noop),
+             fire.get("on_deactivate_with_llm_instruction", noop)),
+            (self.text_cleanup_chord, fire.get("on_text_cleanup", noop), None),
+        )
+        key_to_chords = {}
+        for entry in chord_events:
+            chord = entry[0]
+            for key in chord.keys:
+                members = key if isinstance(key, frozenset) else (key,)
+                for member in members:
+                    key_to_chords.setdefault(member, []).append(entry)
+        self._key_to_chords = {key: tuple(entries) for key, entries in key_to_chords.items()}
 
     def parse_key_combination(self, combination_string: str) -> Set[KeyCode | frozenset[KeyCode]]:
         """Parse a string representation of key combination into a set of KeyCodes."""
@@ -453,143 +715,300 @@ class KeyListener:
             return set()
         
         keys = set()
-        modifier_map = {
-            'ctrl': frozenset({KeyCode.CTRL_LEFT, KeyCode.CTRL_RIGHT}),
-            'lctrl': KeyCode.CTRL_LEFT,
-            'rctrl': KeyCode.CTRL_RIGHT,
-            'alt': frozenset({KeyCode.ALT_LEFT, KeyCode.ALT_RIGHT}),
-            'lalt': KeyCode.ALT_LEFT,
-            'ralt': KeyCode.ALT_RIGHT,
-            'shift': frozenset({KeyCode.SHIFT_LEFT, KeyCode.SHIFT_RIGHT}),
-            'lshift': KeyCode.SHIFT_LEFT,
-            'rshift': KeyCode.SHIFT_RIGHT,
-            'meta': frozenset({KeyCode.META_LEFT, KeyCode.META_RIGHT}),
-            'lmeta': KeyCode.META_LEFT,
-            'rmeta': KeyCode.META_RIGHT,
-        }
-
-        # Add number key mappings
-        number_map = {
-            '0': KeyCode.ZERO, '1': KeyCode.ONE, '2': KeyCode.TWO,
-            '3': KeyCode.THREE, '4': KeyCode.FOUR, '5': KeyCode.FIVE,
-            '6': KeyCode.SIX, '7': KeyCode.SEVEN, '8': KeyCode.EIGHT,
-            '9': KeyCode.NINE
-        }
-
-        # Add numpad key mappings
-        numpad_map = {
-            'numpad0': KeyCode.NUMPAD_0,
-            'numpad1': KeyCode.NUMPAD_1,
-            'numpad2': KeyCode.NUMPAD_2,
-            'numpad3': KeyCode.NUMPAD_3,
-            'numpad4': KeyCode.NUMPAD_4,
-            'numpad5': KeyCode.NUMPAD_5,
-            'numpad6': KeyCode.NUMPAD_6,
-            'numpad7': KeyCode.NUMPAD_7,
-            'numpad8': KeyCode.NUMPAD_8,
-            'numpad9': KeyCode.NUMPAD_9,
-            'multiply': KeyCode.NUMPAD_MULTIPLY,
-            'add': KeyCode.NUMPAD_ADD,
-            'subtract': KeyCode.NUMPAD_SUBTRACT,
-            'decimal': KeyCode.NUMPAD_DECIMAL,
-            'divide': KeyCode.NUMPAD_DIVIDE,
-        }
-
         for key in combination_string.lower().split('+'):
             key = key.strip()
-            if key in modifier_map:
-                keys.add(modifier_map[key])
-            elif key in number_map:
-                keys.add(number_map[key])
-            elif key in numpad_map:
-                keys.add(numpad_map[key])
-            else:
-                try:
-                    keycode = KeyCode[key.upper()]
-                    keys.add(keycode)
-                except KeyError:
-                    pass
+            mapped_key = _KEY_TOKEN_MAP.get(key)
+            if mapped_key is None:
+                mapped_key = _KEYCODE_MEMBERS.get(key.upper())
+            if mapped_key is not None:
+                keys.add(mapped_key)
         
         return keys
 
+    def _start_dispatch_thread(self):
+        """Start the event dispatcher thread if it is not running yet."""
+        if self._dispatch_thread and self._dispatch_thread.is_alive():
+            return
+        # The dispatcher outlives stop()/start() cycles: callbacks pause the listener from this
+        # very thread, so it cannot be joined there
+        self._dispatch_thread = threading.Thread(target=self._dispatch_events, name='KeyListenerDispatch', daemon=True)
+        self._dispatch_thread.start()
+
+    def _dispatch_events(self):
+        """Process queued input events one at a time."""
+        while True:
+            event = self._event_queue.get()
+            try:
+                self._process_event(event)
+            except Exception as e:
+                ConfigManager.console_print(f"Error handling input event {event}: {e}")
+
+    def _discard_queued_events(self):
+        """Drop the input events the dispatcher thread has not processed yet."""
+        while True:
+            try:
+                self._event_queue.get_nowait()
+            except queue.Empty:
+                return
+
     def on_input_event(self, event):
+        """Queue an input event from the active backend for the dispatcher thread."""
+        self._event_queue.put(event)
+
+    def _process_event(self, event):
         """Handle input events and trigger callbacks if either key chord becomes active or inactive."""
-        if not self.active_backend:
+        # The dispatcher thread outlives stop(), so an event it already took must not fire once stopped
+        if not self.active_backend or not self.is_running:
             return
 
         key, event_type = event
 
-        # Check main activation chord
-        if self.main_key_chord:
-            was_active = self.main_key_chord.is_active()
-            is_active = self.main_key_chord.update(key, event_type)
+        # Keys that are not part of any chord cannot change chord state
+        chords = self._key_to_chords.get(key)
+        if not chords:
+            return
+
+        for chord, fire_activate, fire_deactivate in chords:
+            was_active, is_active = chord.update(key, event_type)
 
             if not was_active and is_active:
-                self._trigger_callbacks("on_activate")
-            elif was_active and not is_active:
-                self._trigger_callbacks("on_deactivate")
-
-        # Check LLM cleanup chord
-        if self.llm_key_chord:
-            was_active_llm = self.llm_key_chord.is_active()
-            is_active_llm = self.llm_key_chord.update(key, event_type)
-
-            if not was_active_llm and is_active_llm:
-                self._trigger_callbacks("on_activate_with_llm")
-            elif was_active_llm and not is_active_llm:
-                self._trigger_callbacks("on_deactivate_with_llm")
-
-        # Check LLM instruction chord
-        if self.llm_instruction_key_chord:
-            was_active_llm_instruction = self.llm_instruction_key_chord.is_active()
-            is_active_llm_instruction = self.llm_instruction_key_chord.update(key, event_type)
-
-            if not was_active_llm_instruction and is_active_llm_instruction:
-                self._trigger_callbacks("on_activate_with_llm_instruction")
-            elif was_active_llm_instruction and not is_active_llm_instruction:
-                self._trigger_callbacks("on_deactivate_with_llm_instruction")
-
-        # Check text selection cleanup chord
-        if self.text_cleanup_chord:
-            was_active_text = self.text_cleanup_chord.is_active()
-            is_active_text = self.text_cleanup_chord.update(key, event_type)
-
-            if not was_active_text and is_active_text:
-                self._trigger_callbacks("on_text_cleanup")
+                fire_activate()
+            elif was_active and not is_active and fire_deactivate:
+                fire_deactivate()
 
     def add_callback(self, event: str, callback: Callable):
         """Add a callback function for a specific event."""
         if event in self.callbacks:
-            self.callbacks[event].append(callback)
+            # Callbacks are stored as tuples since they are registered once and iterated on every trigger
+            self.callbacks[event] += (callback,)
+            # Rebuild the chord index so it holds dispatchers for the new callback set
+            self._build_chord_index()
+
+    @staticmethod
+    def _make_dispatcher(callbacks: tuple) -> Callable[[], None]:
+        """Return a function that calls every callback in order."""
+        if len(callbacks) == 1:
+            return callbacks[0]
 
-    def _trigger_callbacks(self, event: str):
-        """Trigger all callbacks associated with a specific event."""
-        for callback in self.callbacks.get(event, []):
-            callback()
+        def dispatch():
+            for callback in callbacks:
+                callback()
+
+        return dispatch
 
     def update_activation_keys(self):
         """Update activation keys from the current configuration."""
         self.load_activation_keys()
 
+# evdev key names and the KeyCode each maps to. Keys that several KeyCodes could describe
+# (mute, volume, play/pause, next/previous track, stop) appear once, under the name the
+# pynput backend uses as well.
+_EVDEV_KEY_SPEC = (
+    # Modifier keys
+    ("KEY_LEFTCTRL", KeyCode.CTRL_LEFT),
+    ("KEY_RIGHTCTRL", KeyCode.CTRL_RIGHT),
+    ("KEY_LEFTSHIFT", KeyCode.SHIFT_LEFT),
+    ("KEY_RIGHTSHIFT", KeyCode.SHIFT_RIGHT),
+    ("KEY_LEFTALT", KeyCode.ALT_LEFT),
+    ("KEY_RIGHTALT", KeyCode.ALT_RIGHT),
+    ("KEY_LEFTMETA", KeyCode.META_LEFT),
+    ("KEY_RIGHTMETA", KeyCode.META_RIGHT),
+
+    # Function keys
+    ("KEY_F1", KeyCode.F1),
+    ("KEY_F2", KeyCode.F2),
+    ("KEY_F3", KeyCode.F3),
+    ("KEY_F4", KeyCode.F4),
+    ("KEY_F5", KeyCode.F5),
+    ("KEY_F6", KeyCode.F6),
+    ("KEY_F7", KeyCode.F7),
+    ("KEY_F8", KeyCode.F8),
+    ("KEY_F9", KeyCode.F9),
+    ("KEY_F10", KeyCode.F10),
+    ("KEY_F11", KeyCode.F11),
+    ("KEY_F12", KeyCode.F12),
+
+    # Number keys
+    ("KEY_1", KeyCode.ONE),
+    ("KEY_2", KeyCode.TWO),
+    ("KEY_3", KeyCode.THREE),
+    ("KEY_4", KeyCode.FOUR),
+    ("KEY_5", KeyCode.FIVE),
+    ("KEY_6", KeyCode.SIX),
+    ("KEY_7", KeyCode.SEVEN),
+    ("KEY_8", KeyCode.EIGHT),
+    ("KEY_9", KeyCode.NINE),
+    ("KEY_0", KeyCode.ZERO),
+
+    # Letter keys
+    ("KEY_A", KeyCode.A),
+    ("KEY_B", KeyCode.B),
+    ("KEY_C", KeyCode.C),
+    ("KEY_D", KeyCode.D),
+    ("KEY_E", KeyCode.E),
+    ("KEY_F", KeyCode.F),
+    ("KEY_G", KeyCode.G),
+    ("KEY_H", KeyCode.H),
+    ("KEY_I", KeyCode.I),
+    ("KEY_J", KeyCode.J),
+    ("KEY_K", KeyCode.K),
+    ("KEY_L", KeyCode.L),
+    ("KEY_M", KeyCode.M),
+    ("KEY_N", KeyCode.N),
+    ("KEY_O", KeyCode.O),
+    ("KEY_P", KeyCode.P),
+    ("KEY_Q", KeyCode.Q),
+    ("KEY_R", KeyCode.R),
+    ("KEY_S", KeyCode.S),
+    ("KEY_T", KeyCode.T),
+    ("KEY_U", KeyCode.U),
+    ("KEY_V", KeyCode.V),
+    ("KEY_W", KeyCode.W),
+    ("KEY_X", KeyCode.X),
+    ("KEY_Y", KeyCode.Y),
+    ("KEY_Z", KeyCode.Z),
+
+    # Special keys
+    ("KEY_SPACE", KeyCode.SPACE),
+    ("KEY_ENTER", KeyCode.ENTER),
+    ("KEY_TAB", KeyCode.TAB),
+    ("KEY_BACKSPACE", KeyCode.BACKSPACE),
+    ("KEY_ESC", KeyCode.ESC),
+    ("KEY_INSERT", KeyCode.INSERT),
+    ("KEY_DELETE", KeyCode.DELETE),
+    ("KEY_HOME", KeyCode.HOME),
+    ("KEY_END", KeyCode.END),
+    ("KEY_PAGEUP", KeyCode.PAGE_UP),
+    ("KEY_PAGEDOWN", KeyCode.PAGE_DOWN),
+    ("KEY_CAPSLOCK", KeyCode.CAPS_LOCK),
+    ("KEY_NUMLOCK", KeyCode.NUM_LOCK),
+    ("KEY_SCROLLLOCK", KeyCode.SCROLL_LOCK),
+    ("KEY_PAUSE", KeyCode.PAUSE),
+    ("KEY_SYSRQ", KeyCode.PRINT_SCREEN),
+
+    # Arrow keys
+    ("KEY_UP", KeyCode.UP),
+    ("KEY_DOWN", KeyCode.DOWN),
+    ("KEY_LEFT", KeyCode.LEFT),
+    ("KEY_RIGHT", KeyCode.RIGHT),
+
+    # Numpad keys
+    ("KEY_KP0", KeyCode.NUMPAD_0),
+    ("KEY_KP1", KeyCode.NUMPAD_1),
+    ("KEY_KP2", KeyCode.NUMPAD_2),
+    ("KEY_KP3", KeyCode.NUMPAD_3),
+    ("KEY_KP4", KeyCode.NUMPAD_4),
+    ("KEY_KP5", KeyCode.NUMPAD_5),
+    ("KEY_KP6", KeyCode.NUMPAD_6),
+    ("KEY_KP7", KeyCode.NUMPAD_7),
+    ("KEY_KP8", KeyCode.NUMPAD_8),
+    ("KEY_KP9", KeyCode.NUMPAD_9),
+    ("KEY_KPPLUS", KeyCode.NUMPAD_ADD),
+    ("KEY_KPMINUS", KeyCode.NUMPAD_SUBTRACT),
+    ("KEY_KPASTERISK", KeyCode.NUMPAD_MULTIPLY),
+    ("KEY_KPSLASH", KeyCode.NUMPAD_DIVIDE),
+    ("KEY_KPDOT", KeyCode.NUMPAD_DECIMAL),
+    ("KEY_KPENTER", KeyCode.NUMPAD_ENTER),
+
+    # Additional special characters
+    ("KEY_MINUS", KeyCode.MINUS),
+    ("KEY_EQUAL", KeyCode.EQUALS),
+    ("KEY_LEFTBRACE", KeyCode.LEFT_BRACKET),
+    ("KEY_RIGHTBRACE", KeyCode.RIGHT_BRACKET),
+    ("KEY_SEMICOLON", KeyCode.SEMICOLON),
+    ("KEY_APOSTROPHE", KeyCode.QUOTE),
+    ("KEY_GRAVE", KeyCode.BACKQUOTE),
+    ("KEY_BACKSLASH", KeyCode.BACKSLASH),
+    ("KEY_COMMA", KeyCode.COMMA),
+    ("KEY_DOT", KeyCode.PERIOD),
+    ("KEY_SLASH", KeyCode.SLASH),
+
+    # Additional function keys (if needed)
+    ("KEY_F13", KeyCode.F13),
+    ("KEY_F14", KeyCode.F14),
+    ("KEY_F15", KeyCode.F15),
+    ("KEY_F16", KeyCode.F16),
+    ("KEY_F17", KeyCode.F17),
+    ("KEY_F18", KeyCode.F18),
+    ("KEY_F19", KeyCode.F19),
+    ("KEY_F20", KeyCode.F20),
+    ("KEY_F21", KeyCode.F21),
+    ("KEY_F22", KeyCode.F22),
+    ("KEY_F23", KeyCode.F23),
+    ("KEY_F24", KeyCode.F24),
+
+    # Additional Media and Special Function Keys
+    ("KEY_PLAYPAUSE", KeyCode.MEDIA_PLAY_PAUSE),
+    ("KEY_PREVIOUSSONG", KeyCode.MEDIA_PREVIOUS),
+    ("KEY_NEXTSONG", KeyCode.MEDIA_NEXT),
+    ("KEY_REWIND", KeyCode.MEDIA_REWIND),
+    ("KEY_FASTFORWARD", KeyCode.MEDIA_FAST_FORWARD),
+    ("KEY_MUTE", KeyCode.AUDIO_MUTE),
+    ("KEY_VOLUMEUP", KeyCode.AUDIO_VOLUME_UP),
+    ("KEY_VOLUMEDOWN", KeyCode.AUDIO_VOLUME_DOWN),
+    ("KEY_MEDIA", KeyCode.MEDIA_SELECT),
+    ("KEY_WWW", KeyCode.WWW),
+    ("KEY_MAIL", KeyCode.MAIL),
+    ("KEY_CALC", KeyCode.CALCULATOR),
+    ("KEY_COMPUTER", KeyCode.COMPUTER),
+    ("KEY_SEARCH", KeyCode.APP_SEARCH),
+    ("KEY_HOMEPAGE", KeyCode.APP_HOME),
+    ("KEY_BACK", KeyCode.APP_BACK),
+    ("KEY_FORWARD", KeyCode.APP_FORWARD),
+    ("KEY_STOP", KeyCode.APP_STOP),
+    ("KEY_REFRESH", KeyCode.APP_REFRESH),
+    ("KEY_BOOKMARKS", KeyCode.APP_BOOKMARKS),
+    ("KEY_BRIGHTNESSDOWN", KeyCode.BRIGHTNESS_DOWN),
+    ("KEY_BRIGHTNESSUP", KeyCode.BRIGHTNESS_UP),
+    ("KEY_DISPLAYTOGGLE", KeyCode.DISPLAY_SWITCH),
+    ("KEY_KBDILLUMTOGGLE", KeyCode.KEYBOARD_ILLUMINATION_TOGGLE),
+    ("KEY_KBDILLUMDOWN", KeyCode.KEYBOARD_ILLUMINATION_DOWN),
+    ("KEY_KBDILLUMUP", KeyCode.KEYBOARD_ILLUMINATION_UP),
+    ("KEY_EJECTCD", KeyCode.EJECT),
+    ("KEY_SLEEP", KeyCode.SLEEP),
+    ("KEY_WAKEUP", KeyCode.WAKE),
+    ("KEY_COMPOSE", KeyCode.EMOJI),
+    ("KEY_MENU", KeyCode.MENU),
+    ("KEY_CLEAR", KeyCode.CLEAR),
+    ("KEY_SCREENLOCK", KeyCode.LOCK),
+
+    # Mouse Buttons
+    ("BTN_LEFT", KeyCode.MOUSE_LEFT),
+    ("BTN_RIGHT", KeyCode.MOUSE_RIGHT),
+    ("BTN_MIDDLE", KeyCode.MOUSE_MIDDLE),
+    ("BTN_SIDE", KeyCode.MOUSE_BACK),
+    ("BTN_EXTRA", KeyCode.MOUSE_FORWARD),
+    ("BTN_FORWARD", KeyCode.MOUSE_SIDE1),
+    ("BTN_BACK", KeyCode.MOUSE_SIDE2),
+    ("BTN_TASK", KeyCode.MOUSE_SIDE3),
+)
+
+
 class EvdevBackend(InputBackend):
     """
     Backend for handling input events using the evdev library.
     """
 
+    _KEY_MAP: Optional[dict] = None
+    _EV_KEY: Optional[int] = None
+    _available: Optional[bool] = None
+
     @classmethod
     def is_available(cls) -> bool:
         """Check if the evdev library is available."""
-        try:
-            import evdev
-            return True
-        except ImportError:
-            return False
+        if cls._available is None:
+            try:
+                import evdev
+                cls._available = True
+            except ImportError:
+                cls._available = False
+        return cls._available
 
     def __init__(self):
         """Initialize the EvdevBackend."""
-        self.devices: List[evdev.InputDevice] = []
+        self.devices: dict[int, evdev.InputDevice] = {}
+        self.selector: Optional[selectors.BaseSelector] = None
         self.key_map: Optional[dict] = None
-        self.evdev = None
         self.thread: Optional[threading.Thread] = None
         self.stop_event: Optional[threading.Event] = None
         self.is_running = False
@@ -601,12 +1020,13 @@ class EvdevBackend(InputBackend):
             return False
 
         import evdev
-        import threading
-        self.evdev = evdev
-        self.key_map = self._create_key_map()
+        self.key_map = type(self)._get_key_map()
 
-        # Initialize input devices
-        self.devices = [evdev.InputDevice(path) for path in evdev.list_devices()]
+        # Initialize input devices and register them once with a persistent selector
+        self.devices = {device.fd: device for device in map(evdev.InputDevice, evdev.list_devices())}
+        self.selector = selectors.DefaultSelector()
+        for device in self.devices.values():
+            self.selector.register(device, selectors.EVENT_READ, device)
         self.stop_event = threading.Event()
         self._setup_signal_handler()
         self._start_listening()
@@ -616,8 +1036,6 @@ class EvdevBackend(InputBackend):
 
     def _setup_signal_handler(self):
         """Set up signal handlers for graceful shutdown."""
-        import signal
-
         def signal_handler(signum, frame):
             print("Received termination signal. Stopping evdev backend...")
             self.stop()
@@ -639,13 +1057,17 @@ class EvdevBackend(InputBackend):
             if self.thread.is_alive():
                 print("Thread did not terminate in time. Forcing exit.")
 
+        if self.selector:
+            self.selector.close()
+            self.selector = None
+
         # Close all devices
-        for device in self.devices:
+        for device in self.devices.values():
             try:
                 device.close()
             except Exception:
                 pass  # Ignore errors when closing devices
-        self.devices = []
+        self.devices = {}
         self.thread = None
         self.stop_event = None
         self.is_running = False
@@ -654,319 +1076,78 @@ class EvdevBackend(InputBackend):
 
     def _start_listening(self):
         """Start the listening thread."""
-        import threading
         self.thread = threading.Thread(target=self._listen_loop)
         self.thread.start()
 
     def _listen_loop(self):
         """Main loop for listening to input events."""
-        import select
         while not self.stop_event.is_set():
             try:
                 # Wait for input events with a timeout of 0.1 seconds
-                r, _, _ = select.select(self.devices, [], [], 0.1)
-                for device in r:
-                    self._read_device_events(device)
+                ready = self.selector.select(timeout=0.1)
+                # Drain ready devices one batch at a time, re-polling without blocking
+                # until none has pending events, so a device streaming events (e.g. mouse
+                # motion) cannot starve the keyboard
+                while ready and not self.stop_event.is_set():
+                    for key, _ in ready:
+                        self._read_device_events(key.data)
+                    ready = self.selector.select(timeout=0)
             except Exception as e:
                 if self.stop_event.is_set():
                     break
                 print(f"Unexpected error in _listen_loop: {e}")
 
     def _read_device_events(self, device):
-        """Read and process events from a single device."""
+        """Read and process one batch of pending events from a single device."""
         try:
             for event in device.read():
-                if event.type == self.evdev.ecodes.EV_KEY:
+                if event.type == self._EV_KEY:
                     self._handle_input_event(event)
         except Exception as e:
             self._handle_device_error(device, e)
 
     def _handle_device_error(self, device, error):
         """Handle errors that occur when reading from a device."""
-        import errno
         if isinstance(error, BlockingIOError) and error.errno == errno.EAGAIN:
             return  # Non-blocking IO is expected, just continue
         if isinstance(error, OSError) and (error.errno == errno.EBADF or error.errno == errno.ENODEV):
             print(f"Device {device.path} is no longer available. Removing it.")
-            self.devices.remove(device)
+            self.devices.pop(device.fd, None)
+            self.selector.unregister(device)
         else:
             print(f"Unexpected error reading device: {error}")
 
     def _handle_input_event(self, event):
         """Process a single input event."""
-        key_code, event_type = self._translate_key_event(event)
-        if key_code is not None and event_type is not None:
-            self.on_input_event((key_code, event_type))
-
-    def _translate_key_event(self, native_event) -> Optional[tuple[KeyCode, InputEvent]]:
-        """Translate a pynput event to our internal event representation."""
-        # For evdev backend
-        if hasattr(native_event, 'keystate'):
-            key_event = native_event
-            if key_event.keystate in [key_event.key_down, key_event.key_hold]:
-                event_type = InputEvent.KEY_PRESS
-            elif key_event.keystate == key_event.key_up:
-                event_type = InputEvent.KEY_RELEASE
-            else:
-                return None
-            
-            key_code = self.key_map.get(key_event.scancode)
-            if key_code is None:
-                return None
-            
-            return key_code, event_type
+        translated_event = self._translate_evdev_event(event)
+        if translated_event:
+            self.on_input_event(translated_event)
 
-        # For pynput backend
-        pynput_key, is_press = native_event
-        
-        # Handle character keys
-        if isinstance(pynput_key, self.keyboard.KeyCode):
-            # Try to map from virtual key code first
-            if hasattr(pynput_key, 'vk') and pynput_key.vk is not None:
-                vk = pynput_key.vk
-                
-                # Map numpad virtual key codes (96-111)
-                if 96 <= vk <= 111:
-                    numpad_map = {
-                        96: KeyCode.NUMPAD_0,
-                        97: KeyCode.NUMPAD_1,
-                        98: KeyCode.NUMPAD_2,
-                        99: KeyCode.NUMPAD_3,
-                        100: KeyCode.NUMPAD_4,
-                        101: KeyCode.NUMPAD_5,
-                        102: KeyCode.NUMPAD_6,
-                        103: KeyCode.NUMPAD_7,
-                        104: KeyCode.NUMPAD_8,
-                        105: KeyCode.NUMPAD_9,
-                        106: KeyCode.NUMPAD_MULTIPLY,
-                        107: KeyCode.NUMPAD_ADD,
-                        109: KeyCode.NUMPAD_SUBTRACT,
-                        110: KeyCode.NUMPAD_DECIMAL,
-                        111: KeyCode.NUMPAD_DIVIDE
-                    }
-                    if vk in numpad_map:
-                        key_code = numpad_map[vk]
-                        event_type = InputEvent.KEY_PRESS if is_press else InputEvent.KEY_RELEASE
-                        return key_code, event_type
-                
-                # Try mapping from key_map
-                mapped_key = self.key_map.get(self.keyboard.KeyCode.from_vk(vk))
-                if mapped_key:
-                    event_type = InputEvent.KEY_PRESS if is_press else InputEvent.KEY_RELEASE
-                    return mapped_key, event_type
-                
-                # Map number virtual key codes (48-57 are 0-9)
-                if 48 <= vk <= 57:
-                    number_map = {
-                        48: 'ZERO', 49: 'ONE', 50: 'TWO', 51: 'THREE', 52: 'FOUR',
-                        53: 'FIVE', 54: 'SIX', 55: 'SEVEN', 56: 'EIGHT', 57: 'NINE'
-                    }
-                    try:
-                        key_code = KeyCode[number_map[vk]]
-                        event_type = InputEvent.KEY_PRESS if is_press else InputEvent.KEY_RELEASE
-                        return key_code, event_type
-                    except KeyError:
-                        pass
-        
-        # Fall back to regular key mapping
-        key_code = self.key_map.get(pynput_key)
-        
+    def _translate_evdev_event(self, event) -> Optional[tuple[KeyCode, InputEvent]]:
+        """Translate an evdev key event to our internal event representation."""
+        event_type = _EVDEV_VALUE_TO_EVENT.get(event.value)
+        if event_type is None:
+            return None
+
+        key_code = self.key_map.get(event.code)
         if key_code is None:
             return None
-        
-        event_type = InputEvent.KEY_PRESS if is_press else InputEvent.KEY_RELEASE
+
         return key_code, event_type
 
-    def _create_key_map(self):
+    @classmethod
+    def _get_key_map(cls) -> dict:
+        """Return the evdev key code mapping, building it on first use."""
+        if cls._KEY_MAP is None:
+            from evdev import ecodes
+            cls._EV_KEY = ecodes.EV_KEY
+            cls._KEY_MAP = cls._create_key_map(ecodes)
+        return cls._KEY_MAP
+
+    @staticmethod
+    def _create_key_map(ecodes) -> dict:
         """Create a mapping from evdev key codes to our internal KeyCode enum."""
-        return {
-            # Modifier keys
-            self.evdev.ecodes.KEY_LEFTCTRL: KeyCode.CTRL_LEFT,
-            self.evdev.ecodes.KEY_RIGHTCTRL: KeyCode.CTRL_RIGHT,
-            self.evdev.ecodes.KEY_LEFTSHIFT: KeyCode.SHIFT_LEFT,
-            self.evdev.ecodes.KEY_RIGHTSHIFT: KeyCode.SHIFT_RIGHT,
-            self.evdev.ecodes.KEY_LEFTALT: KeyCode.ALT_LEFT,
-            self.evdev.ecodes.KEY_RIGHTALT: KeyCode.ALT_RIGHT,
-            self.evdev.ecodes.KEY_LEFTMETA: KeyCode.META_LEFT,
-            self.evdev.ecodes.KEY_RIGHTMETA: KeyCode.META_RIGHT,
-
-            # Function keys
-            self.evdev.ecodes.KEY_F1: KeyCode.F1,
-            self.evdev.ecodes.KEY_F2: KeyCode.F2,
-            self.evdev.ecodes.KEY_F3: KeyCode.F3,
-            self.evdev.ecodes.KEY_F4: KeyCode.F4,
-            self.evdev.ecodes.KEY_F5: KeyCode.F5,
-            self.evdev.ecodes.KEY_F6: KeyCode.F6,
-            self.evdev.ecodes.KEY_F7: KeyCode.F7,
-            self.evdev.ecodes.KEY_F8: KeyCode.F8,
-            self.evdev.ecodes.KEY_F9: KeyCode.F9,
-            self.evdev.ecodes.KEY_F10: KeyCode.F10,
-            self.evdev.ecodes.KEY_F11: KeyCode.F11,
-            self.evdev.ecodes.KEY_F12: KeyCode.F12,
-
-            # Number keys
-            self.evdev.ecodes.KEY_1: KeyCode.ONE,
-            self.evdev.ecodes.KEY_2: KeyCode.TWO,
-            self.evdev.ecodes.KEY_3: KeyCode.THREE,
-            self.evdev.ecodes.KEY_4: KeyCode.FOUR,
-            self.evdev.ecodes.KEY_5: KeyCode.FIVE,
-            self.evdev.ecodes.KEY_6: KeyCode.SIX,
-            self.evdev.ecodes.KEY_7: KeyCode.SEVEN,
-            self.evdev.ecodes.KEY_8: KeyCode.EIGHT,
-            self.evdev.ecodes.KEY_9: KeyCode.NINE,
-            self.evdev.ecodes.KEY_0: KeyCode.ZERO,
-
-            # Letter keys
-            self.evdev.ecodes.KEY_A: KeyCode.A,
-            self.evdev.ecodes.KEY_B: KeyCode.B,
-            self.evdev.ecodes.KEY_C: KeyCode.C,
-            self.evdev.ecodes.KEY_D: KeyCode.D,
-            self.evdev.ecodes.KEY_E: KeyCode.E,
-            self.evdev.ecodes.KEY_F: KeyCode.F,
-            self.evdev.ecodes.KEY_G: KeyCode.G,
-            self.evdev.ecodes.KEY_H: KeyCode.H,
-            self.evdev.ecodes.KEY_I: KeyCode.I,
-            self.evdev.ecodes.KEY_J: KeyCode.J,
-            self.evdev.ecodes.KEY_K: KeyCode.K,
-            self.evdev.ecodes.KEY_L: KeyCode.L,
-            self.evdev.ecodes.KEY_M: KeyCode.M,
-            self.evdev.ecodes.KEY_N: KeyCode.N,
-            self.evdev.ecodes.KEY_O: KeyCode.O,
-            self.evdev.ecodes.KEY_P: KeyCode.P,
-            self.evdev.ecodes.KEY_Q: KeyCode.Q,
-            self.evdev.ecodes.KEY_R: KeyCode.R,
-            self.evdev.ecodes.KEY_S: KeyCode.S,
-            self.evdev.ecodes.KEY_T: KeyCode.T,
-            self.evdev.ecodes.KEY_U: KeyCode.U,
-            self.evdev.ecodes.KEY_V: KeyCode.V,
-            self.evdev.ecodes.KEY_W: KeyCode.W,
-            self.evdev.ecodes.KEY_X: KeyCode.X,
-            self.evdev.ecodes.KEY_Y: KeyCode.Y,
-            self.evdev.ecodes.KEY_Z: KeyCode.Z,
-
-            # Special keys
-            self.evdev.ecodes.KEY_SPACE: KeyCode.SPACE,
-            self.evdev.ecodes.KEY_ENTER: KeyCode.ENTER,
-            self.evdev.ecodes.KEY_TAB: KeyCode.TAB,
-            self.evdev.ecodes.KEY_BACKSPACE: KeyCode.BACKSPACE,
-            self.evdev.ecodes.KEY_ESC: KeyCode.ESC,
-            self.evdev.ecodes.KEY_INSERT: KeyCode.INSERT,
-            self.evdev.ecodes.KEY_DELETE: KeyCode.DELETE,
-            self.evdev.ecodes.KEY_HOME: KeyCode.HOME,
-            self.evdev.ecodes.KEY_END: KeyCode.END,
-            self.evdev.ecodes.KEY_PAGEUP: KeyCode.PAGE_UP,
-            self.evdev.ecodes.KEY_PAGEDOWN: KeyCode.PAGE_DOWN,
-            self.evdev.ecodes.KEY_CAPSLOCK: KeyCode.CAPS_LOCK,
-            self.evdev.ecodes.KEY_NUMLOCK: KeyCode.NUM_LOCK,
-            self.evdev.ecodes.KEY_SCROLLLOCK: KeyCode.SCROLL_LOCK,
-            self.evdev.ecodes.KEY_PAUSE: KeyCode.PAUSE,
-            self.evdev.ecodes.KEY_SYSRQ: KeyCode.PRINT_SCREEN,
-
-            # Arrow keys
-            self.evdev.ecodes.KEY_UP: KeyCode.UP,
-            self.evdev.ecodes.KEY_DOWN: KeyCode.DOWN,
-            self.evdev.ecodes.KEY_LEFT: KeyCode.LEFT,
-            self.evdev.ecodes.KEY_RIGHT: KeyCode.RIGHT,
-
-            # Numpad keys
-            self.evdev.ecodes.KEY_KP0: KeyCode.NUMPAD_0,
-            self.evdev.ecodes.KEY_KP1: KeyCode.NUMPAD_1,
-            self.evdev.ecodes.KEY_KP2: KeyCode.NUMPAD_2,
-            self.evdev.ecodes.KEY_KP3: KeyCode.NUMPAD_3,
-            self.evdev.ecodes.KEY_KP4: KeyCode.NUMPAD_4,
-            self.evdev.ecodes.KEY_KP5: KeyCode.NUMPAD_5,
-            self.evdev.ecodes.KEY_KP6: KeyCode.NUMPAD_6,
-            self.evdev.ecodes.KEY_KP7: KeyCode.NUMPAD_7,
-            self.evdev.ecodes.KEY_KP8: KeyCode.NUMPAD_8,
-            self.evdev.ecodes.KEY_KP9: KeyCode.NUMPAD_9,
-            self.evdev.ecodes.KEY_KPPLUS: KeyCode.NUMPAD_ADD,
-            self.evdev.ecodes.KEY_KPMINUS: KeyCode.NUMPAD_SUBTRACT,
-            self.evdev.ecodes.KEY_KPASTERISK: KeyCode.NUMPAD_MULTIPLY,
-            self.evdev.ecodes.KEY_KPSLASH: KeyCode.NUMPAD_DIVIDE,
-            self.evdev.ecodes.KEY_KPDOT: KeyCode.NUMPAD_DECIMAL,
-            self.evdev.ecodes.KEY_KPENTER: KeyCode.NUMPAD_ENTER,
-
-            # Additional special characters
-            self.evdev.ecodes.KEY_MINUS: KeyCode.MINUS,
-            self.evdev.ecodes.KEY_EQUAL: KeyCode.EQUALS,
-            self.evdev.ecodes.KEY_LEFTBRACE: KeyCode.LEFT_BRACKET,
-            self.evdev.ecodes.KEY_RIGHTBRACE: KeyCode.RIGHT_BRACKET,
-            self.evdev.ecodes.KEY_SEMICOLON: KeyCode.SEMICOLON,
-            self.evdev.ecodes.KEY_APOSTROPHE: KeyCode.QUOTE,
-            self.evdev.ecodes.KEY_GRAVE: KeyCode.BACKQUOTE,
-            self.evdev.ecodes.KEY_BACKSLASH: KeyCode.BACKSLASH,
-            self.evdev.ecodes.KEY_COMMA: KeyCode.COMMA,
-            self.evdev.ecodes.KEY_DOT: KeyCode.PERIOD,
-            self.evdev.ecodes.KEY_SLASH: KeyCode.SLASH,
-
-            # Media keys
-            self.evdev.ecodes.KEY_MUTE: KeyCode.MUTE,
-            self.evdev.ecodes.KEY_VOLUMEDOWN: KeyCode.VOLUME_DOWN,
-            self.evdev.ecodes.KEY_VOLUMEUP: KeyCode.VOLUME_UP,
-            self.evdev.ecodes.KEY_PLAYPAUSE: KeyCode.PLAY_PAUSE,
-            self.evdev.ecodes.KEY_NEXTSONG: KeyCode.NEXT_TRACK,
-            self.evdev.ecodes.KEY_PREVIOUSSONG: KeyCode.PREV_TRACK,
-
-            # Additional function keys (if needed)
-            self.evdev.ecodes.KEY_F13: KeyCode.F13,
-            self.evdev.ecodes.KEY_F14: KeyCode.F14,
-            self.evdev.ecodes.KEY_F15: KeyCode.F15,
-            self.evdev.ecodes.KEY_F16: KeyCode.F16,
-            self.evdev.ecodes.KEY_F17: KeyCode.F17,
-            self.evdev.ecodes.KEY_F18: KeyCode.F18,
-            self.evdev.ecodes.KEY_F19: KeyCode.F19,
-            self.evdev.ecodes.KEY_F20: KeyCode.F20,
-            self.evdev.ecodes.KEY_F21: KeyCode.F21,
-            self.evdev.ecodes.KEY_F22: KeyCode.F22,
-            self.evdev.ecodes.KEY_F23: KeyCode.F23,
-            self.evdev.ecodes.KEY_F24: KeyCode.F24,
-
-            # Additional Media and Special Function Keys
-            self.evdev.ecodes.KEY_PLAYPAUSE: KeyCode.MEDIA_PLAY_PAUSE,
-            self.evdev.ecodes.KEY_STOP: KeyCode.MEDIA_STOP,
-            self.evdev.ecodes.KEY_PREVIOUSSONG: KeyCode.MEDIA_PREVIOUS,
-            self.evdev.ecodes.KEY_NEXTSONG: KeyCode.MEDIA_NEXT,
-            self.evdev.ecodes.KEY_REWIND: KeyCode.MEDIA_REWIND,
-            self.evdev.ecodes.KEY_FASTFORWARD: KeyCode.MEDIA_FAST_FORWARD,
-            self.evdev.ecodes.KEY_MUTE: KeyCode.AUDIO_MUTE,
-            self.evdev.ecodes.KEY_VOLUMEUP: KeyCode.AUDIO_VOLUME_UP,
-            self.evdev.ecodes.KEY_VOLUMEDOWN: KeyCode.AUDIO_VOLUME_DOWN,
-            self.evdev.ecodes.KEY_MEDIA: KeyCode.MEDIA_SELECT,
-            self.evdev.ecodes.KEY_WWW: KeyCode.WWW,
-            self.evdev.ecodes.KEY_MAIL: KeyCode.MAIL,
-            self.evdev.ecodes.KEY_CALC: KeyCode.CALCULATOR,
-            self.evdev.ecodes.KEY_COMPUTER: KeyCode.COMPUTER,
-            self.evdev.ecodes.KEY_SEARCH: KeyCode.APP_SEARCH,
-            self.evdev.ecodes.KEY_HOMEPAGE: KeyCode.APP_HOME,
-            self.evdev.ecodes.KEY_BACK: KeyCode.APP_BACK,
-            self.evdev.ecodes.KEY_FORWARD: KeyCode.APP_FORWARD,
-            self.evdev.ecodes.KEY_STOP: KeyCode.APP_STOP,
-            self.evdev.ecodes.KEY_REFRESH: KeyCode.APP_REFRESH,
-            self.evdev.ecodes.KEY_BOOKMARKS: KeyCode.APP_BOOKMARKS,
-            self.evdev.ecodes.KEY_BRIGHTNESSDOWN: KeyCode.BRIGHTNESS_DOWN,
-            self.evdev.ecodes.KEY_BRIGHTNESSUP: KeyCode.BRIGHTNESS_UP,
-            self.evdev.ecodes.KEY_DISPLAYTOGGLE: KeyCode.DISPLAY_SWITCH,
-            self.evdev.ecodes.KEY_KBDILLUMTOGGLE: KeyCode.KEYBOARD_ILLUMINATION_TOGGLE,
-            self.evdev.ecodes.KEY_KBDILLUMDOWN: KeyCode.KEYBOARD_ILLUMINATION_DOWN,
-            self.evdev.ecodes.KEY_KBDILLUMUP: KeyCode.KEYBOARD_ILLUMINATION_UP,
-            self.evdev.ecodes.KEY_EJECTCD: KeyCode.EJECT,
-            self.evdev.ecodes.KEY_SLEEP: KeyCode.SLEEP,
-            self.evdev.ecodes.KEY_WAKEUP: KeyCode.WAKE,
-            self.evdev.ecodes.KEY_COMPOSE: KeyCode.EMOJI,
-            self.evdev.ecodes.KEY_MENU: KeyCode.MENU,
-            self.evdev.ecodes.KEY_CLEAR: KeyCode.CLEAR,
-            self.evdev.ecodes.KEY_SCREENLOCK: KeyCode.LOCK,
-
-            # Mouse Buttons
-            self.evdev.ecodes.BTN_LEFT: KeyCode.MOUSE_LEFT,
-            self.evdev.ecodes.BTN_RIGHT: KeyCode.MOUSE_RIGHT,
-            self.evdev.ecodes.BTN_MIDDLE: KeyCode.MOUSE_MIDDLE,
-            self.evdev.ecodes.BTN_SIDE: KeyCode.MOUSE_BACK,
-            self.evdev.ecodes.BTN_EXTRA: KeyCode.MOUSE_FORWARD,
-            self.evdev.ecodes.BTN_FORWARD: KeyCode.MOUSE_SIDE1,
-            self.evdev.ecodes.BTN_BACK: KeyCode.MOUSE_SIDE2,
-            self.evdev.ecodes.BTN_TASK: KeyCode.MOUSE_SIDE3,
-        }
+        return {getattr(ecodes, name): key_code for name, key_code in _EVDEV_KEY_SPEC}
 
     def on_input_event(self, event):
         """
@@ -980,14 +1161,21 @@ class PynputBackend(InputBackend):
     Input backend implementation using the pynput library.
     """
 
+    _available: Optional[bool] = None
+    _KEY_MAP: Optional[MappingProxyType] = None
+    _KEY_PRESS = InputEvent.KEY_PRESS
+    _KEY_RELEASE = InputEvent.KEY_RELEASE
+
     @classmethod
     def is_available(cls) -> bool:
         """Check if pynput library is available."""
-        try:
-            import pynput
-            return True
-        except ImportError:
-            return False
+        if cls._available is None:
+            try:
+                import pynput
+                cls._available = True
+            except ImportError:
+                cls._available = False
+        return cls._available
 
     def __init__(self):
         """Initialize PynputBackend."""
@@ -996,6 +1184,8 @@ class PynputBackend(InputBackend):
         self.keyboard = None
         self.mouse = None
         self.key_map = None
+        self._mouse_button_map = {}
+        self._pynput_keycode_cls = None
         self.is_running = False
         self.start_count = 0
         self.stop_count = 0
@@ -1014,7 +1204,9 @@ class PynputBackend(InputBackend):
             from pynput import keyboard, mouse
             self.keyboard = keyboard
             self.mouse = mouse
-            self.key_map = self._create_key_map()
+            self.key_map = type(self)._get_key_map()
+            self._mouse_button_map = self._create_mouse_button_map(mouse)
+            self._pynput_keycode_cls = keyboard.KeyCode
 
         self.keyboard_listener = self.keyboard.Listener(
             on_press=self._on_keyboard_press,
@@ -1061,113 +1253,41 @@ class PynputBackend(InputBackend):
         )
         return True
 
-    def _translate_key_event(self, native_event) -> Optional[tuple[KeyCode, InputEvent]]:
-        """Translate a pynput event to our internal event representation."""
-        # For evdev backend
-        if hasattr(native_event, 'keystate'):
-            key_event = native_event
-            if key_event.keystate in [key_event.key_down, key_event.key_hold]:
-                event_type = InputEvent.KEY_PRESS
-            elif key_event.keystate == key_event.key_up:
-                event_type = InputEvent.KEY_RELEASE
-            else:
-                return None
-            
-            key_code = self.key_map.get(key_event.scancode)
-            if key_code is None:
-                return None
-            
-            return key_code, event_type
+    def _translate_pynput_event(self, pynput_key, event_type: InputEvent) -> Optional[tuple[KeyCode, InputEvent]]:
+        """Translate a pynput key or mouse button event to our internal event representation."""
+        # Handle character keys by virtual key code first (numpad and number row)
+        if isinstance(pynput_key, self._pynput_keycode_cls):
+            vk = pynput_key.vk
+            if vk is not None and 0 <= vk < 256:
+                key_code = _PYNPUT_VK_TABLE[vk]
+                if key_code is not None:
+                    return key_code, event_type
 
-        # For pynput backend
-        pynput_key, is_press = native_event
-        
-        # Handle character keys
-        if isinstance(pynput_key, self.keyboard.KeyCode):
-            # Try to map from virtual key code first
-            if hasattr(pynput_key, 'vk') and pynput_key.vk is not None:
-                vk = pynput_key.vk
-                
-                # Map numpad virtual key codes (96-111)
-                if 96 <= vk <= 111:
-                    numpad_map = {
-                        96: KeyCode.NUMPAD_0,
-                        97: KeyCode.NUMPAD_1,
-                        98: KeyCode.NUMPAD_2,
-                        99: KeyCode.NUMPAD_3,
-                        100: KeyCode.NUMPAD_4,
-                        101: KeyCode.NUMPAD_5,
-                        102: KeyCode.NUMPAD_6,
-                        103: KeyCode.NUMPAD_7,
-                        104: KeyCode.NUMPAD_8,
-                        105: KeyCode.NUMPAD_9,
-                        106: KeyCode.NUMPAD_MULTIPLY,
-                        107: KeyCode.NUMPAD_ADD,
-                        109: KeyCode.NUMPAD_SUBTRACT,
-                        110: KeyCode.NUMPAD_DECIMAL,
-                        111: KeyCode.NUMPAD_DIVIDE
-                    }
-                    if vk in numpad_map:
-                        key_code = numpad_map[vk]
-                        event_type = InputEvent.KEY_PRESS if is_press else InputEvent.KEY_RELEASE
-                        return key_code, event_type
-                
-                # Try mapping from key_map
-                mapped_key = self.key_map.get(self.keyboard.KeyCode.from_vk(vk))
-                if mapped_key:
-                    event_type = InputEvent.KEY_PRESS if is_press else InputEvent.KEY_RELEASE
-                    return mapped_key, event_type
-                
-                # Map number virtual key codes (48-57 are 0-9)
-                if 48 <= vk <= 57:
-                    number_map = {
-                        48: 'ZERO', 49: 'ONE', 50: 'TWO', 51: 'THREE', 52: 'FOUR',
-                        53: 'FIVE', 54: 'SIX', 55: 'SEVEN', 56: 'EIGHT', 57: 'NINE'
-                    }
-                    try:
-                        key_code = KeyCode[number_map[vk]]
-                        event_type = InputEvent.KEY_PRESS if is_press else InputEvent.KEY_RELEASE
-                        return key_code, event_type
-                    except KeyError:
-                        pass
-        
         # Fall back to regular key mapping
         key_code = self.key_map.get(pynput_key)
-        
         if key_code is None:
             return None
-        
-        event_type = InputEvent.KEY_PRESS if is_press else InputEvent.KEY_RELEASE
+
         return key_code, event_type
 
     def _on_keyboard_press(self, key):
         """Handle keyboard press events."""
-        translated_event = self._translate_key_event((key, True))
+        translated_event = self._translate_pynput_event(key, self._KEY_PRESS)
         if translated_event:
-            # Only log if this key wasn't already pressed
-            if not hasattr(self, '_pressed_keys'):
-                self._pressed_keys = set()
-            if translated_event[0] not in self._pressed_keys:
-                # print(f"Press event: {translated_event}")
-                self._pressed_keys.add(translated_event[0])
             self.on_input_event(translated_event)
 
     def _on_keyboard_release(self, key):
         """Handle keyboard release events."""
-        translated_event = self._translate_key_event((key, False))
+        translated_event = self._translate_pynput_event(key, self._KEY_RELEASE)
         if translated_event:
-            if not hasattr(self, '_pressed_keys'):
-                self._pressed_keys = set()
-            if translated_event[0] in self._pressed_keys:
-                # print(f"Release event: {translated_event}")
-                self._pressed_keys.discard(translated_event[0])
             self.on_input_event(translated_event)
 
     def _on_mouse_click(self, x, y, button, pressed):
         """Handle mouse click events."""
-        translated_event = self._translate_key_event((button, pressed))
-        if translated_event:
-            self.on_input_event(translated_event)
+        key_code = self._mouse_button_map.get(button)
+        if key_code is None:
+            return
+        self.on_input_event((key_code, self._KEY_PRESS if pressed else self._KEY_RELEASE))
 
     def _on_mouse_scroll(self, x, y, dx, dy):
         """Handle mouse scroll events: ignore to avoid system beep."""
@@ -1175,163 +1295,96 @@ class PynputBackend(InputBackend):
         # Do not return False here; in pynput this would stop the listener.
         pass
 
-    def _create_key_map(self):
+    @classmethod
+    def _get_key_map(cls) -> MappingProxyType:
+        """Return the read-only pynput key mapping, building it on first use."""
+        if cls._KEY_MAP is None:
+            from pynput import keyboard
+            cls._KEY_MAP = MappingProxyType(cls._create_key_map(keyboard))
+        return cls._KEY_MAP
+
+    @staticmethod
+    def _create_mouse_button_map(mouse) -> dict:
+        """Create a mapping from pynput mouse buttons to our internal KeyCode enum."""
+        return {
+            mouse.Button.left: KeyCode.MOUSE_LEFT,
+            mouse.Button.right: KeyCode.MOUSE_RIGHT,
+            mouse.Button.middle: KeyCode.MOUSE_MIDDLE,
+        }
+
+    @staticmethod
+    def _create_key_map(keyboard) -> dict:
         """Create a mapping from pynput keys to our internal KeyCode enum."""
         key_map = {
             # Modifier keys
-            self.keyboard.Key.ctrl_l: KeyCode.CTRL_LEFT,
-            self.keyboard.Key.ctrl_r: KeyCode.CTRL_RIGHT,
-            self.keyboard.Key.shift_l: KeyCode.SHIFT_LEFT,
-            self.keyboard.Key.shift_r: KeyCode.SHIFT_RIGHT,
-            self.keyboard.Key.alt_l: KeyCode.ALT_LEFT,
-            self.keyboard.Key.alt_r: KeyCode.ALT_RIGHT,
-            self.keyboard.Key.alt_gr: KeyCode.ALT_RIGHT,
-            self.keyboard.Key.cmd_l: KeyCode.META_LEFT,
-            self.keyboard.Key.cmd_r: KeyCode.META_RIGHT,
+            keyboard.Key.ctrl_l: KeyCode.CTRL_LEFT,
+            keyboard.Key.ctrl_r: KeyCode.CTRL_RIGHT,
+            keyboard.Key.shift_l: KeyCode.SHIFT_LEFT,
+            keyboard.Key.shift_r: KeyCode.SHIFT_RIGHT,
+            keyboard.Key.alt_l: KeyCode.ALT_LEFT,
+            keyboard.Key.alt_r: KeyCode.ALT_RIGHT,
+            keyboard.Key.alt_gr: KeyCode.ALT_RIGHT,
+            keyboard.Key.cmd_l: KeyCode.META_LEFT,
+            keyboard.Key.cmd_r: KeyCode.META_RIGHT,
 
             # Function keys
-            self.keyboard.Key.f1: KeyCode.F1,
-            self.keyboard.Key.f2: KeyCode.F2,
-            self.keyboard.Key.f3: KeyCode.F3,
-            self.keyboard.Key.f4: KeyCode.F4,
-            self.keyboard.Key.f5: KeyCode.F5,
-            self.keyboard.Key.f6: KeyCode.F6,
-            self.keyboard.Key.f7: KeyCode.F7,
-            self.keyboard.Key.f8: KeyCode.F8,
-            self.keyboard.Key.f9: KeyCode.F9,
-            self.keyboard.Key.f10: KeyCode.F10,
-            self.keyboard.Key.f11: KeyCode.F11,
-            self.keyboard.Key.f12: KeyCode.F12,
-            self.keyboard.Key.f13: KeyCode.F13,
-            self.keyboard.Key.f14: KeyCode.F14,
-            self.keyboard.Key.f15: KeyCode.F15,
-            self.keyboard.Key.f16: KeyCode.F16,
-            self.keyboard.Key.f17: KeyCode.F17,
-            self.keyboard.Key.f18: KeyCode.F18,
-            self.keyboard.Key.f19: KeyCode.F19,
-            self.keyboard.Key.f20: KeyCode.F20,
-
-            # Number keys
-            self.keyboard.KeyCode.from_char('1'): KeyCode.ONE,
-            self.keyboard.KeyCode.from_char('2'): KeyCode.TWO,
-            self.keyboard.KeyCode.from_char('3'): KeyCode.THREE,
-            self.keyboard.KeyCode.from_char('4'): KeyCode.FOUR,
-            self.keyboard.KeyCode.from_char('5'): KeyCode.FIVE,
-            self.keyboard.KeyCode.from_char('6'): KeyCode.SIX,
-            self.keyboard.KeyCode.from_char('7'): KeyCode.SEVEN,
-            self.keyboard.KeyCode.from_char('8'): KeyCode.EIGHT,
-            self.keyboard.KeyCode.from_char('9'): KeyCode.NINE,
-            self.keyboard.KeyCode.from_char('0'): KeyCode.ZERO,
-
-            # Letter keys
-            self.keyboard.KeyCode.from_char('a'): KeyCode.A,
-            self.keyboard.KeyCode.from_char('b'): KeyCode.B,
-            self.keyboard.KeyCode.from_char('c'): KeyCode.C,
-            self.keyboard.KeyCode.from_char('d'): KeyCode.D,
-            self.keyboard.KeyCode.from_char('e'): KeyCode.E,
-            self.keyboard.KeyCode.from_char('f'): KeyCode.F,
-            self.keyboard.KeyCode.from_char('g'): KeyCode.G,
-            self.keyboard.KeyCode.from_char('h'): KeyCode.H,
-            self.keyboard.KeyCode.from_char('i'): KeyCode.I,
-            self.keyboard.KeyCode.from_char('j'): KeyCode.J,
-            self.keyboard.KeyCode.from_char('k'): KeyCode.K,
-            self.keyboard.KeyCode.from_char('l'): KeyCode.L,
-            self.keyboard.KeyCode.from_char('m'): KeyCode.M,
-            self.keyboard.KeyCode.from_char('n'): KeyCode.N,
-            self.keyboard.KeyCode.from_char('o'): KeyCode.O,
-            self.keyboard.KeyCode.from_char('p'): KeyCode.P,
-            self.keyboard.KeyCode.from_char('q'): KeyCode.Q,
-            self.keyboard.KeyCode.from_char('r'): KeyCode.R,
-            self.keyboard.KeyCode.from_char('s'): KeyCode.S,
-            self.keyboard.KeyCode.from_char('t'): KeyCode.T,
-            self.keyboard.KeyCode.from_char('u'): KeyCode.U,
-            self.keyboard.KeyCode.from_char('v'): KeyCode.V,
-            self.keyboard.KeyCode.from_char('w'): KeyCode.W,
-            self.keyboard.KeyCode.from_char('x'): KeyCode.X,
-            self.keyboard.KeyCode.from_char('y'): KeyCode.Y,
-            self.keyboard.KeyCode.from_char('z'): KeyCode.Z,
+            keyboard.Key.f1: KeyCode.F1,
+            keyboard.Key.f2: KeyCode.F2,
+            keyboard.Key.f3: KeyCode.F3,
+            keyboard.Key.f4: KeyCode.F4,
+            keyboard.Key.f5: KeyCode.F5,
+            keyboard.Key.f6: KeyCode.F6,
+            keyboard.Key.f7: KeyCode.F7,
+            keyboard.Key.f8: KeyCode.F8,
+            keyboard.Key.f9: KeyCode.F9,
+            keyboard.Key.f10: KeyCode.F10,
+            keyboard.Key.f11: KeyCode.F11,
+            keyboard.Key.f12: KeyCode.F12,
+            keyboard.Key.f13: KeyCode.F13,
+            keyboard.Key.f14: KeyCode.F14,
+            keyboard.Key.f15: KeyCode.F15,
+            keyboard.Key.f16: KeyCode.F16,
+            keyboard.Key.f17: KeyCode.F17,
+            keyboard.Key.f18: KeyCode.F18,
+            keyboard.Key.f19: KeyCode.F19,
+            keyboard.Key.f20: KeyCode.F20,
 
             # Special keys
-            self.keyboard.Key.space: KeyCode.SPACE,
-            self.keyboard.Key.enter: KeyCode.ENTER,
-            self.keyboard.Key.tab: KeyCode.TAB,
-            self.keyboard.Key.backspace: KeyCode.BACKSPACE,
-            self.keyboard.Key.esc: KeyCode.ESC,
-            self.keyboard.Key.insert: KeyCode.INSERT,
-            self.keyboard.Key.delete: KeyCode.DELETE,
-            self.keyboard.Key.home: KeyCode.HOME,
-            self.keyboard.Key.end: KeyCode.END,
-            self.keyboard.Key.page_up: KeyCode.PAGE_UP,
-            self.keyboard.Key.page_down: KeyCode.PAGE_DOWN,
-            self.keyboard.Key.caps_lock: KeyCode.CAPS_LOCK,
-            self.keyboard.Key.num_lock: KeyCode.NUM_LOCK,
-            self.keyboard.Key.scroll_lock: KeyCode.SCROLL_LOCK,
-            self.keyboard.Key.pause: KeyCode.PAUSE,
-            self.keyboard.Key.print_screen: KeyCode.PRINT_SCREEN,
+            keyboard.Key.space: KeyCode.SPACE,
+            keyboard.Key.enter: KeyCode.ENTER,
+            keyboard.Key.tab: KeyCode.TAB,
+            keyboard.Key.backspace: KeyCode.BACKSPACE,
+            keyboard.Key.esc: KeyCode.ESC,
+            keyboard.Key.insert: KeyCode.INSERT,
+            keyboard.Key.delete: KeyCode.DELETE,
+            keyboard.Key.home: KeyCode.HOME,
+            keyboard.Key.end: KeyCode.END,
+            keyboard.Key.page_up: KeyCode.PAGE_UP,
+            keyboard.Key.page_down: KeyCode.PAGE_DOWN,
+            keyboard.Key.caps_lock: KeyCode.CAPS_LOCK,
+            keyboard.Key.num_lock: KeyCode.NUM_LOCK,
+            keyboard.Key.scroll_lock: KeyCode.SCROLL_LOCK,
+            keyboard.Key.pause: KeyCode.PAUSE,
+            keyboard.Key.print_screen: KeyCode.PRINT_SCREEN,
 
             # Arrow keys
-            self.keyboard.Key.up: KeyCode.UP,
-            self.keyboard.Key.down: KeyCode.DOWN,
-            self.keyboard.Key.left: KeyCode.LEFT,
-            self.keyboard.Key.right: KeyCode.RIGHT,
-
-            # Numpad keys
-            self.keyboard.Key.num_lock: KeyCode.NUM_LOCK,
-            self.keyboard.KeyCode.from_vk(96): KeyCode.NUMPAD_0,
-            self.keyboard.KeyCode.from_vk(97): KeyCode.NUMPAD_1,
-            self.keyboard.KeyCode.from_vk(98): KeyCode.NUMPAD_2,
-            self.keyboard.KeyCode.from_vk(99): KeyCode.NUMPAD_3,
-            self.keyboard.KeyCode.from_vk(100): KeyCode.NUMPAD_4,
-            self.keyboard.KeyCode.from_vk(101): KeyCode.NUMPAD_5,
-            self.keyboard.KeyCode.from_vk(102): KeyCode.NUMPAD_6,
-            self.keyboard.KeyCode.from_vk(103): KeyCode.NUMPAD_7,
-            self.keyboard.KeyCode.from_vk(104): KeyCode.NUMPAD_8,
-            self.keyboard.KeyCode.from_vk(105): KeyCode.NUMPAD_9,
-            self.keyboard.KeyCode.from_vk(106): KeyCode.NUMPAD_MULTIPLY,
-            self.keyboard.KeyCode.from_vk(107): KeyCode.NUMPAD_ADD,
-            self.keyboard.KeyCode.from_vk(109): KeyCode.NUMPAD_SUBTRACT,
-            self.keyboard.KeyCode.from_vk(110): KeyCode.NUMPAD_DECIMAL,
-            self.keyboard.KeyCode.from_vk(111): KeyCode.NUMPAD_DIVIDE,
-
-            # Additional special characters
-            self.keyboard.KeyCode.from_char('-'): KeyCode.MINUS,
-            self.keyboard.KeyCode.from_char('='): KeyCode.EQUALS,
-            self.keyboard.KeyCode.from_char('['): KeyCode.LEFT_BRACKET,
-            self.keyboard.KeyCode.from_char(']'): KeyCode.RIGHT_BRACKET,
-            self.keyboard.KeyCode.from_char(';'): KeyCode.SEMICOLON,
-            self.keyboard.KeyCode.from_char("'"): KeyCode.QUOTE,
-            self.keyboard.KeyCode.from_char('`'): KeyCode.BACKQUOTE,
-            self.keyboard.KeyCode.from_char('\\'): KeyCode.BACKSLASH,
-            self.keyboard.KeyCode.from_char(','): KeyCode.COMMA,
-            self.keyboard.KeyCode.from_char('.'): KeyCode.PERIOD,
-            self.keyboard.KeyCode.from_char('/'): KeyCode.SLASH,
+            keyboard.Key.up: KeyCode.UP,
+            keyboard.Key.down: KeyCode.DOWN,
+            keyboard.Key.left: KeyCode.LEFT,
+            keyboard.Key.right: KeyCode.RIGHT,
 
             # Media keys
-            self.keyboard.Key.media_volume_mute: KeyCode.AUDIO_MUTE,
-            self.keyboard.Key.media_volume_down: KeyCode.AUDIO_VOLUME_DOWN,
-            self.keyboard.Key.media_volume_up: KeyCode.AUDIO_VOLUME_UP,
-            self.keyboard.Key.media_play_pause: KeyCode.MEDIA_PLAY_PAUSE,
-            self.keyboard.Key.media_next: KeyCode.MEDIA_NEXT,
-            self.keyboard.Key.media_previous: KeyCode.MEDIA_PREVIOUS,
-
-            # Mouse buttons
-            self.mouse.Button.left: KeyCode.MOUSE_LEFT,
-            self.mouse.Button.right: KeyCode.MOUSE_RIGHT,
-            self.mouse.Button.middle: KeyCode.MOUSE_MIDDLE,
+            keyboard.Key.media_volume_mute: KeyCode.AUDIO_MUTE,
+            keyboard.Key.media_volume_down: KeyCode.AUDIO_VOLUME_DOWN,
+            keyboard.Key.media_volume_up: KeyCode.AUDIO_VOLUME_UP,
+            keyboard.Key.media_play_pause: KeyCode.MEDIA_PLAY_PAUSE,
+            keyboard.Key.media_next: KeyCode.MEDIA_NEXT,
+            keyboard.Key.media_previous: KeyCode.MEDIA_PREVIOUS,
         }
-        
-        # Add uppercase letter mappings
-        key_map.update({
-            self.keyboard.KeyCode.from_char(c.upper()): getattr(KeyCode, c.upper())
-            for c in 'ABCDEFGHIJKLMNOPQRSTUVWXYZ'
-        })
-        
-        # Add existing lowercase mappings
-        key_map.update({
-            self.keyboard.KeyCode.from_char(c.lower()): getattr(KeyCode, c)
-            for c in 'ABCDEFGHIJKLMNOPQRSTUVWXYZ'
-        })
-        
+        key_map.update(
+            (keyboard.KeyCode.from_char(char), key_code)
+            for char, key_code in _PYNPUT_CHAR_SPEC
+        )
         return key_map
 
     def on_input_event(self, event):
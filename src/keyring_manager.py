@@ -1,27 +1,57 @@
-import keyring
 from utils import ConfigManager
 
+# Imported on first use by _get_keyring(); most runs read every key from the cache below
+keyring = None
+
+
+def _get_keyring():
+    """Import the keyring module the first time a key has to be read or written."""
+    global keyring
+    if keyring is None:
+        import keyring as keyring_module
+        keyring = keyring_module
+    return keyring
+
+
 class KeyringManager:
     APP_NAME = "whisperwriter"
+    # Keys read from or written to the keyring in this process, so repeated lookups skip the keyring backend
+    _cache: dict[str, str] = {}
+    # Cleared once the keyring reports that no usable backend exists, so later lookups do not retry
+    _keyring_available = True
     
     @staticmethod
     def save_api_key(service_name: str, key: str):
         """Save an API key to the system keyring."""
+        keyring_module = _get_keyring()
         if not key:  # If key is empty, remove it from keyring
             try:
-                keyring.delete_password(KeyringManager.APP_NAME, service_name)
-            except keyring.errors.PasswordDeleteError:
+                keyring_module.delete_password(KeyringManager.APP_NAME, service_name)
+            except keyring_module.errors.PasswordDeleteError:
                 pass  # Key doesn't exist, that's fine
+            KeyringManager._cache[service_name] = ""
             return
             
-        keyring.set_password(KeyringManager.APP_NAME, service_name, key)
+        keyring_module.set_password(KeyringManager.APP_NAME, service_name, key)
+        KeyringManager._cache[service_name] = key
         ConfigManager.console_print(f"Saved {service_name} API key to keyring")
 
     @staticmethod
     def get_api_key(service_name: str) -> str:
         """Get an API key from the system keyring."""
+        cached_key = KeyringManager._cache.get(service_name)
+        if cached_key is not None:
+            return cached_key
+        if not KeyringManager._keyring_available:
+            return ""
+        keyring_module = _get_keyring()
         try:
-            key = keyring.get_password(KeyringManager.APP_NAME, service_name)
-            return key if key else ""
-        except:
-            return ""
\ No newline at end of file
+            key = keyring_module.get_password(KeyringManager.APP_NAME, service_name)
+        except (keyring_module.errors.NoKeyringError, keyring_module.errors.InitError) as e:
+            ConfigManager.console_print(f"System keyring unavailable; API keys cannot be read: {e}")
+            KeyringManager._keyring_available = False
+            return ""
+        except Exception:
+            return ""
+        KeyringManager._cache[service_name] = key if key else ""
+        return KeyringManager._cache[service_name]
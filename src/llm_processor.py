@@ -1,29 +1,57 @@
 import os
 import copy
+from concurrent.futures import ThreadPoolExecutor, as_completed, TimeoutError as FuturesTimeoutError
+from typing import Iterator
+import hashlib
 import json
 import re
+import threading
+import time
+from urllib.parse import urlsplit
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from utils import ConfigManager
 from keyring_manager import KeyringManager
 import importlib
 
-# Optional third-party SDK imports; guard to avoid hard dependency in tests
-try:
-    import ollama
-except Exception:  # pragma: no cover - optional dependency
-    ollama = None
-try:
-    import google.generativeai as genai
-except Exception:  # pragma: no cover - optional dependency
-    genai = None
-
-try:
-    from groq import Groq
-except Exception:  # pragma: no cover - optional dependency
-    Groq = None
-
-# Check if Ollama is available
-HAS_OLLAMA = ollama is not None
+# Optional third-party SDKs are heavy to import, so each is imported on first use;
+# a missing SDK resolves to None instead of failing at module import
+_sdk_cache: dict[str, object] = {}
+
+
+def _lazy_import(module_name: str):
+    """Import an optional SDK module once and cache it, returning None if it is unavailable."""
+    if module_name not in _sdk_cache:
+        try:
+            _sdk_cache[module_name] = importlib.import_module(module_name)
+        except Exception:  # pragma: no cover - optional dependency
+            _sdk_cache[module_name] = None
+    return _sdk_cache[module_name]
+
+
+# model -> tiktoken encoder, or None when tiktoken is missing or does not know the model
+_token_encoders: dict[str, object] = {}
+
+
+def _count_tokens(text: str, model: str) -> int:
+    """Count tokens locally with tiktoken, approximating 4 characters per token for other models."""
+    if model not in _token_encoders:
+        tiktoken = _lazy_import('tiktoken')
+        encoder = None
+        if tiktoken is not None:
+            try:
+                encoder = tiktoken.encoding_for_model(model)
+            except Exception:
+                # Unknown model, or the encoding download failed (offline, proxy); the miss is
+                # cached so counting never retries the download on the request path
+                encoder = None
+        _token_encoders[model] = encoder
+    encoder = _token_encoders[model]
+    if encoder is None:
+        return (len(text) + 3) // 4
+    return len(encoder.encode(text))
+
 RESPONSES_API_ENDPOINT = "https://api.openai.com/v1/responses"
 REASONING_MODEL_PREFIXES = ("gpt-5", "o1")
 RESPONSES_MODEL_PREFIXES = ("gpt-5",)
@@ -31,8 +59,131 @@ GPT53_CHAT_PREFIXES = ("gpt-5.3-chat",)
 CLEANUP_RESPONSE_SCHEMA_NAME = "cleaned_transcript_schema"
 CLEANUP_RESPONSE_JSON_FIELD = "cleaned_text"
 LEGACY_CLEANUP_RESPONSE_JSON_FIELD = "processed_and_cleaned_transcript"
+DEFAULT_MAX_OUTPUT_TOKENS = 4096
+# Rate limited, server errors and Anthropic's 529 "overloaded"
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504, 529)
+# (connect, read) seconds; without a timeout a stalled provider hangs the dictation indefinitely
+REQUEST_TIMEOUT = (5, 30)
+# After this many consecutive failed requests, calls to the provider are skipped for the cool-off period
+CIRCUIT_BREAKER_THRESHOLD = 3
+CIRCUIT_BREAKER_COOLOFF_SECONDS = 30
+OPENAI_API_BASE = "https://api.openai.com/v1"
+GEMINI_API_BASE = "https://generativelanguage.googleapis.com/v1beta"
+CLAUDE_MESSAGE_BATCHES_ENDPOINT = "https://api.anthropic.com/v1/messages/batches"
+BATCH_POLL_INTERVAL_SECONDS = 30
+# Limits for packing several texts into one chat request. The reply repeats every text, so the packed
+# request is kept within the output budget _estimate_max_tokens gives it (two characters per token)
+PACKED_REQUEST_MAX_ITEMS = 16
+PACKED_REQUEST_MAX_CHARS = (DEFAULT_MAX_OUTPUT_TOKENS - 256) * 2
+PACKED_REQUEST_INSTRUCTION = (
+    'The user message is a JSON object {"items": [{"id": <number>, "text": <string>}]}. '
+    'Apply the instructions above to the text of each item independently. '
+    'Respond only with a JSON object {"items": [{"id": <number>, "text": <string>}]} '
+    'that contains exactly one entry for every input id.'
+)
+# Provider model lists change on the order of weeks; re-fetch them at most hourly
+MODELS_CACHE_TTL_SECONDS = 60 * 60
+OLLAMA_MODELS_CACHE_TTL_SECONDS = 5 * 60
+MODELS_FETCH_TIMEOUT_SECONDS = 10
+# Keyring service name holding the API key of each provider
+API_KEY_SERVICES = {
+    'claude': 'claude',
+    'openai': 'openai_llm',
+    'azure_openai': 'azure_openai_llm',
+    'gemini': 'gemini',
+    'groq': 'groq'
+}
+# Default models if none specified
+DEFAULT_MODELS = {
+    'claude': 'claude-3-5-sonnet-latest',
+    'openai': 'gpt-4o-mini',
+    'azure_openai': 'gpt-4o-mini',
+    'gemini': 'gemini-1.5-flash',
+    'groq': 'llama-3.1-8b-instant',
+    'ollama': {
+        'cleanup': 'airat/karen-the-editor-v2-strict',
+        'instruction': 'llama3.2'
+    }
+}
+# USD per million (input, output) tokens for common models, used for the verbose cost estimate
+MODEL_PRICES_PER_MILLION_TOKENS = {
+    'gpt-4o-mini': (0.15, 0.60),
+    'gpt-4o': (2.50, 10.00),
+    'claude-3-5-sonnet-latest': (3.00, 15.00),
+    'claude-3-5-haiku-latest': (0.80, 4.00),
+    'gemini-1.5-flash': (0.075, 0.30),
+    'llama-3.1-8b-instant': (0.05, 0.08),
+}
+RESPONSE_CACHE_MAX_ENTRIES = 256
+RESPONSE_CACHE_TTL_SECONDS = 7 * 24 * 60 * 60
+# Responses sampled above this temperature are expected to vary and are never cached
+RESPONSE_CACHE_MAX_TEMPERATURE = 0.3
+
+
+class ResponseCache:
+    """In-memory cache of LLM responses keyed by everything that shapes the request."""
+
+    def __init__(self, max_entries: int = RESPONSE_CACHE_MAX_ENTRIES, ttl_seconds: float = RESPONSE_CACHE_TTL_SECONDS):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        # key -> [response, stored_at, hits]
+        self._entries: dict[str, list] = {}
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def make_key(api_type: str, model: str, system_message: str, text: str, temperature: float | None) -> str:
+        return hashlib.sha256(
+            f"{api_type}|{model}|{system_message}|{text}|{temperature}".encode('utf-8')
+        ).hexdigest()
+
+    def get(self, key: str) -> str | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if time.monotonic() - entry[1] > self.ttl_seconds:
+                del self._entries[key]
+                return None
+            entry[2] += 1
+            return entry[0]
+
+    def put(self, key: str, response: str) -> None:
+        with self._lock:
+            if key not in self._entries and len(self._entries) >= self.max_entries:
+                # Evict the least frequently used entry, the oldest one among ties
+                evicted = min(self._entries, key=lambda k: (self._entries[k][2], self._entries[k][1]))
+                del self._entries[evicted]
+            self._entries[key] = [response, time.monotonic(), 0]
+
 
 class LLMProcessor:
+    # Shared keep-alive sessions, one per API host, so back-to-back calls skip the TCP/TLS handshake
+    _sessions: dict[str, requests.Session] = {}
+    _sessions_lock = threading.Lock()
+    # api_type -> {'fail_count': consecutive failures, 'open_until': monotonic time calls resume}
+    _breakers: dict[str, dict] = {}
+    _breakers_lock = threading.Lock()
+    # Provider handlers by api_type, looked up once per request instead of an if/elif chain
+    _PROCESSORS = {
+        'claude': '_process_claude',
+        'openai': '_process_openai',
+        'azure_openai': '_process_azure_openai',
+        'gemini': '_process_gemini',
+        'ollama': '_process_ollama',
+        'groq': '_process_groq',
+    }
+    _MODEL_LISTERS = {
+        'claude': '_list_claude_models',
+        'openai': '_list_openai_models',
+        'gemini': '_list_gemini_models',
+        'ollama': '_list_ollama_models',
+        'groq': '_list_groq_models',
+    }
+    # api_type -> (fetched_at, models)
+    _models_cache: dict[str, tuple[float, list[str]]] = {}
+    # (fetched_at, model names) from the last local Ollama listing
+    _ollama_models_cache: tuple[float, set[str]] | None = None
+
     def __init__(self, api_type=None):
         """Initialize the LLM processor."""
         self.config = ConfigManager.get_config_section('llm_post_processing')
@@ -52,6 +203,11 @@ class LLMProcessor:
         self._safe_console_print = _safe_print
         
         self.api_key = None
+        self._response_cache = ResponseCache()
+        # Saving settings restarts the app, so these stay valid for the processor's lifetime
+        self._instruction_system_message = ConfigManager.get_config_value('llm_post_processing', 'instruction_system_message')
+        self._instruction_model = ConfigManager.get_config_value('llm_post_processing', 'instruction_model')
+        self._cleanup_model = ConfigManager.get_config_value('llm_post_processing', 'cleanup_model')
         # If api_type is passed, use it; otherwise get from config without assuming a default
         if api_type is None:
             self.api_type = self.config.get('api_type')
@@ -121,35 +277,16 @@ class LLMProcessor:
         api_type = self.config['api_type']
         mode = self._resolve_mode(system_message, mode)
 
-        # Determine which model to use based on the resolved mode
-        if mode == "instruction":
-            model = ConfigManager.get_config_value('llm_post_processing', 'instruction_model')
-            ConfigManager.console_print("Using instruction mode")
-        else:
-            model = ConfigManager.get_config_value('llm_post_processing', 'cleanup_model')
-            ConfigManager.console_print("Using cleanup mode")
-        
-        # Default models if none specified
-        default_models = {
-            'claude': 'claude-3-5-sonnet-latest',
-            'openai': 'gpt-4o-mini',
-            'azure_openai': 'gpt-4o-mini',
-            'gemini': 'gemini-1.5-flash',
-            'groq': 'llama-3.1-8b-instant',
-            'ollama': {
-                'cleanup': 'airat/karen-the-editor-v2-strict',
-                'instruction': 'llama3.2'
-            }
-        }
-        
-        if not model:
-            if api_type == 'ollama':
-                model = default_models['ollama'][mode]
-            else:
-                model = default_models.get(api_type)
-            ConfigManager.console_print(f"No model specified, using default {mode} model for {api_type}: {model}")
+        model = self._resolve_model(api_type, mode)
+
+        min_tokens = self.config.get('min_tokens_to_process') or 0
+        if mode == 'cleanup' and min_tokens > 0 and _count_tokens(text, model or '') < min_tokens:
+            self._safe_console_print(f"Skipping LLM cleanup of a transcript shorter than {min_tokens} tokens")
+            return text
 
         request_text = self._prepare_text_input(text, mode)
+        if ConfigManager.get_verbose_mode():
+            self._log_request_estimate(model or '', system_message, request_text, mode)
         
         azure_deployment = None
         if api_type == 'azure_openai':
@@ -166,34 +303,601 @@ class LLMProcessor:
         else:
             self._safe_console_print(f"Using system message: {system_message}", verbose=True)
         
+        cache_key = self._get_response_cache_key(api_type, azure_deployment or model, system_message, request_text, mode)
+        if cache_key is not None:
+            cached_text = self._response_cache.get(cache_key)
+            if cached_text is not None:
+                self._safe_console_print("Using cached LLM response", verbose=True)
+                return cached_text
+
         processed_text = text
-        if api_type == 'claude':
-            processed_text = self._process_claude(request_text, system_message, model, mode)
-        elif api_type == 'openai':
-            processed_text = self._process_openai(request_text, system_message, model, mode)
-        elif api_type == 'azure_openai':
-            processed_text = self._process_azure_openai(request_text, system_message, model, mode)
-        elif api_type == 'gemini':
-            processed_text = self._process_gemini(request_text, system_message, model, mode)
-        elif api_type == 'ollama':
-            processed_text = self._process_ollama(request_text, system_message, model, mode)  # Pass the model explicitly
-        elif api_type == 'groq':
-            processed_text = self._process_groq(request_text, system_message, model, mode)
+        processor_name = self._PROCESSORS.get(api_type)
+        if processor_name is not None and self._is_circuit_open(api_type):
+            ConfigManager.console_print(f"Skipping {api_type} request: provider is failing, retrying after the cool-off")
+            return text
+        if processor_name is not None:
+            processed_text = getattr(self, processor_name)(request_text, system_message, model, mode)
+
+        # Providers hand the request text back on failure; only cache real responses
+        if cache_key is not None and processed_text and processed_text != request_text:
+            self._response_cache.put(cache_key, processed_text)
 
         if mode == 'cleanup' and processed_text == request_text:
             return text
         return processed_text
 
+    def _get_response_cache_key(self, api_type: str, model: str, system_message: str, request_text: str, mode: str):
+        """Return the response cache key of a request, or None if its temperature is too high to cache."""
+        temperature = self._get_temperature_for_mode(model, mode)
+        if temperature is not None and temperature > RESPONSE_CACHE_MAX_TEMPERATURE:
+            return None
+        return ResponseCache.make_key(api_type, model, system_message, request_text, temperature)
+
+    def _log_request_estimate(self, model: str, system_message: str, request_text: str, mode: str) -> None:
+        input_tokens = _count_tokens(system_message, model) + _count_tokens(request_text, model)
+        message = f"Estimated request size: {input_tokens} input tokens"
+        prices = MODEL_PRICES_PER_MILLION_TOKENS.get(model)
+        if prices:
+            # A cleaned transcript is about as long as the input; instruction replies are unbounded, so price the input only
+            output_tokens = _count_tokens(request_text, model) if mode == 'cleanup' else 0
+            cost = (input_tokens * prices[0] + output_tokens * prices[1]) / 1_000_000
+            message += f", estimated cost ${cost:.6f}"
+        self._safe_console_print(message, verbose=True)
+
+    def warm_up(self) -> None:
+        """
+        Open the connection to the configured provider in the background.
+
+        DNS resolution and the TLS handshake then happen at startup instead of delaying the
+        first dictation; the connection stays in the pooled session for the first request.
+        """
+        threading.Thread(target=self._warm_up_connection, name="LLMWarmUp", daemon=True).start()
+
+    def _warm_up_connection(self) -> None:
+        if self.api_type == 'claude':
+            url = self.config.get('endpoint')
+        elif self.api_type == 'openai':
+            url = OPENAI_API_BASE
+        elif self.api_type == 'gemini':
+            url = GEMINI_API_BASE
+        elif self.api_type == 'azure_openai':
+            url = ConfigManager.get_config_value('llm_post_processing', 'azure_openai_llm_endpoint')
+        else:
+            # Groq goes through its SDK and Ollama is local, so there is nothing to warm
+            return
+        if not url:
+            return
+
+        try:
+            response = self._get_session(url).head(url, timeout=5)
+            # Consuming the (empty) body hands the connection back to the pool for reuse
+            response.content
+            ConfigManager.console_print(f"Warmed up connection to {urlsplit(url).netloc}", verbose=True)
+        except Exception as e:
+            ConfigManager.console_print(f"Connection warm-up for {self.api_type} failed: {str(e)}", verbose=True)
+
+    def process_text_stream(self, text: str, system_message: str, mode: str | None = None) -> Iterator[str]:
+        """
+        Yield the processed text in chunks as the provider generates it.
+
+        Streaming covers instruction-mode requests to Claude, OpenAI chat models and Ollama.
+        Cleanup replies are structured JSON that is only usable once complete, so cleanup
+        requests and other providers yield the full process_text result as a single chunk.
+        """
+        api_type = self.config['api_type']
+        resolved_mode = self._resolve_mode(system_message, mode) if system_message else 'cleanup'
+        streamers = {
+            'claude': self._stream_claude,
+            'openai': self._stream_openai,
+            'ollama': self._stream_ollama,
+        }
+        if not text or not self.config['enabled'] or resolved_mode != 'instruction' or api_type not in streamers:
+            yield self.process_text(text, system_message, mode=mode)
+            return
+
+        model = self._resolve_model(api_type, resolved_mode)
+        if api_type == 'openai' and self._should_use_responses_api(model):
+            yield self.process_text(text, system_message, mode=mode)
+            return
+
+        if self._is_circuit_open(api_type):
+            ConfigManager.console_print(f"Skipping {api_type} request: provider is failing, retrying after the cool-off")
+            yield text
+            return
+
+        self._safe_console_print(f"Streaming text with {api_type} using {resolved_mode} model: {model}")
+        received_output = False
+        try:
+            for chunk in streamers[api_type](text, system_message, model, resolved_mode):
+                if chunk:
+                    received_output = True
+                    yield chunk
+        except Exception as e:
+            ConfigManager.console_print(f"Error streaming from {api_type} with model {model}: {str(e)}")
+
+        # Like process_text, fall back to the original text when nothing came back
+        if not received_output:
+            yield text
+
     @staticmethod
-    def _resolve_mode(system_message: str, explicit_mode: str | None) -> str:
+    def _iter_sse_data(response) -> Iterator[dict]:
+        """Yield the decoded JSON payload of each server-sent event data line."""
+        for line in response.iter_lines(decode_unicode=True):
+            if not line or not line.startswith('data:'):
+                continue
+            payload = line[len('data:'):].strip()
+            if payload == '[DONE]':
+                return
+            yield json.loads(payload)
+
+    def _stream_claude(self, text: str, system_message: str, model: str, mode: str) -> Iterator[str]:
+        headers = {
+            'anthropic-version': '2023-06-01',
+            'x-api-key': KeyringManager.get_api_key("claude"),
+            'content-type': 'application/json'
+        }
+        data = self._build_claude_payload(text, system_message, model, mode)
+        data['stream'] = True
+
+        endpoint = self.config['endpoint']
+        with self._send('post', endpoint, headers=headers, json=data, stream=True) as response:
+            if response.status_code != 200:
+                ConfigManager.console_print(f"Claude API error with model {model}: {response.status_code} - {response.text}")
+                return
+            for event in self._iter_sse_data(response):
+                if event.get('type') == 'content_block_delta':
+                    delta = event.get('delta') or {}
+                    if delta.get('type') == 'text_delta':
+                        yield delta.get('text', '')
+
+    def _stream_openai(self, text: str, system_message: str, model: str, mode: str) -> Iterator[str]:
+        headers = {
+            'Authorization': f'Bearer {KeyringManager.get_api_key("openai_llm")}',
+            'Content-Type': 'application/json'
+        }
+        data = self._build_openai_chat_payload(text, system_message, model, mode)
+        data['stream'] = True
+
+        endpoint = f"{OPENAI_API_BASE}/chat/completions"
+        with self._send('post', endpoint, headers=headers, json=data, stream=True) as response:
+            if response.status_code != 200:
+                ConfigManager.console_print(f"OpenAI API error: {response.status_code} - {response.text}")
+                return
+            for event in self._iter_sse_data(response):
+                choices = event.get('choices') or []
+                if choices:
+                    yield (choices[0].get('delta') or {}).get('content') or ''
+
+    def _stream_ollama(self, text: str, system_message: str, model: str, mode: str) -> Iterator[str]:
+        ollama = _lazy_import('ollama')
+        if ollama is None:
+            ConfigManager.console_print("Ollama not available. Please install the Ollama package or choose a different API.")
+            return
+
+        temperature = self._get_temperature_for_mode(model, mode)
+        for chunk in ollama.chat(
+            model=model,
+            messages=[
+                {"role": "system", "content": system_message},
+                {"role": "user", "content": text}
+            ],
+            options={**({"temperature": temperature} if temperature is not None else {})},
+            stream=True
+        ):
+            yield chunk['message']['content']
+
+    def process_texts(self, items: list[tuple[str, str]], mode: str | None = None, max_workers: int = 4) -> list[str]:
+        """
+        Process several (text, system_message) pairs concurrently.
+
+        Requests share the pooled per-host sessions, so total latency is bounded by the
+        slowest request rather than the sum of all of them. Results keep the input order.
+        """
+        if len(items) <= 1:
+            return [self.process_text(text, system_message, mode=mode) for text, system_message in items]
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+            return list(executor.map(lambda item: self.process_text(item[0], item[1], mode=mode), items))
+
+    def process_text_many(self, texts: list[str], system_message: str, mode: str | None = None) -> list[str]:
+        """
+        Process several texts that share one system message in as few requests as possible.
+
+        For OpenAI chat models and Claude, up to PACKED_REQUEST_MAX_ITEMS texts are packed
+        into one JSON request, so the network round-trip and the system prompt are paid once
+        per group. Each text gets the same framing and response caching as in process_text,
+        and nothing is packed while the provider's circuit breaker is open. Texts the model
+        leaves out of its reply are retried one by one, and other providers go through
+        process_text for each text.
+        """
+        api_type = self.config['api_type']
+        if len(texts) <= 1 or not system_message or not self.config['enabled'] or api_type not in ('openai', 'claude'):
+            return [self.process_text(text, system_message, mode=mode) for text in texts]
+
+        resolved_mode = self._resolve_mode(system_message, mode)
+        model = self._resolve_model(api_type, resolved_mode)
+        if api_type == 'openai' and self._should_use_responses_api(model):
+            return [self.process_text(text, system_message, mode=mode) for text in texts]
+
+        results = list(texts)
+        request_texts = {}
+        cache_keys = {}
+        for index, text in enumerate(texts):
+            request_text = self._prepare_text_input(text, resolved_mode)
+            cache_key = self._get_response_cache_key(api_type, model, system_message, request_text, resolved_mode)
+            cached_text = self._response_cache.get(cache_key) if cache_key is not None else None
+            if cached_text is not None:
+                results[index] = cached_text
+                continue
+            request_texts[index] = request_text
+            cache_keys[index] = cache_key
+
+        groups = []
+        group, group_chars = [], 0
+        for index, request_text in request_texts.items():
+            item_chars = len(json.dumps({'id': index, 'text': request_text}, ensure_ascii=False))
+            if group and (len(group) >= PACKED_REQUEST_MAX_ITEMS or group_chars + item_chars > PACKED_REQUEST_MAX_CHARS):
+                groups.append(group)
+                group, group_chars = [], 0
+            group.append(index)
+            group_chars += item_chars
+        if group:
+            groups.append(group)
+
+        for group in groups:
+            outputs = {}
+            if len(group) > 1 and not self._is_circuit_open(api_type):
+                try:
+                    outputs = self._process_packed(
+                        api_type, {index: request_texts[index] for index in group}, system_message, model, resolved_mode
+                    )
+                except Exception as e:
+                    ConfigManager.console_print(f"Error in packed {api_type} request: {str(e)}")
+            for index in group:
+                processed_text = outputs.get(index)
+                if processed_text is None:
+                    processed_text = self.process_text(texts[index], system_message, mode=mode)
+                elif processed_text == request_texts[index]:
+                    # The request text handed back unchanged, as process_text treats it
+                    processed_text = texts[index]
+                elif cache_keys[index] is not None:
+                    self._response_cache.put(cache_keys[index], processed_text)
+                results[index] = processed_text
+        return results
+
+    def _process_packed(self, api_type: str, items: dict[int, str], system_message: str, model: str, mode: str) -> dict[int, str]:
+        """Send several texts as one JSON request and return the processed text by item id."""
+        packed_system_message = f"{system_message}\n\n{PACKED_REQUEST_INSTRUCTION}"
+        packed_text = json.dumps(
+            {'items': [{'id': index, 'text': text} for index, text in items.items()]},
+            ensure_ascii=False
+        )
+        ConfigManager.console_print(f"Sending {len(items)} texts to {api_type} in one request with model {model}")
+
+        if api_type == 'openai':
+            headers = {
+                'Authorization': f'Bearer {KeyringManager.get_api_key("openai_llm")}',
+                'Content-Type': 'application/json'
+            }
+            data = self._build_openai_chat_payload(packed_text, packed_system_message, model, mode)
+            data['response_format'] = {'type': 'json_object'}
+            endpoint = f"{OPENAI_API_BASE}/chat/completions"
+        else:
+            headers = {
+                'anthropic-version': '2023-06-01',
+                'x-api-key': KeyringManager.get_api_key("claude"),
+                'content-type': 'application/json'
+            }
+            data = self._build_claude_payload(packed_text, packed_system_message, model, mode)
+            endpoint = self.config['endpoint']
+
+        response = self._send('post', endpoint, headers=headers, json=data)
+        if response.status_code != 200:
+            ConfigManager.console_print(f"{api_type} packed request error: {response.status_code} - {response.text}")
+            return {}
+
+        response_data = response.json()
+        if api_type == 'openai':
+            reply = response_data['choices'][0]['message']['content']
+        else:
+            reply = response_data['content'][0]['text']
+
+        outputs = {}
+        for entry in json.loads(reply).get('items') or []:
+            if isinstance(entry, dict) and entry.get('id') in items and isinstance(entry.get('text'), str):
+                outputs[entry['id']] = entry['text'].strip()
+        return outputs
+
+    def process_batch(self, items: list[dict], on_progress=None, poll_interval: float = BATCH_POLL_INTERVAL_SECONDS) -> list[str]:
+        """
+        Process a backlog of texts through the provider's offline batch API.
+
+        Each item is a dict with 'text', 'system_message' and an optional 'mode'. OpenAI and
+        Claude requests are submitted as one batch job, which is billed at a discount and
+        scheduled server-side, then polled until it finishes; this blocks for as long as
+        the provider takes. Other providers fall back to process_texts. on_progress, if
+        given, is called with (finished, total) after every poll. Items that fail keep
+        their original text.
+        """
+        if not items:
+            return []
+
+        api_type = self.config['api_type']
+        if not self.config['enabled'] or api_type not in ('openai', 'claude'):
+            return self._process_batch_items_directly(items)
+
+        requests_by_id = {}
+        for index, item in enumerate(items):
+            mode = self._resolve_mode(item['system_message'], item.get('mode'))
+            model = self._resolve_model(api_type, mode)
+            if api_type == 'openai' and self._should_use_responses_api(model):
+                ConfigManager.console_print(f"Model {model} is not batched; processing the backlog directly")
+                return self._process_batch_items_directly(items)
+            request_text = self._prepare_text_input(item['text'], mode)
+            requests_by_id[f"item-{index}"] = (request_text, item['system_message'], model, mode)
+
+        try:
+            if api_type == 'openai':
+                outputs = self._run_openai_batch(requests_by_id, on_progress, poll_interval)
+            else:
+                outputs = self._run_claude_batch(requests_by_id, on_progress, poll_interval)
+        except Exception as e:
+            ConfigManager.console_print(f"Error in {api_type} batch processing: {str(e)}")
+            outputs = {}
+
+        results = []
+        for index, item in enumerate(items):
+            custom_id = f"item-{index}"
+            request_text, _, _, mode = requests_by_id[custom_id]
+            processed_text = outputs.get(custom_id)
+            if not processed_text or (mode == 'cleanup' and processed_text == request_text):
+                results.append(item['text'])
+            else:
+                results.append(processed_text)
+        return results
+
+    def _process_batch_items_directly(self, items: list[dict]) -> list[str]:
+        return [
+            self.process_text(item['text'], item['system_message'], mode=item.get('mode'))
+            for item in items
+        ]
+
+    def _run_openai_batch(self, requests_by_id: dict, on_progress, poll_interval: float) -> dict[str, str]:
+        api_key = KeyringManager.get_api_key("openai_llm")
+        headers = {'Authorization': f'Bearer {api_key}'}
+
+        lines = [
+            json.dumps({
+                'custom_id': custom_id,
+                'method': 'POST',
+                'url': '/v1/chat/completions',
+                'body': self._build_openai_chat_payload(text, system_message, model, mode)
+            })
+            for custom_id, (text, system_message, model, mode) in requests_by_id.items()
+        ]
+        upload = self._send(
+            'post',
+            f"{OPENAI_API_BASE}/files",
+            headers=headers,
+            data={'purpose': 'batch'},
+            files={'file': ('batch.jsonl', "\n".join(lines).encode('utf-8'))}
+        )
+        upload.raise_for_status()
+
+        batch = self._send(
+            'post',
+            f"{OPENAI_API_BASE}/batches",
+            headers=headers,
+            json={
+                'input_file_id': upload.json()['id'],
+                'endpoint': '/v1/chat/completions',
+                'completion_window': '24h'
+            }
+        )
+        batch.raise_for_status()
+        batch_data = batch.json()
+        ConfigManager.console_print(f"Submitted OpenAI batch {batch_data['id']} with {len(lines)} requests")
+
+        while batch_data['status'] not in ('completed', 'failed', 'expired', 'cancelled'):
+            time.sleep(poll_interval)
+            status = self._send('get', f"{OPENAI_API_BASE}/batches/{batch_data['id']}", headers=headers)
+            status.raise_for_status()
+            batch_data = status.json()
+            if on_progress:
+                counts = batch_data.get('request_counts') or {}
+                on_progress(counts.get('completed', 0) + counts.get('failed', 0), len(lines))
+
+        if batch_data['status'] != 'completed' or not batch_data.get('output_file_id'):
+            ConfigManager.console_print(f"OpenAI batch {batch_data['id']} ended with status {batch_data['status']}")
+            return {}
+
+        output = self._send('get', f"{OPENAI_API_BASE}/files/{batch_data['output_file_id']}/content", headers=headers)
+        output.raise_for_status()
+
+        outputs = {}
+        for line in output.text.splitlines():
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            body = (record.get('response') or {}).get('body') or {}
+            choices = body.get('choices') or []
+            if not choices:
+                continue
+            content = choices[0]['message']['content']
+            mode = requests_by_id[record['custom_id']][3]
+            if mode == 'cleanup':
+                content = self._extract_cleanup_text_from_payload(content) or content
+            outputs[record['custom_id']] = content
+        return outputs
+
+    def _run_claude_batch(self, requests_by_id: dict, on_progress, poll_interval: float) -> dict[str, str]:
+        api_key = KeyringManager.get_api_key("claude")
+        headers = {
+            'anthropic-version': '2023-06-01',
+            'x-api-key': api_key,
+            'content-type': 'application/json'
+        }
+
+        batch = self._send(
+            'post',
+            CLAUDE_MESSAGE_BATCHES_ENDPOINT,
+            headers=headers,
+            json={
+                'requests': [
+                    {
+                        'custom_id': custom_id,
+                        'params': self._build_claude_payload(text, system_message, model, mode)
+                    }
+                    for custom_id, (text, system_message, model, mode) in requests_by_id.items()
+                ]
+            }
+        )
+        batch.raise_for_status()
+        batch_data = batch.json()
+        ConfigManager.console_print(f"Submitted Claude message batch {batch_data['id']} with {len(requests_by_id)} requests")
+
+        while batch_data['processing_status'] != 'ended':
+            time.sleep(poll_interval)
+            status = self._send('get', f"{CLAUDE_MESSAGE_BATCHES_ENDPOINT}/{batch_data['id']}", headers=headers)
+            status.raise_for_status()
+            batch_data = status.json()
+            if on_progress:
+                counts = batch_data.get('request_counts') or {}
+                on_progress(len(requests_by_id) - counts.get('processing', 0), len(requests_by_id))
+
+        results = self._send('get', batch_data['results_url'], headers=headers)
+        results.raise_for_status()
+
+        outputs = {}
+        for line in results.text.splitlines():
+            if not line.strip():
+                continue
+            record = json.loads(line)
+            result = record.get('result') or {}
+            if result.get('type') != 'succeeded':
+                continue
+            content = (result.get('message') or {}).get('content') or []
+            if content:
+                outputs[record['custom_id']] = content[0]['text']
+        return outputs
+
+    @classmethod
+    def _get_session(cls, url: str) -> requests.Session:
+        """Return the pooled session for the host of the given URL."""
+        host = urlsplit(url).netloc
+        session = cls._sessions.get(host)
+        if session is None:
+            with cls._sessions_lock:
+                session = cls._sessions.get(host)
+                if session is None:
+                    session = requests.Session()
+                    # Retry rate limits and overload the way the vendor SDKs do, POSTs included;
+                    # Retry-After is honoured and the last response is returned rather than raised.
+                    # A read timeout means the provider may already be generating (and billing) the
+                    # reply, so it is never retried
+                    adapter = HTTPAdapter(
+                        pool_connections=10,
+                        pool_maxsize=20,
+                        max_retries=Retry(
+                            total=3,
+                            read=0,
+                            backoff_factor=0.3,
+                            status_forcelist=RETRY_STATUS_CODES,
+                            allowed_methods=None,
+                            raise_on_status=False
+                        )
+                    )
+                    session.mount('https://', adapter)
+                    session.mount('http://', adapter)
+                    cls._sessions[host] = session
+        return session
+
+    def _send(self, method: str, url: str, **kwargs) -> requests.Response:
+        """
+        Send a request to the configured provider through its pooled session.
+
+        Applies REQUEST_TIMEOUT unless the caller sets its own timeout and feeds the outcome
+        into the provider's circuit breaker: transport errors and the overload/server error
+        statuses in RETRY_STATUS_CODES count as failures, any other response as success.
+        """
+        kwargs.setdefault('timeout', REQUEST_TIMEOUT)
+        api_type = self.config['api_type']
+        try:
+            response = getattr(self._get_session(url), method)(url, **kwargs)
+        except requests.RequestException:
+            self._record_request_outcome(api_type, succeeded=False)
+            raise
+        self._record_request_outcome(api_type, succeeded=response.status_code not in RETRY_STATUS_CODES)
+        return response
+
+    @classmethod
+    def _is_circuit_open(cls, api_type: str) -> bool:
+        with cls._breakers_lock:
+            breaker = cls._breakers.get(api_type)
+            return breaker is not None and time.monotonic() < breaker['open_until']
+
+    @classmethod
+    def _record_request_outcome(cls, api_type: str, succeeded: bool) -> None:
+        with cls._breakers_lock:
+            breaker = cls._breakers.setdefault(api_type, {'fail_count': 0, 'open_until': 0.0})
+            if succeeded:
+                breaker['fail_count'] = 0
+                breaker['open_until'] = 0.0
+                return
+            breaker['fail_count'] += 1
+            if breaker['fail_count'] >= CIRCUIT_BREAKER_THRESHOLD:
+                breaker['open_until'] = time.monotonic() + CIRCUIT_BREAKER_COOLOFF_SECONDS
+                ConfigManager.console_print(
+                    f"{api_type} failed {breaker['fail_count']} times in a row; "
+                    f"skipping requests for {CIRCUIT_BREAKER_COOLOFF_SECONDS} seconds"
+                )
+
+    def _resolve_model(self, api_type: str, mode: str) -> str | None:
+        """Return the configured model for the mode, falling back to the provider default."""
+        # Determine which model to use based on the resolved mode
+        if mode == "instruction":
+            model = self._instruction_model
+            ConfigManager.console_print("Using instruction mode")
+        else:
+            model = self._cleanup_model
+            ConfigManager.console_print("Using cleanup mode")
+        
+        if not model:
+            if api_type == 'ollama':
+                model = DEFAULT_MODELS['ollama'][mode]
+            else:
+                model = DEFAULT_MODELS.get(api_type)
+            ConfigManager.console_print(f"No model specified, using default {mode} model for {api_type}: {model}")
+
+        return model
+
+    def _resolve_mode(self, system_message: str, explicit_mode: str | None) -> str:
         if explicit_mode in ('cleanup', 'instruction'):
             return explicit_mode
 
-        instruction_message = ConfigManager.get_config_value("llm_post_processing", "instruction_system_message")
+        instruction_message = self._instruction_system_message
         if system_message and instruction_message and system_message == instruction_message:
             return "instruction"
         return "cleanup"
 
+    @staticmethod
+    def _estimate_max_tokens(text: str, mode: str) -> int:
+        """
+        Bound the output length to what the mode can plausibly need.
+
+        A cleanup rewrites the transcript, so its output is about as long as the request text.
+        Two characters per token over-counts for most languages, and the slack covers the
+        JSON wrapper of structured output. Instruction replies keep the full default budget.
+        """
+        if mode != 'cleanup':
+            return DEFAULT_MAX_OUTPUT_TOKENS
+        return min(DEFAULT_MAX_OUTPUT_TOKENS, len(text) // 2 + 256)
+
+    @staticmethod
+    def _prompt_cache_key(mode: str) -> str:
+        """Stable OpenAI routing key so requests sharing a system prompt hit the same prompt cache."""
+        return f"whisper-writer-{mode}"
+
     @staticmethod
     def _prepare_text_input(text: str, mode: str) -> str:
         if mode != 'cleanup':
@@ -259,7 +963,7 @@ class LLMProcessor:
         if timeout is not None:
             request_kwargs['timeout'] = timeout
 
-        response = requests.post(url, **request_kwargs)
+        response = self._send('post', url, **request_kwargs)
         supported_efforts = self._extract_supported_reasoning_efforts(response)
         current_effort = (payload.get('reasoning') or {}).get('effort')
 
@@ -277,7 +981,7 @@ class LLMProcessor:
                 }
                 if timeout is not None:
                     retry_kwargs['timeout'] = timeout
-                return requests.post(url, **retry_kwargs)
+                return self._send('post', url, **retry_kwargs)
 
         return response
 
@@ -404,34 +1108,64 @@ class LLMProcessor:
 
         return None
         
-    def _process_claude(self, text: str, system_message: str, model: str, mode: str) -> str:
-        api_key = KeyringManager.get_api_key("claude")
-        ConfigManager.console_print(f"Using Claude API key: {'[SET]' if api_key else '[NOT SET]'}")
-        ConfigManager.console_print(f"Using Claude model: {model}")
-        
-        headers = {
-            'anthropic-version': '2023-06-01',
-            'x-api-key': api_key,
-            'content-type': 'application/json'
+    def _build_claude_payload(self, text: str, system_message: str, model: str, mode: str) -> dict:
+        data = {
+            'model': model,
+            'messages': [
+                {'role': 'user', 'content': text}
+            ],
+            'max_tokens': self._estimate_max_tokens(text, mode),
+            # The system prompt is identical across requests; mark it cacheable so
+            # Anthropic serves it from the prompt cache instead of reprocessing it
+            'system': [
+                {'type': 'text', 'text': system_message, 'cache_control': {'type': 'ephemeral'}}
+            ],
         }
-        
+
+        temperature = self._get_temperature_for_mode(model, mode)
+        if temperature is not None:
+            data['temperature'] = temperature
+        return data
+
+    def _build_openai_chat_payload(self, text: str, system_message: str, model: str, mode: str) -> dict:
         data = {
             'model': model,
             'messages': [
+                {'role': 'system', 'content': system_message},
                 {'role': 'user', 'content': text}
             ],
-            'max_tokens': 4096,
-            'system': system_message,
+            'prompt_cache_key': self._prompt_cache_key(mode)
         }
+        if mode == 'cleanup':
+            data['max_completion_tokens'] = self._estimate_max_tokens(text, mode)
 
         temperature = self._get_temperature_for_mode(model, mode)
         if temperature is not None:
             data['temperature'] = temperature
+
+        if mode == 'cleanup':
+            data['response_format'] = self._cleanup_chat_response_format()
+        return data
+
+    def _process_claude(self, text: str, system_message: str, model: str, mode: str) -> str:
+        api_key = KeyringManager.get_api_key("claude")
+        ConfigManager.console_print(f"Using Claude API key: {'[SET]' if api_key else '[NOT SET]'}")
+        ConfigManager.console_print(f"Using Claude model: {model}")
+        
+        headers = {
+            'anthropic-version': '2023-06-01',
+            'x-api-key': api_key,
+            'content-type': 'application/json'
+        }
+        
+        data = self._build_claude_payload(text, system_message, model, mode)
         
         try:
             ConfigManager.console_print(f"Sending request to Claude API with model {model}")
-            response = requests.post(
-                self.config['endpoint'],
+            endpoint = self.config['endpoint']
+            response = self._send(
+                'post',
+                endpoint,
                 headers=headers,
                 json=data
             )
@@ -440,11 +1174,19 @@ class LLMProcessor:
             
             if response.status_code == 200:
                 response_data = response.json()
-                ConfigManager.console_print(f"Claude API response: {response_data}", verbose=True)
+                if ConfigManager.get_verbose_mode():
+                    ConfigManager.console_print(f"Claude API response: {response_data}", verbose=True)
+                usage = response_data.get('usage') or {}
+                ConfigManager.console_print(
+                    f"Claude prompt cache: read={usage.get('cache_read_input_tokens', 0)}, "
+                    f"created={usage.get('cache_creation_input_tokens', 0)}",
+                    verbose=True
+                )
                 
                 if 'content' in response_data and len(response_data['content']) > 0:
                     processed_text = response_data['content'][0]['text']
-                    ConfigManager.console_print(f"Processed text from Claude model {model}: {processed_text}", verbose=True)
+                    if ConfigManager.get_verbose_mode():
+                        ConfigManager.console_print(f"Processed text from Claude model {model}: {processed_text}", verbose=True)
                     return processed_text
                 
                 ConfigManager.console_print(f"Unexpected Claude API response structure: {response_data}", verbose=True)
@@ -476,24 +1218,13 @@ class LLMProcessor:
             'Content-Type': 'application/json'
         }
         
-        data = {
-            'model': model,
-            'messages': [
-                {'role': 'system', 'content': system_message},
-                {'role': 'user', 'content': text}
-            ]
-        }
-
-        temperature = self._get_temperature_for_mode(model, mode)
-        if temperature is not None:
-            data['temperature'] = temperature
-
-        if mode == 'cleanup':
-            data['response_format'] = self._cleanup_chat_response_format()
+        data = self._build_openai_chat_payload(text, system_message, model, mode)
         
         try:
-            response = requests.post(
-                'https://api.openai.com/v1/chat/completions',
+            endpoint = 'https://api.openai.com/v1/chat/completions'
+            response = self._send(
+                'post',
+                endpoint,
                 headers=headers,
                 json=data
             )
@@ -509,7 +1240,8 @@ class LLMProcessor:
                         if cleaned:
                             ConfigManager.console_print("OpenAI API request successful (structured output)", verbose=True)
                             return cleaned
-                    ConfigManager.console_print(f"Processed text from OpenAI API: {processed_text}", verbose=True)
+                    if ConfigManager.get_verbose_mode():
+                        ConfigManager.console_print(f"Processed text from OpenAI API: {processed_text}", verbose=True)
                     return processed_text
                 
                 ConfigManager.console_print(f"Unexpected OpenAI API response structure: {response_data}", verbose=True)
@@ -551,6 +1283,7 @@ class LLMProcessor:
             "instructions": system_message,
             "input": text,
             "max_output_tokens": 1024,
+            "prompt_cache_key": self._prompt_cache_key(mode),
         }
 
         reasoning_config = self._build_reasoning_config(model)
@@ -640,7 +1373,7 @@ class LLMProcessor:
     def _process_gemini(self, text: str, system_message: str, model: str, mode: str) -> str:
         api_key = KeyringManager.get_api_key("gemini")
         ConfigManager.console_print(f"Using Gemini API key: {'[SET]' if api_key else '[NOT SET]'}")
-        if genai is None:
+        if _lazy_import('google.generativeai') is None:
             ConfigManager.console_print("Gemini SDK not available. Please install 'google-generativeai' or choose a different API.")
             return text
         
@@ -663,16 +1396,19 @@ class LLMProcessor:
                 'topP': 1
             }
         }
+        if mode == 'cleanup':
+            data['generationConfig']['maxOutputTokens'] = self._estimate_max_tokens(text, mode)
 
         temperature = self._get_temperature_for_mode(model, mode)
         if temperature is not None:
             data['generationConfig']['temperature'] = temperature
         
         try:
-            endpoint = f"https://generativelanguage.googleapis.com/v1beta/models/{model}:generateContent?key={api_key}"
+            endpoint = f"{GEMINI_API_BASE}/models/{model}:generateContent?key={api_key}"
             ConfigManager.console_print(f"Using Gemini model: {model}")
             
-            response = requests.post(
+            response = self._send(
+                'post',
                 endpoint,
                 headers=headers,
                 json=data
@@ -687,7 +1423,8 @@ class LLMProcessor:
                     'content' in response_data['candidates'][0] and
                     'parts' in response_data['candidates'][0]['content']):
                     processed_text = response_data['candidates'][0]['content']['parts'][0]['text']
-                    ConfigManager.console_print(f"Processed text from Gemini: {processed_text}", verbose=True)
+                    if ConfigManager.get_verbose_mode():
+                        ConfigManager.console_print(f"Processed text from Gemini: {processed_text}", verbose=True)
                     return processed_text
                 
                 ConfigManager.console_print(f"Unexpected Gemini API response structure: {response_data}", verbose=True)
@@ -699,47 +1436,63 @@ class LLMProcessor:
         
         return text
         
+    @classmethod
+    def _get_ollama_models(cls, ollama, required_model: str | None = None) -> set[str]:
+        """
+        Return the installed Ollama model names.
+
+        A listing younger than the TTL that already contains required_model is reused, so
+        the local service is only queried on the first request, after the TTL, or when the
+        model has not been seen yet. Without required_model the service is always queried.
+        """
+        cached = cls._ollama_models_cache
+        if (cached and required_model is not None and required_model in cached[1]
+                and time.monotonic() - cached[0] < OLLAMA_MODELS_CACHE_TTL_SECONDS):
+            return cached[1]
+
+        models_response = ollama.list()
+        available_models = set()
+
+        ConfigManager.console_print("\n=== Available Ollama Models ===", verbose=True)
+        for model_info in getattr(models_response, 'models', None) or []:
+            model_name = getattr(model_info, 'model', '').replace(':latest', '')
+            details = getattr(model_info, 'details', None)
+            available_models.add(model_name)
+
+            # Format model details
+            model_details = []
+            if details:
+                if hasattr(details, 'parameter_size'):
+                    model_details.append(f"Size: {details.parameter_size}")
+                if hasattr(details, 'family'):
+                    model_details.append(f"Family: {details.family}")
+                if hasattr(details, 'quantization_level'):
+                    model_details.append(f"Quantization: {details.quantization_level}")
+
+            ConfigManager.console_print(f"- {model_name}", verbose=True)
+            if model_details:
+                ConfigManager.console_print(f"  ({', '.join(model_details)})", verbose=True)
+        ConfigManager.console_print("===========================\n", verbose=True)
+
+        cls._ollama_models_cache = (time.monotonic(), available_models)
+        return available_models
+
     def _process_ollama(self, text: str, system_message: str, model: str, mode: str) -> str:
         """Process text through local Ollama model using the Python client."""
         if not model:
             ConfigManager.console_print("Error: No model specified")
             return text
             
-        if not HAS_OLLAMA:
+        ollama = _lazy_import('ollama')
+        if ollama is None:
             ConfigManager.console_print("Ollama not available. Please install the Ollama package or choose a different API.")
             return text
             
         try:
-            # Check if Ollama service is running and get available models
-            models_response = ollama.list()
-            
-            ConfigManager.console_print("\n=== Available Ollama Models ===")
-            if hasattr(models_response, 'models'):
-                available_models = []
-                for model_info in models_response.models:
-                    model_name = getattr(model_info, 'model', '').replace(':latest', '')
-                    details = getattr(model_info, 'details', None)
-                    
-                    available_models.append(model_name)
-                    
-                    # Format model details
-                    model_details = []
-                    if details:
-                        if hasattr(details, 'parameter_size'):
-                            model_details.append(f"Size: {details.parameter_size}")
-                        if hasattr(details, 'family'):
-                            model_details.append(f"Family: {details.family}")
-                        if hasattr(details, 'quantization_level'):
-                            model_details.append(f"Quantization: {details.quantization_level}")
-                    
-                    ConfigManager.console_print(f"- {model_name}")
-                    if model_details:
-                        ConfigManager.console_print(f"  ({', '.join(model_details)})")
-                
-                ConfigManager.console_print("===========================\n")
-                
-                if model not in available_models:
-                    ConfigManager.console_print(f"Warning: Selected model '{model}' not found in available models")
+            # Check that the Ollama service is running and has the model; reuses a recent listing
+            available_models = self._get_ollama_models(ollama, model)
+            if model not in available_models:
+                ConfigManager.console_print(f"Warning: Selected model '{model}' not found in available models")
                 
         except Exception as e:
             ConfigManager.console_print(f"Error checking Ollama service: {str(e)}")
@@ -786,7 +1539,8 @@ class LLMProcessor:
 
     def _process_groq(self, text: str, system_message: str, model: str, mode: str) -> str:
         """Process text through Groq's API."""
-        if Groq is None:
+        groq = _lazy_import('groq')
+        if groq is None:
             ConfigManager.console_print("Groq SDK not available. Please install 'groq' package or choose a different API.")
             return text
 
@@ -794,7 +1548,7 @@ class LLMProcessor:
         ConfigManager.console_print(f"Using Groq API key: {'[SET]' if api_key else '[NOT SET]'}")
         
         try:
-            client = Groq(api_key=api_key)
+            client = groq.Groq(api_key=api_key)
             
             ConfigManager.console_print(f"Using Groq model: {model}")
             
@@ -810,12 +1564,14 @@ class LLMProcessor:
                     }
                 ],
                 model=model,
+                **({"max_tokens": self._estimate_max_tokens(text, mode)} if mode == 'cleanup' else {}),
                 **({"temperature": temperature} if (temperature := self._get_temperature_for_mode(model, mode)) is not None else {})
             )
             
             if response and hasattr(response.choices[0].message, 'content'):
                 processed_text = response.choices[0].message.content.strip()
-                ConfigManager.console_print(f"Processed text from Groq: {processed_text}", verbose=True)
+                if ConfigManager.get_verbose_mode():
+                    ConfigManager.console_print(f"Processed text from Groq: {processed_text}", verbose=True)
                 return processed_text
             
             ConfigManager.console_print("No valid response from Groq API")
@@ -887,7 +1643,8 @@ class LLMProcessor:
         try:
             ConfigManager.console_print(f"Sending request to Azure OpenAI LLM API using deployment {deployment_name}...")
             
-            response = requests.post(
+            response = self._send(
+                'post',
                 base_url,
                 headers=headers,
                 json=data
@@ -909,7 +1666,8 @@ class LLMProcessor:
 
                     processed_text = content
                     self._safe_console_print("Azure OpenAI LLM API request successful")
-                    self._safe_console_print(f"Processed text: {processed_text}", verbose=True)
+                    if ConfigManager.get_verbose_mode():
+                        self._safe_console_print(f"Processed text: {processed_text}", verbose=True)
                     return processed_text
                 else:
                     self._safe_console_print(f"Unexpected Azure OpenAI LLM API response structure: {response_data}", verbose=True)
@@ -997,90 +1755,124 @@ class LLMProcessor:
         except Exception:
             return False
     
-    def get_available_models(self, api_type):
-        """Get available models for the specified API type."""
+    def get_available_models(self, api_type, force_refresh=False):
+        """Get available models for the specified API type, reusing a recent result unless force_refresh is set."""
+        cached = self._models_cache.get(api_type)
+        if cached and not force_refresh and time.monotonic() - cached[0] < MODELS_CACHE_TTL_SECONDS:
+            ConfigManager.console_print(f"Using cached {api_type} models", verbose=True)
+            return list(cached[1])
+
+        models = self._fetch_available_models(api_type)
+        if models:
+            self._models_cache[api_type] = (time.monotonic(), list(models))
+        return models
+
+    def get_all_available_models(self, api_types=None, timeout: float = MODELS_FETCH_TIMEOUT_SECONDS) -> dict[str, list[str]]:
+        """
+        Get available models for several API types at once, all providers by default.
+
+        The providers are queried concurrently over the pooled sessions, so the wall time is
+        that of the slowest provider; one that has not answered within the timeout maps to [].
+        """
+        api_types = list(api_types or self._MODEL_LISTERS)
+        results = {api_type: [] for api_type in api_types}
+        executor = ThreadPoolExecutor(max_workers=max(1, len(api_types)))
+        futures = {executor.submit(self.get_available_models, api_type): api_type for api_type in api_types}
+        try:
+            for future in as_completed(futures, timeout=timeout):
+                results[futures[future]] = future.result()
+        except FuturesTimeoutError:
+            pending = [api_type for future, api_type in futures.items() if not future.done()]
+            ConfigManager.console_print(f"Timed out fetching models for: {', '.join(pending)}")
+        finally:
+            # A straggler finishes in the background and still fills the models cache
+            executor.shutdown(wait=False)
+        return results
+
+    def _fetch_available_models(self, api_type):
+        """Fetch the model list for the specified API type from the provider."""
         ConfigManager.console_print(f"\n=== Fetching models for API type: {api_type} ===")
         
         # Validate API type early
-        if api_type not in ['claude', 'openai', 'gemini', 'ollama', 'groq']:
+        lister_name = self._MODEL_LISTERS.get(api_type)
+        if lister_name is None:
             ConfigManager.console_print(f"Unsupported API type: {api_type}")
             return []
         
         # Get API key early for all non-Ollama types
+        api_key = None
         if api_type != 'ollama':
-            api_key_map = {
-                'claude': 'claude',
-                'openai': 'openai_llm',
-                'gemini': 'gemini',
-                'groq': 'groq'
-            }
-            api_key = KeyringManager.get_api_key(api_key_map[api_type])
+            api_key = KeyringManager.get_api_key(API_KEY_SERVICES[api_type])
             if not api_key:
                 ConfigManager.console_print(f"No {api_type} API key found")
                 return []
         
         try:
-            if api_type == 'groq':
-                client = Groq(api_key=api_key)
-                
-                ConfigManager.console_print("Making request to Groq models endpoint...")
-                models_response = client.models.list()
-                
-                # Extract model IDs from the response
-                models = [model.id for model in models_response.data]
-                ConfigManager.console_print(f"Found Groq models: {models}")
-                return models
-
-            elif api_type == 'claude':
-                headers = {
-                    'anthropic-version': '2023-06-01',
-                    'x-api-key': api_key
-                }
-                
-                ConfigManager.console_print("Making request to Claude models endpoint...")
-                response = requests.get('https://api.anthropic.com/v1/models', headers=headers)
-                ConfigManager.console_print(f"Claude API response status: {response.status_code}")
-                
-                if response.status_code == 200:
-                    models_data = response.json()
-                    models = [model['id'] for model in models_data.get('data', [])]
-                    ConfigManager.console_print(f"Found Claude models: {models}")
-                    return models
-                ConfigManager.console_print(f"Claude API error: {response.status_code} - {response.text}")
-                
-            elif api_type == 'openai':
-                import openai
-                openai.api_key = api_key
-                
-                ConfigManager.console_print("Fetching OpenAI models...")
-                model_list_response = openai.Model.list()
-                models = [model.id for model in model_list_response.data]
-                ConfigManager.console_print(f"Found OpenAI models: {models}")
-                return models
-                
-            elif api_type == 'gemini':
-                if genai is None:
-                    return []
-                genai.configure(api_key=api_key)
-                models = [m.name for m in genai.list_models() 
-                         if 'generateContent' in m.supported_generation_methods]
-                ConfigManager.console_print(f"Found Gemini models: {models}")
-                return models
-                
-            elif api_type == 'ollama':
-                if not HAS_OLLAMA:
-                    ConfigManager.console_print("Ollama not available")
-                    return []
-                
-                response = requests.get('http://localhost:11434/api/models')
-                if response.status_code == 200:
-                    models_data = response.json()
-                    models = [model['name'] for model in models_data.get('models', [])]
-                    ConfigManager.console_print(f"Found Ollama models: {models}")
-                    return models
-                ConfigManager.console_print(f"Ollama API error: {response.status_code} - {response.text}")
-                
+            return getattr(self, lister_name)(api_key)
         except Exception as e:
             ConfigManager.console_print(f"Error fetching {api_type} models: {str(e)}")
         
-        return []
\ No newline at end of file
+        return []
+
+    def _list_groq_models(self, api_key: str) -> list[str]:
+        groq = _lazy_import('groq')
+        if groq is None:
+            return []
+        client = groq.Groq(api_key=api_key)
+        
+        ConfigManager.console_print("Making request to Groq models endpoint...")
+        models_response = client.models.list()
+        
+        # Extract model IDs from the response
+        models = [model.id for model in models_response.data]
+        ConfigManager.console_print(f"Found Groq models: {models}")
+        return models
+
+    def _list_claude_models(self, api_key: str) -> list[str]:
+        headers = {
+            'anthropic-version': '2023-06-01',
+            'x-api-key': api_key
+        }
+        
+        ConfigManager.console_print("Making request to Claude models endpoint...")
+        models_url = 'https://api.anthropic.com/v1/models'
+        response = self._get_session(models_url).get(models_url, headers=headers, timeout=REQUEST_TIMEOUT)
+        ConfigManager.console_print(f"Claude API response status: {response.status_code}")
+        
+        if response.status_code == 200:
+            models_data = response.json()
+            models = [model['id'] for model in models_data.get('data', [])]
+            ConfigManager.console_print(f"Found Claude models: {models}")
+            return models
+        ConfigManager.console_print(f"Claude API error: {response.status_code} - {response.text}")
+        return []
+
+    def _list_openai_models(self, api_key: str) -> list[str]:
+        import openai
+        openai.api_key = api_key
+        
+        ConfigManager.console_print("Fetching OpenAI models...")
+        model_list_response = openai.Model.list()
+        models = [model.id for model in model_list_response.data]
+        ConfigManager.console_print(f"Found OpenAI models: {models}")
+        return models
+
+    def _list_gemini_models(self, api_key: str) -> list[str]:
+        genai = _lazy_import('google.generativeai')
+        if genai is None:
+            return []
+        genai.configure(api_key=api_key)
+        models = [m.name for m in genai.list_models() 
+                 if 'generateContent' in m.supported_generation_methods]
+        ConfigManager.console_print(f"Found Gemini models: {models}")
+        return models
+
+    def _list_ollama_models(self, api_key: str | None) -> list[str]:
+        ollama = _lazy_import('ollama')
+        if ollama is None:
+            ConfigManager.console_print("Ollama not available")
+            return []
+        
+        models = sorted(self._get_ollama_models(ollama))
+        ConfigManager.console_print(f"Found Ollama models: {models}")
+        return models
@@ -0,0 +1,47 @@
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+
+from utils import ConfigManager
+
+
+class LLMWorkerSignals(QObject):
+    """
+    Signals of an LLMWorker; QRunnable is not a QObject and cannot declare them itself.
+
+    finished: Emits the original text, the LLM output (None if the request raised) and the processing mode
+    """
+
+    finished = pyqtSignal(str, object, str)
+
+
+class LLMWorker(QRunnable):
+    """
+    Runs one LLM post-processing request on a thread pool thread, so the Qt event loop
+    stays responsive for the full LLM round-trip.
+    """
+
+    def __init__(self, llm_processor, text, system_message, mode):
+        super().__init__()
+        self.llm_processor = llm_processor
+        self.text = text
+        self.system_message = system_message
+        self.mode = mode
+        self.signals = LLMWorkerSignals()
+
+    def run(self):
+        """Process the text and emit the result."""
+        try:
+            processed_text = self.llm_processor.process_text(self.text, self.system_message, mode=self.mode)
+        except Exception as e:
+            ConfigManager.console_print(f"Error processing text through LLM: {str(e)}")
+            processed_text = None
+        self.signals.finished.emit(self.text, processed_text, self.mode)
+
+
+def create_llm_worker_pool():
+    """
+    Create the pool LLM workers run on. It has a single thread, so requests run one at a
+    time and their results are typed in the order the dictations finished.
+    """
+    pool = QThreadPool()
+    pool.setMaxThreadCount(1)
+    return pool
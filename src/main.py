@@ -1,10 +1,10 @@
 import os
 import sys
-import time
 import argparse
+import threading
 from audioplayer import AudioPlayer
 from pynput.keyboard import Controller, Key
-from PyQt5.QtCore import QObject, QProcess
+from PyQt5.QtCore import QObject, QProcess, QTimer
 from PyQt5.QtGui import QIcon
 from PyQt5.QtWidgets import QApplication, QSystemTrayIcon, QMenu, QAction, QMessageBox, QLineEdit
 import win32clipboard
@@ -15,10 +15,22 @@ from result_thread import ResultThread
 from ui.main_window import MainWindow
 from ui.settings_window import SettingsWindow
 from ui.status_window import StatusWindow
-from transcription import create_local_model
+from transcription import create_local_model, warm_up_local_model
 from input_simulation import InputSimulator
 from utils import ConfigManager
 from llm_processor import LLMProcessor
+from llm_worker import LLMWorker, create_llm_worker_pool
+if sys.platform == 'win32':
+    import winsound
+
+# mode -> (config key of the system message, config key of the file whose contents are appended to it)
+SYSTEM_MESSAGE_CONFIG_KEYS = {
+    'cleanup': ('system_prompt', 'system_prompt_file_path'),
+    'instruction': ('instruction_system_message', 'instruction_system_message_file_path'),
+    'text_cleanup': ('text_cleanup_system_message', 'text_cleanup_system_message_file_path'),
+}
+# System messages can run to several KB; verbose logs only show their head
+SYSTEM_MESSAGE_LOG_PREVIEW_CHARS = 200
 
 
 class WhisperWriterApp(QObject):
@@ -68,15 +80,40 @@ class WhisperWriterApp(QObject):
         model_options = ConfigManager.get_config_section('model_options')
         model_path = model_options.get('local', {}).get('model_path')
         self.local_model = create_local_model() if not model_options.get('use_api') else None
+        if self.local_model:
+            threading.Thread(target=warm_up_local_model, args=(self.local_model,), daemon=True).start()
 
         self.result_thread = None
-        self.llm_processor = LLMProcessor() if ConfigManager.get_config_value('llm_post_processing', 'enabled') else None
+        self.beep_path = os.path.join('assets', 'beep.wav')
+        # Created on the first beep elsewhere, then kept so the WAV file is only loaded once
+        self.beep_player = None
+        self._llm_processor = None
+        self._llm_processor_lock = threading.Lock()
+        self.llm_worker_pool = create_llm_worker_pool()
+        # mode -> (revision, final system message); see _get_system_message
+        self._system_messages = {}
+        if ConfigManager.get_config_value('llm_post_processing', 'enabled'):
+            # Built once the event loop is running, so the key listener starts first; a hotkey that
+            # needs the processor before then creates it on demand
+            QTimer.singleShot(0, self._warm_up_llm_processor)
 
         if not ConfigManager.get_config_value('misc', 'hide_status_window'):
             self.status_window = StatusWindow()
 
         self.create_tray_icon()
 
+    @property
+    def llm_processor(self):
+        """The LLM processor, created on first use; None when LLM post-processing is disabled."""
+        if self._llm_processor is None and ConfigManager.get_config_value('llm_post_processing', 'enabled'):
+            with self._llm_processor_lock:
+                if self._llm_processor is None:
+                    self._llm_processor = LLMProcessor()
+        return self._llm_processor
+
+    def _warm_up_llm_processor(self):
+        self.llm_processor.warm_up()
+
     def create_tray_icon(self):
         """
         Create the system tray icon and its context menu.
@@ -149,17 +186,10 @@ class WhisperWriterApp(QObject):
 
     def on_activation_with_llm_cleanup(self):
         """Activation with LLM cleanup based on recording mode"""
-        recording_mode = ConfigManager.get_config_value('recording_options', 'recording_mode')
-        # Enable LLM for both press_to_toggle and hold_to_record modes
-        # self.use_llm = recording_mode in ('press_to_toggle', 'hold_to_record')
         self.on_activation(use_llm=True, is_instruction_mode=False)
 
     def on_activation_with_llm_instruction(self):
         """Activation with LLM instruction processing based on recording mode"""
-        recording_mode = ConfigManager.get_config_value('recording_options', 'recording_mode')
-        # Enable LLM for both press_to_toggle and hold_to_record modes
-        # self.use_llm = recording_mode in ('press_to_toggle', 'hold_to_record')
-        """Activation with LLM instruction processing"""
         self.on_activation(use_llm=True, is_instruction_mode=True)
 
     def on_deactivation(self, use_llm=False, is_instruction_mode=False):
@@ -172,12 +202,13 @@ class WhisperWriterApp(QObject):
         # Set the flags just like in on_activation
         self.use_llm = use_llm
         self.is_instruction_mode = is_instruction_mode
+        recording_mode = ConfigManager.get_config_value('recording_options', 'recording_mode')
         
         ConfigManager.console_print(f"Deactivation called - use_llm: {use_llm}, is_instruction_mode: {is_instruction_mode}", verbose=True)
-        ConfigManager.console_print(f"Recording mode: {ConfigManager.get_config_value('recording_options', 'recording_mode')}", verbose=True)
+        ConfigManager.console_print(f"Recording mode: {recording_mode}", verbose=True)
         ConfigManager.console_print(f"Result thread running: {self.result_thread and self.result_thread.isRunning()}", verbose=True)
         
-        if ConfigManager.get_config_value('recording_options', 'recording_mode') == 'hold_to_record':
+        if recording_mode == 'hold_to_record':
             if self.result_thread and self.result_thread.isRunning():
                 ConfigManager.console_print("Stopping recording...", verbose=True)
                 self.result_thread.stop_recording()
@@ -213,6 +244,16 @@ class WhisperWriterApp(QObject):
         if self.result_thread and self.result_thread.isRunning():
             self.result_thread.stop()
 
+    def play_completion_sound(self):
+        """Play the completion beep without blocking the caller."""
+        if sys.platform == 'win32':
+            # winsound cannot play from memory asynchronously; the system caches the file between plays
+            winsound.PlaySound(self.beep_path, winsound.SND_FILENAME | winsound.SND_ASYNC | winsound.SND_NODEFAULT)
+        else:
+            if self.beep_player is None:
+                self.beep_player = AudioPlayer(self.beep_path)
+            self.beep_player.play(block=False)
+
     def _pause_key_listener_for_processing(self):
         """Pause the key listener during typing/cleanup work and report whether it was running."""
         if not getattr(self, 'key_listener', None):
@@ -224,91 +265,123 @@ class WhisperWriterApp(QObject):
         if should_resume and getattr(self, 'key_listener', None):
             self.key_listener.start()
 
+    def _get_system_message(self, mode_name):
+        """Return the final system message for a mode, rebuilding it only when its setting or file changes."""
+        message_key, file_path_key = SYSTEM_MESSAGE_CONFIG_KEYS[mode_name]
+        base_message = ConfigManager.get_config_value("llm_post_processing", message_key) or ""
+        file_path = ConfigManager.get_config_value("llm_post_processing", file_path_key)
+        file_stamp = None
+        if file_path:
+            try:
+                stat = os.stat(file_path)
+                file_stamp = (stat.st_mtime_ns, stat.st_size)
+            except OSError:
+                pass
+
+        revision = (base_message, file_path, file_stamp)
+        cached = self._system_messages.get(mode_name)
+        if cached and cached[0] == revision:
+            return cached[1]
+
+        system_message = self._build_system_message(mode_name, base_message, file_path, file_stamp is not None)
+        self._system_messages[mode_name] = (revision, system_message)
+        return system_message
+
+    def _build_system_message(self, mode_name, base_message, file_path, file_exists):
+        """Join a mode's system message from settings with the contents of its file, if any."""
+        system_message = base_message.strip()
+        log_prompt = mode_name == "instruction" or ConfigManager.should_log_cleanup_prompt()
+
+        if log_prompt and ConfigManager.get_verbose_mode():
+            ConfigManager.console_print(
+                f"Retrieved {mode_name} base message from settings: "
+                f"{system_message[:SYSTEM_MESSAGE_LOG_PREVIEW_CHARS]}",
+                verbose=True,
+            )
+        else:
+            ConfigManager.console_print(f"Retrieved {mode_name} base message from settings", verbose=True)
+
+        if not file_path:
+            ConfigManager.console_print("No file path set, using only the system message from settings")
+        elif not file_exists:
+            ConfigManager.console_print(f"File path set but file not found: {file_path}, using only the system message from settings")
+        else:
+            try:
+                with open(file_path, 'r', encoding='utf-8') as file:
+                    file_content = file.read().strip()
+                if file_content:  # Only append if file has content
+                    system_message = f"{system_message}\n\n{file_content}" if system_message else file_content
+                    ConfigManager.console_print(f"Added file content from {file_path}", verbose=True)
+            except Exception as e:
+                ConfigManager.console_print(f"Error reading {mode_name} system message file: {str(e)}")
+
+        if system_message:
+            if log_prompt and ConfigManager.get_verbose_mode():
+                ConfigManager.console_print(
+                    f"Final {mode_name} system message ({len(system_message)} chars): "
+                    f"{system_message[:SYSTEM_MESSAGE_LOG_PREVIEW_CHARS]}",
+                    verbose=True,
+                )
+            else:
+                ConfigManager.console_print(f"Final {mode_name} system message prepared for LLM", verbose=True)
+        return system_message
+
     def on_transcription_complete(self, result):
         """Process transcription with or without LLM based on activation type."""
+        recording_mode = ConfigManager.get_config_value('recording_options', 'recording_mode')
+        if self.use_llm and self.llm_processor and recording_mode in ('press_to_toggle', 'hold_to_record', 'continuous', 'voice_activity_detection'):
+            try:
+                mode_name = "instruction" if self.is_instruction_mode else "cleanup"
+                system_message = self._get_system_message(mode_name)
+                if not system_message:
+                    ConfigManager.console_print("Warning: No system message found, using original transcription")
+                else:
+                    # The LLM round-trip runs on the thread pool; the result is typed in on_llm_processing_complete
+                    worker = LLMWorker(self.llm_processor, result, system_message, mode_name)
+                    worker.signals.finished.connect(self.on_llm_processing_complete)
+                    self.llm_worker_pool.start(worker)
+                    return
+                
+            except Exception as e:
+                ConfigManager.console_print(f"Error processing text through LLM: {str(e)}")
+                ConfigManager.console_print("Falling back to original transcription after LLM processing error.")
+
+        self._type_transcription_result(result)
+
+    def on_llm_processing_complete(self, original_result, processed_result, mode_name):
+        """Pick the LLM output or the original transcription once the LLM worker finishes, then type it."""
+        result = original_result
+        if processed_result is not None and ConfigManager.get_verbose_mode():
+            ConfigManager.console_print(f"Cleanup raw output: {processed_result}", verbose=True)
+        if processed_result:
+            candidate_result = processed_result.strip()
+            if mode_name == "cleanup":
+                rejection_reason = LLMProcessor.get_cleanup_rejection_reason(original_result, candidate_result)
+                if rejection_reason:
+                    ConfigManager.console_print(
+                        f"Cleanup output rejected; falling back to original transcription ({rejection_reason})."
+                    )
+                else:
+                    result = candidate_result
+            else:
+                result = candidate_result
+
+            if result == original_result:
+                ConfigManager.console_print("Cleanup output matches original transcription", verbose=True)
+            else:
+                ConfigManager.console_print("Cleanup output differs from original transcription", verbose=True)
+        else:
+            ConfigManager.console_print("LLM processing failed or returned empty output, using original transcription")
+
+        self._type_transcription_result(result)
+
+    def _type_transcription_result(self, result):
+        """Type the final transcription result, then continue recording in continuous mode."""
         listener_was_running = False
         try:
             # Temporarily disable key listener
             listener_was_running = self._pause_key_listener_for_processing()
 
-            recording_mode = ConfigManager.get_config_value('recording_options', 'recording_mode')
-            if self.use_llm and self.llm_processor and recording_mode in ('press_to_toggle', 'hold_to_record', 'continuous', 'voice_activity_detection'):
-                try:
-                    # Get the system message based on the mode
-                    if self.is_instruction_mode:
-                        base_message = ConfigManager.get_config_value("llm_post_processing", "instruction_system_message")
-                        file_path = ConfigManager.get_config_value("llm_post_processing", "instruction_system_message_file_path")
-                        mode_name = "instruction"
-                    else:
-                        base_message = ConfigManager.get_config_value("llm_post_processing", "system_prompt")
-                        file_path = ConfigManager.get_config_value("llm_post_processing", "system_prompt_file_path")
-                        mode_name = "cleanup"
-                    
-                    # Start with a clean system message
-                    system_message = base_message.strip() if base_message else ""
-                    log_cleanup_prompt = ConfigManager.should_log_cleanup_prompt()
-                    
-                    if mode_name == "cleanup" and not log_cleanup_prompt:
-                        ConfigManager.console_print("Retrieved cleanup base message from settings", verbose=True)
-                    else:
-                        ConfigManager.console_print(f"Retrieved {mode_name} base message from settings: {system_message}", verbose=True)
-                    
-                    if not file_path:
-                        ConfigManager.console_print("No file path set, using only the system message from settings")
-                    elif not os.path.exists(file_path):
-                        ConfigManager.console_print(f"File path set but file not found: {file_path}, using only the system message from settings")
-                    
-                    # Append file contents if file path exists and is not empty
-                    if file_path and os.path.exists(file_path):
-                        try:
-                            with open(file_path, 'r', encoding='utf-8') as file:
-                                file_content = file.read().strip()
-                                if file_content:  # Only append if file has content
-                                    if system_message:
-                                        system_message = f"{system_message}\n\n{file_content}"
-                                    else:
-                                        system_message = file_content
-                                    ConfigManager.console_print(f"Added fresh file content from {file_path}", verbose=True)
-                        except Exception as e:
-                            ConfigManager.console_print(f"Error reading system message file: {str(e)}")
-                    
-                    if not system_message:
-                        ConfigManager.console_print("Warning: No system message found, using original transcription")
-                    else:
-                        if mode_name == "cleanup" and not log_cleanup_prompt:
-                            ConfigManager.console_print("Final cleanup system message prepared for LLM", verbose=True)
-                        else:
-                            ConfigManager.console_print(f"Final system message being sent to LLM: {system_message}", verbose=True)
-                        original_result = result
-                        processed_result = self.llm_processor.process_text(result, system_message, mode=mode_name)
-                        if processed_result is not None:
-                            ConfigManager.console_print(f"Cleanup raw output: {processed_result}", verbose=True)
-                        if processed_result:
-                            candidate_result = processed_result.strip()
-                            if mode_name == "cleanup":
-                                rejection_reason = LLMProcessor.get_cleanup_rejection_reason(original_result, candidate_result)
-                                if rejection_reason:
-                                    ConfigManager.console_print(
-                                        f"Cleanup output rejected; falling back to original transcription ({rejection_reason})."
-                                    )
-                                    result = original_result
-                                else:
-                                    result = candidate_result
-                            else:
-                                result = candidate_result
-
-                            if result == original_result:
-                                ConfigManager.console_print("Cleanup output matches original transcription", verbose=True)
-                            else:
-                                ConfigManager.console_print("Cleanup output differs from original transcription", verbose=True)
-                        else:
-                            ConfigManager.console_print("LLM processing failed or returned empty output, using original transcription")
-                            result = original_result
-                    
-                except Exception as e:
-                    ConfigManager.console_print(f"Error processing text through LLM: {str(e)}")
-                    ConfigManager.console_print("Falling back to original transcription after LLM processing error.")
-
             # Type the result
             typed_result = False
             try:
@@ -321,15 +394,16 @@ class WhisperWriterApp(QObject):
                 ConfigManager.console_print(f"Typed transcription result: {typed_result}", verbose=True)
             
             if ConfigManager.get_config_value('misc', 'noise_on_completion'):
-                AudioPlayer(os.path.join('assets', 'beep.wav')).play(block=True)
-
-            if ConfigManager.get_config_value('recording_options', 'recording_mode') == 'continuous':
-                self.start_result_thread()
+                self.play_completion_sound()
 
         finally:
             # Re-enable key listener
             self._resume_key_listener_after_processing(listener_was_running)
 
+        # Listen again before the next recording starts, so its hotkeys are never missed
+        if ConfigManager.get_config_value('recording_options', 'recording_mode') == 'continuous':
+            self.start_result_thread()
+
     def handle_text_cleanup(self):
         """Handle the text selection cleanup shortcut."""
         if not self.llm_processor:
@@ -337,7 +411,7 @@ class WhisperWriterApp(QObject):
 
         listener_was_running = self._pause_key_listener_for_processing()
         
-        # Store all clipboard formats
+        # Store the clipboard's text formats
         saved_formats = {}
         if not InputSimulator.safe_open_clipboard():
             ConfigManager.console_print("Unable to open clipboard for text cleanup.")
@@ -345,11 +419,12 @@ class WhisperWriterApp(QObject):
             return
         
         try:
-            saved_formats = InputSimulator.capture_open_clipboard_formats()
-            ConfigManager.console_print(
-                f"Clipboard cleanup captured formats: {InputSimulator.describe_clipboard_formats(saved_formats)}",
-                verbose=True,
-            )
+            saved_formats = InputSimulator.capture_open_clipboard_text_formats()
+            if ConfigManager.get_verbose_mode():
+                ConfigManager.console_print(
+                    f"Clipboard cleanup captured formats: {InputSimulator.describe_clipboard_formats(saved_formats)}",
+                    verbose=True,
+                )
             
             # Get the text content
             clipboard_text = saved_formats.get(win32con.CF_UNICODETEXT)
@@ -365,48 +440,18 @@ class WhisperWriterApp(QObject):
                 )
                 return
             
-            ConfigManager.console_print(f"Processing clipboard text: {clipboard_text[:100]}...", verbose=True)
-            
-            # Get the base system message
-            base_message = ConfigManager.get_config_value("llm_post_processing", "text_cleanup_system_message")
-            file_path = ConfigManager.get_config_value("llm_post_processing", "text_cleanup_system_message_file_path")
-            
-            # Start with a clean system message
-            system_message = base_message.strip() if base_message else ""
-            log_cleanup_prompt = ConfigManager.should_log_cleanup_prompt()
-            
-            if log_cleanup_prompt:
-                ConfigManager.console_print(f"Base cleanup system message: {system_message}", verbose=True)
-            else:
-                ConfigManager.console_print("Base cleanup system message retrieved", verbose=True)
-            
-            # Append file contents if file path exists and is not empty
-            if file_path and os.path.exists(file_path):
-                try:
-                    ConfigManager.console_print(f"Reading cleanup instructions from file: {file_path}", verbose=True)
-                    with open(file_path, 'r', encoding='utf-8') as file:
-                        file_content = file.read().strip()
-                        if file_content:  # Only append if file has content
-                            if system_message:
-                                system_message = f"{system_message}\n\n{file_content}"
-                            else:
-                                system_message = file_content
-                            ConfigManager.console_print("Successfully added file content to cleanup instructions", verbose=True)
-                except Exception as e:
-                    ConfigManager.console_print(f"Error reading cleanup system message file: {str(e)}")
+            if ConfigManager.get_verbose_mode():
+                ConfigManager.console_print(f"Processing clipboard text: {clipboard_text[:100]}...", verbose=True)
             
+            system_message = self._get_system_message("text_cleanup")
             if not system_message:
                 ConfigManager.console_print("Warning: No cleanup system message found")
                 return
             
-            if log_cleanup_prompt:
-                ConfigManager.console_print(f"Final cleanup system message: {system_message}", verbose=True)
-            else:
-                ConfigManager.console_print("Final cleanup system message prepared", verbose=True)
-            
             # Run through LLM cleanup
             cleaned_text = self.llm_processor.process_text(clipboard_text, system_message, mode="cleanup")
-            ConfigManager.console_print(f"Cleanup output (clipboard): {cleaned_text}", verbose=True)
+            if ConfigManager.get_verbose_mode():
+                ConfigManager.console_print(f"Cleanup output (clipboard): {cleaned_text}", verbose=True)
 
             if cleaned_text:
                 cleaned_text = cleaned_text.strip()
@@ -422,12 +467,6 @@ class WhisperWriterApp(QObject):
                 try:
                     # Simulate keyboard events with proper cleanup
                     keyboard = Controller()
-                    image_clipboard = InputSimulator.has_image_clipboard_content(saved_formats)
-                    if image_clipboard:
-                        ConfigManager.console_print(
-                            "Clipboard cleanup detected image formats; using delayed clipboard restore so the target app keeps seeing text long enough to paste it instead of the image.",
-                            verbose=True,
-                        )
                     
                     # First set the cleaned text to clipboard
                     if not InputSimulator.safe_open_clipboard():
@@ -438,18 +477,19 @@ class WhisperWriterApp(QObject):
                     
                     try:
                         # Delete selected text and paste cleaned text
-                        keyboard.press(Key.delete)
-                        keyboard.release(Key.delete)
-                        time.sleep(0.1)  # Small delay after delete
+                        # Injected key events are delivered in order, so the paste cannot overtake the delete
+                        if not InputSimulator.send_delete_and_paste():
+                            keyboard.press(Key.delete)
+                            keyboard.release(Key.delete)
 
-                        with keyboard.pressed(Key.ctrl):
-                            keyboard.press('v')
-                            keyboard.release('v')
+                            with keyboard.pressed(Key.ctrl):
+                                keyboard.press('v')
+                                keyboard.release('v')
 
                         paste_succeeded = True
                         
                         if ConfigManager.get_config_value('misc', 'noise_on_completion'):
-                            AudioPlayer(os.path.join('assets', 'beep.wav')).play(block=True)
+                            self.play_completion_sound()
                             
                     finally:
                         # Ensure all keys are released
@@ -457,34 +497,24 @@ class WhisperWriterApp(QObject):
                         keyboard.release('v')
                         keyboard.release(Key.delete)
                         
-                        # Restore original clipboard content
-                        if image_clipboard:
-                            ConfigManager.console_print(
-                                f"Delaying clipboard restore by {InputSimulator.get_clipboard_restore_delay(saved_formats):.2f}s would still be too short for image clipboard content; scheduling delayed restore instead.",
-                                verbose=True,
-                            )
-                            InputSimulator.schedule_clipboard_restore(
-                                saved_formats,
-                                cleaned_text,
-                                delay=InputSimulator.get_image_clipboard_restore_delay(),
-                                context_label='cleanup paste',
-                            )
-                        else:
-                            restore_delay = InputSimulator.get_clipboard_restore_delay(saved_formats)
-                            ConfigManager.console_print(
-                                f"Waiting {restore_delay:.2f}s before restoring clipboard after cleanup paste.",
-                                verbose=True,
-                            )
-                            time.sleep(restore_delay)
-                            InputSimulator.restore_clipboard_if_unchanged(
-                                saved_formats,
-                                cleaned_text,
-                                success_message='Restored clipboard formats after cleanup paste',
-                                skip_message='Skipping clipboard restore after cleanup paste because clipboard contents changed before restore.',
-                            )
+                        # Restore original clipboard content; only text formats were captured, so there
+                        # is no image the target could paste instead of the text
+                        restore_delay = InputSimulator.get_clipboard_restore_delay(saved_formats)
+                        ConfigManager.console_print(
+                            f"Waiting up to {restore_delay:.2f}s for the paste target to read the clipboard before restoring it.",
+                            verbose=True,
+                        )
+                        if InputSimulator.wait_for_clipboard_read(restore_delay):
+                            ConfigManager.console_print("Paste target released the clipboard; restoring early.", verbose=True)
+                        InputSimulator.restore_clipboard_if_unchanged(
+                            saved_formats,
+                            cleaned_text,
+                            success_message='Restored clipboard formats after cleanup paste',
+                            skip_message='Skipping clipboard restore after cleanup paste because clipboard contents changed before restore.',
+                        )
                         
                     # Clear the key chord state
-                    self.key_listener.text_cleanup_chord.pressed_keys.clear()
+                    self.key_listener.text_cleanup_chord.reset()
                     
                 except Exception as e:
                     ConfigManager.console_print(f"Error simulating keyboard: {str(e)}")
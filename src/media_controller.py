@@ -2,6 +2,7 @@ from pynput.keyboard import Controller, Key
 import time
 import platform
 import subprocess
+import threading
 import ctypes
 from ctypes import cast, POINTER
 from comtypes import CLSCTX_ALL
@@ -10,48 +11,70 @@ if platform.system() == 'Windows':
     import pythoncom  # For COM initialization
     from pycaw.pycaw import AudioUtilities, IAudioEndpointVolume, IAudioMeterInformation
 
+# Our own audio sessions, never treated as media playback
+EXCLUDED_PROCESSES = frozenset({'python.exe', 'pythonw.exe'})
+
 class MediaController:
     def __init__(self):
         self.keyboard = Controller()
         self.was_playing = False
         self.initial_state_playing = False  # Track initial state
         self.original_volumes = {}  # Store original volumes for each session
+        self._sessions_snapshot = None  # (process name, meter, volume) per session, see _refresh_sessions
         self.system = platform.system()
-        if self.system == 'Windows':
-            # Initialize COM in the main thread
+        self._com_state = threading.local()
+
+    def _ensure_com_initialized(self):
+        """
+        Initialize COM on the calling thread the first time it uses the controller.
+
+        COM stays initialized afterwards instead of being torn down after every call, which
+        also keeps the interfaces in the session snapshot valid for the record cycle. The
+        thread that used the controller releases it with shutdown().
+        """
+        if not getattr(self._com_state, 'initialized', False):
             pythoncom.CoInitialize()
+            self._com_state.initialized = True
+
+    def _refresh_sessions(self):
+        """
+        Enumerate the audio sessions of other processes once and keep them for this record cycle.
+
+        COM must already be initialized on the calling thread.
+        """
+        snapshot = []
+        for session in AudioUtilities.GetAllSessions():
+            if session.Process:
+                name = session.Process.name()
+                if name not in EXCLUDED_PROCESSES:
+                    snapshot.append((name, session._ctl.QueryInterface(IAudioMeterInformation), session.SimpleAudioVolume))
+        self._sessions_snapshot = snapshot
+        return snapshot
+
+    def _get_sessions(self):
+        """Return the sessions of the current record cycle, enumerating them outside of one."""
+        if self._sessions_snapshot is None:
+            return self._refresh_sessions()
+        return self._sessions_snapshot
 
     def is_audio_playing(self):
         """Check if audio is actually playing by monitoring audio levels"""
         try:
             if self.system == 'Windows':
-                # Initialize COM for this thread
-                pythoncom.CoInitialize()
-                try:
-                    # Get all active audio sessions
-                    sessions = AudioUtilities.GetAllSessions()
-                    
-                    for session in sessions:
-                        if session.Process and session.Process.name() not in ['python.exe', 'pythonw.exe']:
-                            # Get audio meter information
-                            volume = session._ctl.QueryInterface(IAudioMeterInformation)
-                            peak = volume.GetPeakValue()
-                            print(f"Checking audio for {session.Process.name()}: Peak = {peak}")
-                            if peak > 0.0001:  # Detect actual audio signal
-                                print(f"Detected audio playing in {session.Process.name()}")
-                                return True
-                    print("No active audio detected")
-                    return False
-                finally:
-                    # Uninitialize COM when done
-                    pythoncom.CoUninitialize()
+                self._ensure_com_initialized()
+                for name, meter, _ in self._get_sessions():
+                    if meter.GetPeakValue() > 0.0001:  # Detect actual audio signal
+                        ConfigManager.console_print(f"Detected audio playing in {name}", verbose=True)
+                        return True
+                ConfigManager.console_print("No active audio detected", verbose=True)
+                return False
             
             elif self.system == 'Linux':
                 # Use pactl to check for audio levels
                 result = subprocess.run(['pactl', 'list', 'sink-inputs'], 
                                      capture_output=True, text=True)
                 is_playing = 'RUNNING' in result.stdout and 'volume:' in result.stdout
-                print(f"Audio playing status check (Linux): {is_playing}")
+                ConfigManager.console_print(f"Audio playing status check (Linux): {is_playing}", verbose=True)
                 return is_playing
             
             elif self.system == 'Darwin':  # macOS
@@ -61,83 +84,78 @@ class MediaController:
                     capture_output=True, text=True)
                 volume, muted = result.stdout.strip().split()
                 is_playing = int(volume) > 0 and muted.lower() == 'false'
-                print(f"Audio playing status check (macOS): {is_playing}")
+                ConfigManager.console_print(f"Audio playing status check (macOS): {is_playing}", verbose=True)
                 return is_playing
                 
         except Exception as e:
-            print(f"Error checking audio state: {str(e)}")
+            ConfigManager.console_print(f"Error checking audio state: {str(e)}")
             return False
 
     def adjust_volume(self, reduce_by_percent):
         """Reduce volume by specified percentage of current volume"""
         try:
             if self.system == 'Windows':
-                pythoncom.CoInitialize()
-                try:
-                    sessions = AudioUtilities.GetAllSessions()
-                    for session in sessions:
-                        if session.Process and session.Process.name() not in ['python.exe', 'pythonw.exe']:
-                            volume = session.SimpleAudioVolume
-                            current_volume = volume.GetMasterVolume()
-                            # Store original volume
-                            self.original_volumes[session.Process.name()] = current_volume
-                            # Calculate new volume (as percentage of current)
-                            new_volume = current_volume * (1 - reduce_by_percent/100)
-                            volume.SetMasterVolume(new_volume, None)
-                            print(f"Reduced volume for {session.Process.name()} from {current_volume:.2f} to {new_volume:.2f}")
-                finally:
-                    pythoncom.CoUninitialize()
+                self._ensure_com_initialized()
+                for name, _, volume in self._get_sessions():
+                    current_volume = volume.GetMasterVolume()
+                    # Store original volume
+                    self.original_volumes[name] = current_volume
+                    # Calculate new volume (as percentage of current)
+                    new_volume = current_volume * (1 - reduce_by_percent/100)
+                    volume.SetMasterVolume(new_volume, None)
+                    ConfigManager.console_print(f"Reduced volume for {name} from {current_volume:.2f} to {new_volume:.2f}", verbose=True)
         except Exception as e:
-            print(f"Error adjusting volume: {str(e)}")
+            ConfigManager.console_print(f"Error adjusting volume: {str(e)}")
 
     def restore_volumes(self):
         """Restore original volumes"""
         try:
             if self.system == 'Windows':
-                pythoncom.CoInitialize()
-                try:
-                    sessions = AudioUtilities.GetAllSessions()
-                    for session in sessions:
-                        if session.Process and session.Process.name() in self.original_volumes:
-                            volume = session.SimpleAudioVolume
-                            original_volume = self.original_volumes[session.Process.name()]
-                            volume.SetMasterVolume(original_volume, None)
-                            print(f"Restored volume for {session.Process.name()} to {original_volume:.2f}")
-                finally:
-                    pythoncom.CoUninitialize()
+                self._ensure_com_initialized()
+                for name, _, volume in self._get_sessions():
+                    if name in self.original_volumes:
+                        original_volume = self.original_volumes[name]
+                        volume.SetMasterVolume(original_volume, None)
+                        ConfigManager.console_print(f"Restored volume for {name} to {original_volume:.2f}", verbose=True)
                 self.original_volumes.clear()
         except Exception as e:
-            print(f"Error restoring volumes: {str(e)}")
+            ConfigManager.console_print(f"Error restoring volumes: {str(e)}")
 
     def pause_media(self):
         """Handle media control based on settings"""
+        # Start each record cycle from a fresh view of the audio sessions
+        self._sessions_snapshot = None
         self.initial_state_playing = self.is_audio_playing()
         
         if self.initial_state_playing:
-            print("Pausing media playback")
+            ConfigManager.console_print("Pausing media playback")
             self.keyboard.press(Key.media_play_pause)
             self.keyboard.release(Key.media_play_pause)
             time.sleep(0.1)
             self.was_playing = True
         else:
-            print("No audio playing - skipping audio control")
+            ConfigManager.console_print("No audio playing - skipping audio control", verbose=True)
             self.was_playing = False
 
     def resume_media(self):
         """Restore audio state"""
         if self.was_playing and self.initial_state_playing:
-            print("Resuming media playback")
+            ConfigManager.console_print("Resuming media playback")
             self.keyboard.press(Key.media_play_pause)
             self.keyboard.release(Key.media_play_pause)
             time.sleep(0.1)
         
         self.was_playing = False
         self.initial_state_playing = False
+        # The record cycle is over; the next pause_media enumerates the sessions again
+        self._sessions_snapshot = None
 
-    def __del__(self):
-        """Cleanup when the object is destroyed"""
-        if self.system == 'Windows':
+    def shutdown(self):
+        """Release the audio sessions and uninitialize COM if the calling thread initialized it."""
+        self._sessions_snapshot = None
+        if getattr(self._com_state, 'initialized', False):
+            self._com_state.initialized = False
             try:
                 pythoncom.CoUninitialize()
-            except:
-                pass
\ No newline at end of file
+            except Exception as e:
+                ConfigManager.console_print(f"Error uninitializing COM: {str(e)}", verbose=True)
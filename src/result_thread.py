@@ -8,13 +8,15 @@ import webrtcvad
 import os
 import soundfile as sf
 from PyQt5.QtCore import QThread, QMutex, pyqtSignal
-from collections import deque
 from threading import Event
 
 from transcription import transcribe
 from utils import ConfigManager
 from media_controller import MediaController
 
+# Seconds of audio the recording buffer holds before it has to grow
+RECORDING_BUFFER_INITIAL_SECONDS = 60
+
 
 class ResultThread(QThread):
     """
@@ -158,6 +160,8 @@ class ResultThread(QThread):
             self.resultSignal.emit('')
         finally:
             self.is_transcribing = False  # Ensure flag is reset
+            # COM was initialized on this thread by the media controller, so release it here
+            self.media_controller.shutdown()
 
     def _save_failed_audio(self, audio_data):
         """Save failed audio to a FLAC file for later retry."""
@@ -211,64 +215,78 @@ class ResultThread(QThread):
             speech_detected = False
             silent_frame_count = 0
 
-        audio_buffer = deque(maxlen=frame_size)
-        recording = []
+        # The audio callback is the only writer: it copies each block straight into this buffer,
+        # doubling it when full, and the loop below reads it back one frame at a time
+        recording = np.empty(self.sample_rate * RECORDING_BUFFER_INITIAL_SECONDS, dtype=np.int16)
+        recorded_samples = 0
+        read_samples = 0
         last_speech_time = time.time()  # Track when we last heard speech
         data_ready = Event()
 
         def audio_callback(indata, frames, time, status):
+            nonlocal recording, recorded_samples
             if status:
                 ConfigManager.console_print(f"Audio callback status: {status}")
-            audio_buffer.extend(indata[:, 0])
+            end = recorded_samples + len(indata)
+            if end > len(recording):
+                grown = np.empty(max(end, 2 * len(recording)), dtype=np.int16)
+                grown[:recorded_samples] = recording[:recorded_samples]
+                recording = grown
+            recording[recorded_samples:end] = indata[:, 0]
+            recorded_samples = end
             data_ready.set()
 
         with sd.InputStream(samplerate=self.sample_rate, channels=1, dtype='int16',
                             blocksize=frame_size, device=recording_options.get('sound_device'),
                             callback=audio_callback):
-            while self.is_running and self.is_recording:
+            speech_ended = False
+            while self.is_running and self.is_recording and not speech_ended:
                 data_ready.wait()
                 data_ready.clear()
 
-                if len(audio_buffer) < frame_size:
-                    continue
-
-                frame = np.array(list(audio_buffer), dtype=np.int16)
-                audio_buffer.clear()
-                recording.extend(frame)
-
-                if initial_frames_to_skip > 0:
-                    initial_frames_to_skip -= 1
-                    continue
-
-                # Check for speech in the current frame
-                if recording_mode == 'voice_activity_detection' or recording_mode == 'continuous':
-                    if vad and vad.is_speech(frame.tobytes(), self.sample_rate):
-                        last_speech_time = time.time()  # Update the last speech time
-                        if recording_mode == 'continuous':
-                            silent_frame_count = 0
-                        if not speech_detected:
-                            ConfigManager.console_print("Speech detected.")
-                            speech_detected = True
-                    else:
-                        if recording_mode == 'continuous':  
-                            silent_frame_count += 1
-
-                # Check for continuous mode silence timeout
-                if (recording_mode == 'continuous' and 
-                    continuous_timeout > 0 and 
-                    time.time() - last_speech_time > continuous_timeout):
-                    ConfigManager.console_print(f"[DEBUG] No audio detected for {continuous_timeout} seconds. Stopping continuous recording.")
-                    self.is_running = False  # Stop the entire thread
-                    self.is_recording = False  # Stop recording
-                    self.statusSignal.emit('idle', False)  # Update status window
-                    return None  # Return None to skip transcription
-
-                # Check for normal silence detection
-                if recording_mode == 'voice_activity_detection' or recording_mode == 'continuous':
-                    if speech_detected and silent_frame_count > silence_frames:
-                        break
-
-        audio_data = np.array(recording, dtype=np.int16)
+                # Read the count before the buffer: whichever buffer we get holds every sample below it
+                available = recorded_samples
+                buffer = recording
+                while read_samples + frame_size <= available:
+                    frame = buffer[read_samples:read_samples + frame_size]
+                    read_samples += frame_size
+
+                    if initial_frames_to_skip > 0:
+                        initial_frames_to_skip -= 1
+                        continue
+
+                    # Check for speech in the current frame
+                    if recording_mode == 'voice_activity_detection' or recording_mode == 'continuous':
+                        # A byte view of the frame: webrtcvad reads the buffer directly, no bytes copy per frame
+                        if vad and vad.is_speech(memoryview(frame).cast('B'), self.sample_rate):
+                            last_speech_time = time.time()  # Update the last speech time
+                            if recording_mode == 'continuous':
+                                silent_frame_count = 0
+                            if not speech_detected:
+                                ConfigManager.console_print("Speech detected.")
+                                speech_detected = True
+                        else:
+                            if recording_mode == 'continuous':  
+                                silent_frame_count += 1
+
+                    # Check for continuous mode silence timeout
+                    if (recording_mode == 'continuous' and 
+                        continuous_timeout > 0 and 
+                        time.time() - last_speech_time > continuous_timeout):
+                        ConfigManager.console_print(f"[DEBUG] No audio detected for {continuous_timeout} seconds. Stopping continuous recording.")
+                        self.is_running = False  # Stop the entire thread
+                        self.is_recording = False  # Stop recording
+                        self.statusSignal.emit('idle', False)  # Update status window
+                        return None  # Return None to skip transcription
+
+                    # Check for normal silence detection
+                    if recording_mode == 'voice_activity_detection' or recording_mode == 'continuous':
+                        if speech_detected and silent_frame_count > silence_frames:
+                            speech_ended = True
+                            break
+
+        # The stream is closed, so nothing writes to the buffer any more
+        audio_data = recording[:recorded_samples]
         duration = len(audio_data) / self.sample_rate
 
         ConfigManager.console_print(f'Recording finished. Size: {audio_data.size} samples, Duration: {duration:.2f} seconds')
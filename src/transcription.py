@@ -248,6 +248,22 @@ def create_local_model():
                                download_root=None if model_path else None)
             return ('whisper', model)
 
+def warm_up_local_model(local_model):
+    """Run one transcription of silence so the first real one does not pay the model's startup cost."""
+    if not local_model:
+        return
+    model_type, model = local_model
+    if model_type != 'whisper':
+        return
+    try:
+        # One second of silence at 16 kHz; the VAD filter would drop it before the encoder runs.
+        # Segments are generated lazily, so consume them to make the decoder run too
+        segments, _ = model.transcribe(np.zeros(16000, dtype=np.float32), vad_filter=False)
+        list(segments)
+        ConfigManager.console_print('Whisper model warmed up.', verbose=True)
+    except Exception as e:
+        ConfigManager.console_print(f'Error warming up Whisper model: {e}')
+
 def transcribe_local(audio_data, local_model=None):
     """Transcribe audio using a local model (Whisper or Vosk)."""
     if not local_model:
@@ -7,7 +7,7 @@ def test_azure_openai_end_to_end_llm_flow():
     
     sys.path.insert(0, 'src')
     
-    with patch('llm_processor.requests.post') as mock_post, \
+    with patch('llm_processor.requests.Session.post') as mock_post, \
          patch('llm_processor.ConfigManager') as mock_config, \
          patch('llm_processor.KeyringManager') as mock_keyring:
         
@@ -187,3 +187,21 @@ def test_config_yaml_azure_key_removal():
     assert config['model_options']['api']['azure_openai_endpoint'] == 'https://test.openai.azure.com'
     assert config['model_options']['api']['provider'] == 'azure_openai'
     assert config['other_settings']['value'] == 'should-remain'
+
+
+def test_migrate_azure_key_keeps_config_permissions(tmp_path):
+    """Test that rewriting config.yaml keeps its original file mode."""
+    sys.path.insert(0, '.')
+    from migrate_azure_key import migrate_azure_key
+
+    config_path = tmp_path / 'config.yaml'
+    config_path.write_text(yaml.dump({'model_options': {'api': {'azure_openai_api_key': 'secret'}}}))
+    os.chmod(config_path, 0o644)
+
+    with patch('keyring.set_password'), patch('os.fsync', wraps=os.fsync) as mock_fsync:
+        migrate_azure_key(str(config_path))
+
+    assert mock_fsync.called
+    assert (os.stat(config_path).st_mode & 0o777) == 0o644
+    assert yaml.safe_load(config_path.read_text())['model_options']['api']['azure_openai_api_key'] is None
+    sys.path.pop(0)
@@ -70,7 +70,7 @@ def test_azure_openai_llm_text_processing():
     
     with patch('llm_processor.ConfigManager') as mock_config, \
          patch('llm_processor.KeyringManager') as mock_keyring, \
-         patch('llm_processor.requests.post') as mock_post:
+         patch('llm_processor.requests.Session.post') as mock_post:
         
         # Mock configuration
         mock_config.get_config_section.return_value = {
@@ -219,7 +219,7 @@ def test_azure_openai_llm_api_error():
     
     with patch('llm_processor.ConfigManager') as mock_config, \
          patch('llm_processor.KeyringManager') as mock_keyring, \
-         patch('llm_processor.requests.post') as mock_post:
+         patch('llm_processor.requests.Session.post') as mock_post:
         
         mock_config.get_config_section.return_value = {
             'api_type': 'azure_openai',
@@ -78,7 +78,7 @@ def test_azure_openai_llm_api_call_structure():
     
     with patch('llm_processor.ConfigManager') as mock_config, \
          patch('llm_processor.KeyringManager') as mock_keyring, \
-         patch('llm_processor.requests.post') as mock_requests:
+         patch('llm_processor.requests.Session.post') as mock_requests:
         
         # Mock configuration
         mock_config.get_config_section.return_value = {
@@ -17,6 +17,7 @@ def input_simulation_module(monkeypatch):
         lambda category, key: 'pynput' if (category, key) == ('post_processing', 'input_method') else None,
     )
     monkeypatch.setattr(input_simulation.ConfigManager, 'console_print', lambda *args, **kwargs: None)
+    monkeypatch.setattr(input_simulation.ConfigManager, 'get_verbose_mode', lambda: False, raising=False)
 
     class DummyPressed:
         def __enter__(self):
@@ -64,7 +65,7 @@ def test_has_image_clipboard_content_detects_custom_bitmap_formats(input_simulat
 def test_paste_waits_longer_before_restoring_non_image_rich_clipboard(input_simulation_module, monkeypatch):
     module = input_simulation_module
 
-    sleep_calls = []
+    wait_calls = []
     rich_format = 49161
     enum_order = [rich_format, module.win32con.CF_UNICODETEXT]
 
@@ -89,12 +90,16 @@ def test_paste_waits_longer_before_restoring_non_image_rich_clipboard(input_simu
     monkeypatch.setattr(module.win32clipboard, 'EmptyClipboard', lambda: None)
     monkeypatch.setattr(module.win32clipboard, 'SetClipboardText', lambda text, fmt: None)
     monkeypatch.setattr(module.win32clipboard, 'SetClipboardData', lambda fmt, data: None)
-    monkeypatch.setattr(module.time, 'sleep', lambda seconds: sleep_calls.append(seconds))
+    monkeypatch.setattr(
+        module.InputSimulator,
+        'wait_for_clipboard_read',
+        staticmethod(lambda timeout: wait_calls.append(timeout) or False),
+    )
 
     simulator = module.InputSimulator()
     simulator._paste_with_clipboard_preservation('pasted text')
 
-    assert sleep_calls == [0.5]
+    assert wait_calls == [0.5]
 
 
 def test_paste_schedules_delayed_restore_for_image_clipboard(input_simulation_module, monkeypatch):
@@ -159,9 +164,184 @@ def test_paste_skips_restoring_when_clipboard_changes(input_simulation_module, m
         'restore_open_clipboard_formats',
         classmethod(lambda cls, saved_formats: restored_formats.append(saved_formats)),
     )
-    monkeypatch.setattr(module.time, 'sleep', lambda seconds: None)
+    monkeypatch.setattr(module.InputSimulator, 'wait_for_clipboard_read', staticmethod(lambda timeout: False))
 
     simulator = module.InputSimulator()
     simulator._paste_with_clipboard_preservation('pasted text')
 
-    assert restored_formats == []
\ No newline at end of file
+    assert restored_formats == []
+
+def test_capture_skips_formats_windows_synthesizes_from_captured_sources(input_simulation_module, monkeypatch):
+    module = input_simulation_module
+
+    enum_order = [
+        module.win32con.CF_UNICODETEXT,
+        module.win32con.CF_DIBV5,
+        module.win32con.CF_TEXT,
+        module.win32con.CF_DIB,
+        module.win32con.CF_BITMAP,
+    ]
+    read_formats = []
+
+    def fake_enum_clipboard_formats(previous):
+        if previous == 0:
+            return enum_order[0]
+        index = enum_order.index(previous) + 1
+        return enum_order[index] if index < len(enum_order) else 0
+
+    def fake_get_clipboard_data(format_id):
+        read_formats.append(format_id)
+        return f'data-{format_id}'
+
+    monkeypatch.setattr(module.win32clipboard, 'EnumClipboardFormats', fake_enum_clipboard_formats)
+    monkeypatch.setattr(module.win32clipboard, 'GetClipboardData', fake_get_clipboard_data)
+
+    saved_formats = module.InputSimulator.capture_open_clipboard_formats()
+
+    assert read_formats == [module.win32con.CF_UNICODETEXT, module.win32con.CF_DIBV5]
+    assert list(saved_formats) == [module.win32con.CF_UNICODETEXT, module.win32con.CF_DIBV5]
+
+
+def test_wait_for_clipboard_read_returns_once_reader_releases_clipboard(input_simulation_module, monkeypatch):
+    module = input_simulation_module
+
+    open_windows = iter([0, 1234, 1234, 0])
+    sleep_calls = []
+
+    monkeypatch.setattr(module.win32clipboard, 'GetOpenClipboardWindow', lambda: next(open_windows))
+    monkeypatch.setattr(module.time, 'sleep', lambda seconds: sleep_calls.append(seconds))
+    monkeypatch.setattr(module.InputSimulator, 'get_foreground_window_owner', classmethod(lambda cls: (10, 100)))
+    monkeypatch.setattr(module.InputSimulator, 'get_window_owner', staticmethod(lambda hwnd: (10, 100)))
+
+    assert module.InputSimulator.wait_for_clipboard_read(0.5) is True
+    assert len(sleep_calls) == 3
+
+
+def test_wait_for_clipboard_read_ignores_readers_outside_the_paste_target(input_simulation_module, monkeypatch):
+    module = input_simulation_module
+
+    # A clipboard history tool opens and closes the clipboard, then the target reads it
+    open_windows = iter([555, 0, 0, 1234, 0])
+    owners = {555: (20, 200), 1234: (11, 100)}
+    clock = iter(range(100))
+
+    monkeypatch.setattr(module.win32clipboard, 'GetOpenClipboardWindow', lambda: next(open_windows, 0))
+    monkeypatch.setattr(module.time, 'sleep', lambda seconds: None)
+    monkeypatch.setattr(module.time, 'monotonic', lambda: next(clock) * 0.01)
+    monkeypatch.setattr(module.InputSimulator, 'get_foreground_window_owner', classmethod(lambda cls: (10, 100)))
+    monkeypatch.setattr(module.InputSimulator, 'get_window_owner', staticmethod(lambda hwnd: owners.get(hwnd)))
+
+    assert module.InputSimulator.wait_for_clipboard_read(0.5) is True
+    # Returned only after the target's read, not after the history tool's
+    assert next(open_windows, 'done') == 'done'
+
+    # Without a read by the target, the wait runs until the timeout
+    open_windows = iter([555, 0])
+    clock = iter(range(100))
+    assert module.InputSimulator.wait_for_clipboard_read(0.05) is False
+
+
+def test_capture_skips_clipboard_owned_handles(input_simulation_module, monkeypatch):
+    module = input_simulation_module
+
+    enum_order = [module.win32con.CF_BITMAP, 49161]
+
+    def fake_enum_clipboard_formats(previous):
+        if previous == 0:
+            return enum_order[0]
+        index = enum_order.index(previous) + 1
+        return enum_order[index] if index < len(enum_order) else 0
+
+    def fake_get_clipboard_data(format_id):
+        if format_id == module.win32con.CF_BITMAP:
+            return 0x1234
+        return b'rich-data'
+
+    monkeypatch.setattr(module.win32clipboard, 'EnumClipboardFormats', fake_enum_clipboard_formats)
+    monkeypatch.setattr(module.win32clipboard, 'GetClipboardData', fake_get_clipboard_data)
+
+    assert module.InputSimulator.capture_open_clipboard_formats() == {49161: b'rich-data'}
+
+
+def test_paste_opens_clipboard_once_to_set_text_and_once_to_restore(input_simulation_module, monkeypatch):
+    module = input_simulation_module
+
+    open_calls = []
+
+    monkeypatch.setattr(module.InputSimulator, 'safe_open_clipboard', staticmethod(lambda: open_calls.append(True) or True))
+    monkeypatch.setattr(module.InputSimulator, 'safe_close_clipboard', staticmethod(lambda: True))
+    monkeypatch.setattr(
+        module.InputSimulator,
+        'capture_open_clipboard_formats',
+        classmethod(lambda cls: {module.win32con.CF_UNICODETEXT: 'original text'}),
+    )
+    monkeypatch.setattr(module.InputSimulator, 'get_open_clipboard_text', staticmethod(lambda: 'pasted text'))
+    monkeypatch.setattr(module.win32clipboard, 'EmptyClipboard', lambda: None)
+    monkeypatch.setattr(module.win32clipboard, 'SetClipboardText', lambda text, fmt: None)
+    monkeypatch.setattr(module.win32clipboard, 'SetClipboardData', lambda fmt, data: None)
+    monkeypatch.setattr(module.InputSimulator, 'wait_for_clipboard_read', staticmethod(lambda timeout: True))
+
+    simulator = module.InputSimulator()
+    assert simulator._paste_with_clipboard_preservation('pasted text') is True
+
+    assert len(open_calls) == 2
+
+
+def test_capture_text_formats_reads_only_allowlisted_formats(input_simulation_module, monkeypatch):
+    module = input_simulation_module
+
+    html_format = 49300
+    available = {module.win32con.CF_UNICODETEXT, module.win32con.CF_TEXT, module.win32con.CF_DIB, html_format}
+    read_formats = []
+
+    monkeypatch.setattr(module.InputSimulator, '_rich_text_clipboard_formats', (html_format, 49301))
+    monkeypatch.setattr(module.win32clipboard, 'IsClipboardFormatAvailable', lambda format_id: format_id in available, raising=False)
+    monkeypatch.setattr(
+        module.win32clipboard,
+        'GetClipboardData',
+        lambda format_id: read_formats.append(format_id) or f'data-{format_id}',
+    )
+
+    captured = module.InputSimulator.capture_open_clipboard_text_formats()
+
+    assert list(captured) == [module.win32con.CF_UNICODETEXT, html_format]
+    assert read_formats == [module.win32con.CF_UNICODETEXT, html_format]
+
+
+def test_ydotool_socket_path_follows_ydotool_lookup_and_is_passed_to_ydotoold(input_simulation_module, monkeypatch, tmp_path):
+    module = input_simulation_module
+
+    monkeypatch.setenv('YDOTOOL_SOCKET', '/custom/socket')
+    monkeypatch.setenv('XDG_RUNTIME_DIR', str(tmp_path))
+    assert module.InputSimulator.get_ydotool_socket_path() == '/custom/socket'
+
+    monkeypatch.delenv('YDOTOOL_SOCKET')
+    socket_path = str(tmp_path / '.ydotool_socket')
+    assert module.InputSimulator.get_ydotool_socket_path() == socket_path
+
+    monkeypatch.delenv('XDG_RUNTIME_DIR')
+    assert module.InputSimulator.get_ydotool_socket_path() == '/tmp/.ydotool_socket'
+
+    monkeypatch.setenv('XDG_RUNTIME_DIR', str(tmp_path))
+    popen_calls = []
+
+    class FakeProcess:
+        def __init__(self, args, **kwargs):
+            popen_calls.append(args)
+            open(socket_path, 'w').close()
+
+        def poll(self):
+            return None
+
+    monkeypatch.setattr(module.shutil, 'which', lambda name: '/usr/bin/ydotoold')
+    monkeypatch.setattr(module.subprocess, 'Popen', FakeProcess)
+
+    simulator = module.InputSimulator.__new__(module.InputSimulator)
+    simulator.ydotoold_process = None
+    simulator._initialize_ydotool()
+    assert popen_calls == [['ydotoold', f'--socket-path={socket_path}']]
+
+    # A daemon already listening on the socket is reused
+    simulator.ydotoold_process = None
+    simulator._initialize_ydotool()
+    assert len(popen_calls) == 1
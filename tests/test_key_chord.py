@@ -0,0 +1,159 @@
+import queue
+import sys
+import threading
+import time
+
+sys.path.insert(0, 'src')
+from key_listener import ConfigManager, InputEvent, KeyChord, KeyCode, KeyListener, SingleKeyTrigger
+
+sys.path.pop(0)
+
+CTRL = frozenset({KeyCode.CTRL_LEFT, KeyCode.CTRL_RIGHT})
+SHIFT = frozenset({KeyCode.SHIFT_LEFT, KeyCode.SHIFT_RIGHT})
+
+
+def test_combination_chord_reports_transition_from_single_update():
+    chord = KeyChord({CTRL, SHIFT, KeyCode.SPACE})
+
+    assert chord.update(KeyCode.CTRL_LEFT, InputEvent.KEY_PRESS) == (False, False)
+    assert chord.update(KeyCode.SHIFT_RIGHT, InputEvent.KEY_PRESS) == (False, False)
+    assert chord.update(KeyCode.SPACE, InputEvent.KEY_PRESS) == (False, True)
+    assert chord.is_active() is True
+    assert chord.update(KeyCode.SHIFT_RIGHT, InputEvent.KEY_RELEASE) == (True, False)
+    assert chord.is_active() is False
+
+
+def test_reset_clears_pressed_keys_and_active_state():
+    chord = KeyChord({CTRL, KeyCode.A})
+
+    chord.update(KeyCode.CTRL_RIGHT, InputEvent.KEY_PRESS)
+    chord.update(KeyCode.A, InputEvent.KEY_PRESS)
+    assert chord.is_active() is True
+
+    chord.reset()
+
+    assert chord.is_active() is False
+    assert chord.update(KeyCode.A, InputEvent.KEY_PRESS) == (False, False)
+
+
+def test_group_stays_satisfied_while_any_member_is_held():
+    chord = KeyChord({CTRL, KeyCode.SPACE})
+
+    chord.update(KeyCode.CTRL_LEFT, InputEvent.KEY_PRESS)
+    chord.update(KeyCode.CTRL_RIGHT, InputEvent.KEY_PRESS)
+    chord.update(KeyCode.CTRL_LEFT, InputEvent.KEY_PRESS)
+    assert chord.update(KeyCode.SPACE, InputEvent.KEY_PRESS) == (False, True)
+    assert chord.update(KeyCode.CTRL_LEFT, InputEvent.KEY_RELEASE)[0] is True
+    assert chord.is_active() is True
+    assert chord.update(KeyCode.CTRL_RIGHT, InputEvent.KEY_RELEASE) == (True, False)
+    assert chord.update(KeyCode.CTRL_RIGHT, InputEvent.KEY_RELEASE) == (False, False)
+    assert chord.is_active() is False
+
+
+def test_keys_outside_chords_do_not_touch_chord_state(monkeypatch):
+    monkeypatch.setattr(ConfigManager, 'get_config_value', lambda *keys: 'ctrl+space' if keys[-1] == 'activation_key' else None)
+    listener = KeyListener.__new__(KeyListener)
+    listener.active_backend = object()
+    listener.is_running = True
+    listener.callbacks = {event: () for event in ('on_activate', 'on_deactivate', 'on_activate_with_llm',
+                                                  'on_deactivate_with_llm', 'on_activate_with_llm_instruction',
+                                                  'on_deactivate_with_llm_instruction', 'on_text_cleanup')}
+    listener.load_activation_keys()
+    fired = []
+    listener.add_callback('on_activate', lambda: fired.append('activate'))
+
+    listener._process_event((KeyCode.A, InputEvent.KEY_PRESS))
+    assert KeyCode.A not in listener._key_to_chords
+    assert listener.main_key_chord._pressed_mask == 0
+
+    listener._process_event((KeyCode.CTRL_RIGHT, InputEvent.KEY_PRESS))
+    listener._process_event((KeyCode.SPACE, InputEvent.KEY_PRESS))
+    assert fired == ['activate']
+
+
+def test_parse_key_combination_maps_modifier_number_and_numpad_tokens():
+    listener = KeyListener.__new__(KeyListener)
+
+    keys = listener.parse_key_combination('Ctrl + rshift+5+numpad1+divide+F1+unknown')
+
+    assert keys == {CTRL, KeyCode.SHIFT_RIGHT, KeyCode.FIVE, KeyCode.NUMPAD_1, KeyCode.NUMPAD_DIVIDE, KeyCode.F1}
+    assert listener.parse_key_combination('') == set()
+
+
+def test_single_key_combinations_use_lightweight_trigger():
+    assert isinstance(KeyListener._create_chord({CTRL}), SingleKeyTrigger)
+    assert isinstance(KeyListener._create_chord({KeyCode.F9}), SingleKeyTrigger)
+    assert isinstance(KeyListener._create_chord({CTRL, KeyCode.SPACE}), KeyChord)
+
+    trigger = SingleKeyTrigger({CTRL})
+    assert trigger.update(KeyCode.CTRL_LEFT, InputEvent.KEY_PRESS) == (False, True)
+    assert trigger.update(KeyCode.CTRL_RIGHT, InputEvent.KEY_PRESS) == (True, True)
+    assert trigger.update(KeyCode.CTRL_LEFT, InputEvent.KEY_RELEASE) == (True, True)
+    assert trigger.update(KeyCode.CTRL_RIGHT, InputEvent.KEY_RELEASE) == (True, False)
+    assert trigger.is_active() is False
+
+
+def test_input_events_are_dispatched_off_the_backend_thread(monkeypatch):
+    monkeypatch.setattr(ConfigManager, 'get_config_value', lambda *keys: 'f9' if keys[-1] == 'activation_key' else None)
+    monkeypatch.setattr(ConfigManager, 'console_print', lambda *args, **kwargs: None)
+    listener = KeyListener.__new__(KeyListener)
+    listener.active_backend = object()
+    listener.is_running = True
+    listener.callbacks = {'on_activate': (), 'on_deactivate': ()}
+    listener._event_queue = queue.SimpleQueue()
+    listener._dispatch_thread = None
+    listener.load_activation_keys()
+    callback_threads = []
+
+    def failing_callback():
+        raise RuntimeError('callback failed')
+
+    def on_activate():
+        callback_threads.append(threading.current_thread())
+
+    listener.add_callback('on_deactivate', failing_callback)
+    listener.add_callback('on_activate', on_activate)
+    listener._start_dispatch_thread()
+
+    listener.on_input_event((KeyCode.F9, InputEvent.KEY_PRESS))
+    listener.on_input_event((KeyCode.F9, InputEvent.KEY_RELEASE))
+    time.sleep(0.35)  # Let the press debounce expire
+    listener.on_input_event((KeyCode.F9, InputEvent.KEY_PRESS))
+
+    deadline = time.monotonic() + 2
+    while len(callback_threads) < 2 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert callback_threads == [listener._dispatch_thread] * 2
+
+
+def test_events_queued_before_stop_do_not_fire_callbacks(monkeypatch):
+    monkeypatch.setattr(ConfigManager, 'get_config_value', lambda *keys: 'f9' if keys[-1] == 'activation_key' else None)
+    monkeypatch.setattr(ConfigManager, 'console_print', lambda *args, **kwargs: None)
+
+    class Backend:
+        is_running = True
+
+        def stop(self):
+            self.is_running = False
+            return True
+
+    listener = KeyListener.__new__(KeyListener)
+    listener.active_backend = Backend()
+    listener.is_running = True
+    listener.stop_count = 0
+    listener.start_count = 0
+    listener.callbacks = {'on_activate': (), 'on_deactivate': ()}
+    listener._event_queue = queue.SimpleQueue()
+    listener._dispatch_thread = None
+    listener.load_activation_keys()
+    fired = []
+    listener.add_callback('on_activate', lambda: fired.append('activate'))
+
+    # Queued while the dispatcher thread is busy, then the listener is paused
+    listener.on_input_event((KeyCode.F9, InputEvent.KEY_PRESS))
+    assert listener.stop() is True
+    assert listener._event_queue.empty()
+
+    # An event the dispatcher took before the stop is ignored as well
+    listener._process_event((KeyCode.F9, InputEvent.KEY_PRESS))
+    assert fired == []
@@ -1,6 +1,8 @@
 import sys
 import types
 
+import pytest
+
 
 def test_pynput_backend_start_stop_are_idempotent(monkeypatch):
     sys.path.insert(0, 'src')
@@ -39,4 +41,121 @@ def test_pynput_backend_start_stop_are_idempotent(monkeypatch):
     assert sum(listener.started for listener in created_listeners) == 2
     assert sum(listener.stopped for listener in created_listeners) == 2
 
-    sys.path.pop(0)
\ No newline at end of file
+    sys.path.pop(0)
+
+def test_evdev_key_map_is_built_once_per_class():
+    ecodes = pytest.importorskip('evdev').ecodes
+    sys.path.insert(0, 'src')
+    from key_listener import EvdevBackend, KeyCode
+
+    key_map = EvdevBackend._get_key_map()
+
+    assert EvdevBackend._get_key_map() is key_map
+    assert EvdevBackend._EV_KEY == ecodes.EV_KEY
+    assert key_map[ecodes.KEY_KPENTER] is KeyCode.NUMPAD_ENTER
+    assert key_map[ecodes.KEY_LEFTCTRL] is KeyCode.CTRL_LEFT
+
+    sys.path.pop(0)
+
+
+def test_evdev_backend_reads_ready_devices_round_robin(monkeypatch):
+    import errno
+    import selectors
+    import socket
+    import threading
+    sys.path.insert(0, 'src')
+    from key_listener import EvdevBackend
+
+    key_event = types.SimpleNamespace(type=1)
+    motion_event = types.SimpleNamespace(type=2)
+    sockets = []
+
+    class FakeDevice:
+        def __init__(self, path, batches):
+            self.path = path
+            self.batches = batches
+            self.reads = 0
+            reader, writer = socket.socketpair()
+            writer.send(b'x')  # Keep the device readable
+            sockets.extend((reader, writer))
+            self.fd = reader.fileno()
+
+        def fileno(self):
+            return self.fd
+
+        def read(self):
+            self.reads += 1
+            if not self.batches:
+                raise OSError(errno.ENODEV, 'No such device')
+            return iter(self.batches.pop(0))
+
+    # The mouse always has more motion to report; the keyboard has a single batch
+    mouse = FakeDevice('/dev/input/event1', [[motion_event]] * 50)
+    keyboard = FakeDevice('/dev/input/event0', [[key_event]])
+
+    monkeypatch.setattr(EvdevBackend, '_EV_KEY', 1)
+    backend = EvdevBackend()
+    backend.devices = {device.fd: device for device in (mouse, keyboard)}
+    backend.selector = selectors.DefaultSelector()
+    for device in backend.devices.values():
+        backend.selector.register(device, selectors.EVENT_READ, device)
+    backend.stop_event = threading.Event()
+    mouse_reads_before_key = []
+
+    def handle_input_event(event):
+        mouse_reads_before_key.append(mouse.reads)
+        backend.stop_event.set()
+
+    backend._handle_input_event = handle_input_event
+
+    backend._listen_loop()
+
+    assert mouse_reads_before_key and mouse_reads_before_key[0] <= 1
+
+    backend.selector.close()
+    for sock in sockets:
+        sock.close()
+    sys.path.pop(0)
+
+
+def test_evdev_backend_translates_raw_key_events():
+    sys.path.insert(0, 'src')
+    from key_listener import EvdevBackend, InputEvent, KeyCode
+
+    backend = EvdevBackend()
+    backend.key_map = {29: KeyCode.CTRL_LEFT}
+
+    def raw_event(code, value):
+        return types.SimpleNamespace(type=1, code=code, value=value)
+
+    assert backend._translate_evdev_event(raw_event(29, 1)) == (KeyCode.CTRL_LEFT, InputEvent.KEY_PRESS)
+    assert backend._translate_evdev_event(raw_event(29, 2)) is None
+    assert backend._translate_evdev_event(raw_event(29, 0)) == (KeyCode.CTRL_LEFT, InputEvent.KEY_RELEASE)
+    assert backend._translate_evdev_event(raw_event(30, 1)) is None
+
+    sys.path.pop(0)
+
+
+def test_evdev_backend_unregisters_devices_that_disappear():
+    import errno
+    import selectors
+    import socket
+    sys.path.insert(0, 'src')
+    from key_listener import EvdevBackend
+
+    reader, writer = socket.socketpair()
+    device = types.SimpleNamespace(path='/dev/input/event0', fd=reader.fileno(), fileno=reader.fileno)
+    backend = EvdevBackend()
+    backend.devices = {device.fd: device}
+    backend.selector = selectors.DefaultSelector()
+    backend.selector.register(device, selectors.EVENT_READ, device)
+
+    backend._handle_device_error(device, OSError(errno.ENODEV, 'No such device'))
+
+    assert backend.devices == {}
+    assert backend.selector.get_map() == {}
+
+    backend.selector.close()
+    reader.close()
+    writer.close()
+    sys.path.pop(0)
@@ -0,0 +1,47 @@
+import sys
+from unittest.mock import patch
+
+
+def _fresh_keyring_manager():
+    for module in ['keyring_manager', 'utils']:
+        if module in sys.modules:
+            del sys.modules[module]
+    sys.path.insert(0, 'src')
+    import keyring_manager
+    sys.path.pop(0)
+    return keyring_manager
+
+
+def test_get_api_key_reads_keyring_once_and_sees_saved_keys():
+    keyring_manager = _fresh_keyring_manager()
+
+    with patch.object(keyring_manager, 'keyring') as mock_keyring, \
+         patch.object(keyring_manager, 'ConfigManager'):
+        mock_keyring.get_password.return_value = "stored-key"
+        KeyringManager = keyring_manager.KeyringManager
+
+        assert KeyringManager.get_api_key("openai_llm") == "stored-key"
+        assert KeyringManager.get_api_key("openai_llm") == "stored-key"
+        assert mock_keyring.get_password.call_count == 1
+
+        KeyringManager.save_api_key("openai_llm", "new-key")
+        assert KeyringManager.get_api_key("openai_llm") == "new-key"
+
+        KeyringManager.save_api_key("openai_llm", "")
+        assert KeyringManager.get_api_key("openai_llm") == ""
+        assert mock_keyring.get_password.call_count == 1
+
+
+def test_get_api_key_stops_querying_when_no_keyring_backend_exists():
+    keyring_manager = _fresh_keyring_manager()
+    import keyring.errors
+
+    with patch.object(keyring_manager, 'keyring') as mock_keyring, \
+         patch.object(keyring_manager, 'ConfigManager'):
+        mock_keyring.errors = keyring.errors
+        mock_keyring.get_password.side_effect = keyring.errors.NoKeyringError("no backend")
+        KeyringManager = keyring_manager.KeyringManager
+
+        assert KeyringManager.get_api_key("claude") == ""
+        assert KeyringManager.get_api_key("groq") == ""
+        assert mock_keyring.get_password.call_count == 1
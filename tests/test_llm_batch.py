@@ -0,0 +1,193 @@
+import json
+import sys
+from unittest.mock import MagicMock, patch
+
+
+def _response(payload=None, text=''):
+    response = MagicMock()
+    response.status_code = 200
+    response.json.return_value = payload
+    response.text = text
+    return response
+
+
+def test_claude_batch_submits_once_and_maps_results_by_custom_id():
+    sys.path.insert(0, 'src')
+
+    with patch('llm_processor.ConfigManager') as mock_config, \
+         patch('llm_processor.KeyringManager') as mock_keyring, \
+         patch('llm_processor.time.sleep'), \
+         patch('llm_processor.requests.Session.post') as mock_post, \
+         patch('llm_processor.requests.Session.get') as mock_get:
+
+        mock_config.get_config_section.return_value = {
+            'api_type': 'claude',
+            'enabled': True,
+            'temperature': 0.3
+        }
+        mock_config.get_config_value.side_effect = lambda section, key: {
+            ('llm_post_processing', 'cleanup_model'): 'claude-3-5-haiku-latest'
+        }.get((section, key))
+        mock_config.console_print = lambda *args, **kwargs: None
+        mock_keyring.get_api_key.return_value = 'test-claude-key'
+
+        mock_post.return_value = _response({'id': 'batch-1', 'processing_status': 'in_progress'})
+        results = '\n'.join([
+            json.dumps({
+                'custom_id': 'item-1',
+                'result': {'type': 'succeeded', 'message': {'content': [{'type': 'text', 'text': 'Drugi.'}]}}
+            }),
+            json.dumps({'custom_id': 'item-0', 'result': {'type': 'errored'}}),
+        ])
+        mock_get.side_effect = [
+            _response({
+                'id': 'batch-1',
+                'processing_status': 'ended',
+                'request_counts': {'processing': 0},
+                'results_url': 'https://api.anthropic.com/v1/messages/batches/batch-1/results'
+            }),
+            _response(text=results),
+        ]
+        progress = []
+
+        from llm_processor import LLMProcessor
+
+        processor = LLMProcessor(api_type='claude')
+        output = processor.process_batch(
+            [
+                {'text': 'pierwszy', 'system_message': 'System', 'mode': 'cleanup'},
+                {'text': 'drugi', 'system_message': 'System', 'mode': 'cleanup'},
+            ],
+            on_progress=lambda done, total: progress.append((done, total))
+        )
+
+        assert output == ['pierwszy', 'Drugi.']
+        assert progress == [(2, 2)]
+        assert mock_post.call_count == 1
+        submitted = mock_post.call_args[1]['json']['requests']
+        assert [request['custom_id'] for request in submitted] == ['item-0', 'item-1']
+        assert '<transcript>' in submitted[0]['params']['messages'][0]['content']
+
+    sys.path.pop(0)
+
+
+def test_process_text_many_packs_texts_and_retries_missing_items():
+    sys.path.insert(0, 'src')
+
+    with patch('llm_processor.ConfigManager') as mock_config, \
+         patch('llm_processor.KeyringManager') as mock_keyring, \
+         patch('llm_processor.requests.Session.post') as mock_post:
+
+        mock_config.get_config_section.return_value = {
+            'api_type': 'openai',
+            'enabled': True,
+            'temperature': 0.3
+        }
+        mock_config.get_config_value.side_effect = lambda section, key: {
+            ('llm_post_processing', 'instruction_model'): 'gpt-4o-mini',
+            ('llm_post_processing', 'instruction_system_message'): 'Translate'
+        }.get((section, key))
+        mock_config.console_print = lambda *args, **kwargs: None
+        mock_keyring.get_api_key.return_value = 'test-openai-key'
+
+        packed_reply = json.dumps({'items': [{'id': 0, 'text': 'One'}, {'id': 2, 'text': 'Three'}]})
+        mock_post.side_effect = [
+            _response({'choices': [{'message': {'content': packed_reply}}]}),
+            _response({'choices': [{'message': {'content': 'Two'}}]}),
+        ]
+
+        from llm_processor import LLMProcessor
+
+        processor = LLMProcessor(api_type='openai')
+        output = processor.process_text_many(['jeden', 'dwa', 'trzy'], 'Translate')
+
+        assert output == ['One', 'Two', 'Three']
+        assert mock_post.call_count == 2
+        packed_request = mock_post.call_args_list[0][1]['json']
+        assert packed_request['response_format'] == {'type': 'json_object'}
+        assert json.loads(packed_request['messages'][-1]['content'])['items'][1] == {'id': 1, 'text': 'dwa'}
+        assert mock_post.call_args_list[1][1]['json']['messages'][-1]['content'] == 'dwa'
+
+    sys.path.pop(0)
+
+
+def test_process_text_many_frames_cleanup_items_caches_replies_and_respects_the_breaker():
+    sys.path.insert(0, 'src')
+
+    with patch('llm_processor.ConfigManager') as mock_config, \
+         patch('llm_processor.KeyringManager') as mock_keyring, \
+         patch('llm_processor.requests.Session.post') as mock_post:
+
+        mock_config.get_config_section.return_value = {
+            'api_type': 'openai',
+            'enabled': True,
+            'temperature': 0.3
+        }
+        mock_config.get_config_value.side_effect = lambda section, key: {
+            ('llm_post_processing', 'cleanup_model'): 'gpt-4o-mini'
+        }.get((section, key))
+        mock_config.console_print = lambda *args, **kwargs: None
+        mock_keyring.get_api_key.return_value = 'test-openai-key'
+
+        packed_reply = json.dumps({'items': [{'id': 0, 'text': 'One.'}, {'id': 1, 'text': 'Two.'}]})
+        mock_post.return_value = _response({'choices': [{'message': {'content': packed_reply}}]})
+
+        from llm_processor import LLMProcessor
+
+        LLMProcessor._breakers.clear()
+        try:
+            processor = LLMProcessor(api_type='openai')
+            assert processor.process_text_many(['one', 'two'], 'Clean up', mode='cleanup') == ['One.', 'Two.']
+            packed_request = mock_post.call_args[1]['json']
+            items = json.loads(packed_request['messages'][-1]['content'])['items']
+            assert all('<transcript>' in item['text'] for item in items)
+
+            # Answered from the response cache
+            assert processor.process_text_many(['one', 'two'], 'Clean up', mode='cleanup') == ['One.', 'Two.']
+            assert mock_post.call_count == 1
+
+            LLMProcessor._breakers['openai'] = {'fail_count': 3, 'open_until': float('inf')}
+            assert processor.process_text_many(['three', 'four'], 'Clean up', mode='cleanup') == ['three', 'four']
+            assert mock_post.call_count == 1
+        finally:
+            LLMProcessor._breakers.clear()
+
+    sys.path.pop(0)
+
+
+def test_process_text_many_keeps_packed_groups_within_the_output_budget():
+    sys.path.insert(0, 'src')
+
+    with patch('llm_processor.ConfigManager') as mock_config, \
+         patch('llm_processor.KeyringManager'):
+
+        mock_config.get_config_section.return_value = {
+            'api_type': 'claude',
+            'enabled': True,
+            'temperature': 0.3
+        }
+        mock_config.get_config_value.return_value = None
+        mock_config.console_print = lambda *args, **kwargs: None
+
+        import llm_processor
+        from llm_processor import LLMProcessor
+
+        packed_groups = []
+
+        def fake_process_packed(self, api_type, items, system_message, model, mode):
+            packed_groups.append(items)
+            return {index: f'clean {index}' for index in items}
+
+        with patch.object(LLMProcessor, '_process_packed', fake_process_packed):
+            processor = LLMProcessor(api_type='claude')
+            texts = ['x' * 3000 for _ in range(4)]
+            output = processor.process_text_many(texts, 'Clean up', mode='cleanup')
+
+        assert output == ['clean 0', 'clean 1', 'clean 2', 'clean 3']
+        assert [sorted(items) for items in packed_groups] == [[0, 1], [2, 3]]
+        for items in packed_groups:
+            packed_text = json.dumps({'items': [{'id': i, 'text': t} for i, t in items.items()]})
+            # A cleanup reply as long as the packed request still fits its output budget
+            assert LLMProcessor._estimate_max_tokens(packed_text, 'cleanup') < llm_processor.DEFAULT_MAX_OUTPUT_TOKENS
+
+    sys.path.pop(0)
@@ -40,12 +40,26 @@ def test_reasoning_effort_uses_expected_defaults_for_gpt5_variants():
     sys.path.pop(0)
 
 
+def test_cleanup_output_budget_scales_with_input_length():
+    sys.path.insert(0, 'src')
+    from llm_processor import LLMProcessor
+
+    short_budget = LLMProcessor._estimate_max_tokens('x' * 100, 'cleanup')
+    long_budget = LLMProcessor._estimate_max_tokens('x' * 4000, 'cleanup')
+
+    assert short_budget >= 100
+    assert long_budget >= 2000
+    assert short_budget < long_budget <= 4096
+    assert LLMProcessor._estimate_max_tokens('x' * 100, 'instruction') == 4096
+    sys.path.pop(0)
+
+
 def test_azure_openai_responses_cleanup_uses_instructions_and_schema():
     sys.path.insert(0, 'src')
 
     with patch('llm_processor.ConfigManager') as mock_config, \
          patch('llm_processor.KeyringManager') as mock_keyring, \
-         patch('llm_processor.requests.post') as mock_post:
+         patch('llm_processor.requests.Session.post') as mock_post:
 
         mock_config.get_config_section.return_value = {
             'api_type': 'azure_openai',
@@ -107,7 +121,7 @@ def test_responses_retry_with_supported_reasoning_effort():
 
     with patch('llm_processor.ConfigManager') as mock_config, \
          patch('llm_processor.KeyringManager') as mock_keyring, \
-         patch('llm_processor.requests.post') as mock_post:
+         patch('llm_processor.requests.Session.post') as mock_post:
 
         mock_config.get_config_section.return_value = {
             'api_type': 'openai',
@@ -164,4 +178,54 @@ def test_responses_retry_with_supported_reasoning_effort():
         assert first_payload['reasoning']['effort'] == 'none'
         assert second_payload['reasoning']['effort'] == 'medium'
 
-    sys.path.pop(0)
\ No newline at end of file
+    sys.path.pop(0)
+
+def test_short_transcripts_skip_cleanup_below_token_threshold():
+    sys.path.insert(0, 'src')
+
+    with patch('llm_processor.ConfigManager') as mock_config, \
+         patch('llm_processor.KeyringManager') as mock_keyring, \
+         patch('llm_processor.requests.Session.post') as mock_post:
+
+        mock_config.get_config_section.return_value = {
+            'api_type': 'claude',
+            'enabled': True,
+            'endpoint': 'https://api.anthropic.com/v1/messages',
+            'temperature': 0.3,
+            'min_tokens_to_process': 4
+        }
+        mock_config.get_config_value.return_value = None
+        mock_config.console_print = lambda *args, **kwargs: None
+        mock_keyring.get_api_key.return_value = 'test-claude-key'
+
+        from llm_processor import LLMProcessor
+
+        processor = LLMProcessor(api_type='claude')
+
+        assert processor.process_text('ok', 'System message', mode='cleanup') == 'ok'
+        mock_post.assert_not_called()
+
+        # Short instructions are still sent
+        processor.process_text('ok', 'System message', mode='instruction')
+        mock_post.assert_called_once()
+
+    sys.path.pop(0)
+
+
+def test_token_count_falls_back_when_the_encoding_download_fails():
+    sys.path.insert(0, 'src')
+    import llm_processor
+
+    tiktoken = MagicMock()
+    tiktoken.encoding_for_model.side_effect = OSError('network unreachable')
+
+    llm_processor._token_encoders.pop('offline-model', None)
+    try:
+        with patch.object(llm_processor, '_lazy_import', return_value=tiktoken):
+            assert llm_processor._count_tokens('twelve chars', 'offline-model') == 3
+            assert llm_processor._count_tokens('twelve chars', 'offline-model') == 3
+        # The failed lookup is not retried on the next request
+        assert tiktoken.encoding_for_model.call_count == 1
+    finally:
+        llm_processor._token_encoders.pop('offline-model', None)
+    sys.path.pop(0)
@@ -0,0 +1,150 @@
+import sys
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+
+def test_sessions_are_shared_per_host():
+    sys.path.insert(0, 'src')
+    from llm_processor import LLMProcessor
+
+    first = LLMProcessor._get_session('https://api.openai.com/v1/chat/completions')
+    second = LLMProcessor._get_session('https://api.openai.com/v1/responses')
+    other = LLMProcessor._get_session('https://api.anthropic.com/v1/messages')
+
+    assert first is second
+    assert other is not first
+    retries = first.get_adapter('https://api.openai.com').max_retries
+    assert retries.total == 3
+    assert retries.is_retry('POST', 529)
+    assert retries.is_retry('POST', 429, has_retry_after=True)
+    sys.path.pop(0)
+
+
+def test_session_does_not_retry_a_post_after_a_read_timeout():
+    sys.path.insert(0, 'src')
+    from urllib3.exceptions import MaxRetryError, NewConnectionError, ReadTimeoutError
+    from llm_processor import LLMProcessor
+
+    retries = LLMProcessor._get_session('https://api.openai.com/v1/chat/completions').get_adapter(
+        'https://api.openai.com'
+    ).max_retries
+
+    with pytest.raises(MaxRetryError):
+        retries.increment(method='POST', url='/v1/chat/completions', error=ReadTimeoutError(None, '/', 'timed out'))
+    # Connection failures happen before the request is sent, so they are still retried
+    retried = retries.increment(method='POST', url='/v1/chat/completions', error=NewConnectionError(None, 'refused'))
+    assert retried.total == 2
+    sys.path.pop(0)
+
+
+def test_process_texts_runs_requests_concurrently_and_keeps_order():
+    sys.path.insert(0, 'src')
+
+    with patch('llm_processor.ConfigManager') as mock_config, \
+         patch('llm_processor.KeyringManager') as mock_keyring, \
+         patch('llm_processor.requests.Session.post') as mock_post:
+
+        mock_config.get_config_section.return_value = {
+            'api_type': 'openai',
+            'enabled': True,
+            'temperature': 0.3
+        }
+        mock_config.get_config_value.side_effect = lambda section, key: {
+            ('llm_post_processing', 'instruction_model'): 'gpt-4o-mini'
+        }.get((section, key))
+        mock_config.console_print = lambda *args, **kwargs: None
+        mock_keyring.get_api_key.return_value = 'test-openai-key'
+
+        # Every request waits until all three are in flight at the same time
+        barrier = threading.Barrier(3, timeout=5)
+
+        def fake_post(url, headers=None, json=None, **kwargs):
+            barrier.wait()
+            response = MagicMock()
+            response.status_code = 200
+            response.json.return_value = {
+                'choices': [{'message': {'content': json['messages'][-1]['content'].upper()}}]
+            }
+            return response
+
+        mock_post.side_effect = fake_post
+
+        from llm_processor import LLMProcessor
+
+        processor = LLMProcessor(api_type='openai')
+        results = processor.process_texts(
+            [('one', 'System'), ('two', 'System'), ('three', 'System')],
+            mode='instruction'
+        )
+
+        assert results == ['ONE', 'TWO', 'THREE']
+
+    sys.path.pop(0)
+
+
+def test_warm_up_opens_the_provider_connection_in_the_background():
+    sys.path.insert(0, 'src')
+
+    with patch('llm_processor.ConfigManager') as mock_config, \
+         patch('llm_processor.KeyringManager') as mock_keyring, \
+         patch('llm_processor.requests.Session.head') as mock_head:
+
+        mock_config.get_config_section.return_value = {'api_type': 'openai', 'enabled': True}
+        mock_config.console_print = lambda *args, **kwargs: None
+        mock_keyring.get_api_key.return_value = 'test-openai-key'
+
+        from llm_processor import LLMProcessor
+
+        processor = LLMProcessor(api_type='openai')
+        processor._warm_up_connection()
+
+        assert mock_head.call_args[0][0] == 'https://api.openai.com/v1'
+        assert mock_head.call_args[1]['timeout'] == 5
+
+    sys.path.pop(0)
+
+
+def test_circuit_breaker_skips_provider_after_repeated_failures():
+    sys.path.insert(0, 'src')
+
+    with patch('llm_processor.ConfigManager') as mock_config, \
+         patch('llm_processor.KeyringManager') as mock_keyring, \
+         patch('llm_processor.requests.Session.post') as mock_post:
+
+        mock_config.get_config_section.return_value = {
+            'api_type': 'openai',
+            'enabled': True,
+            'temperature': 0.3
+        }
+        mock_config.get_config_value.side_effect = lambda section, key: {
+            ('llm_post_processing', 'instruction_model'): 'gpt-4o-mini'
+        }.get((section, key))
+        mock_config.console_print = lambda *args, **kwargs: None
+        mock_keyring.get_api_key.return_value = 'test-openai-key'
+
+        import llm_processor
+        from llm_processor import LLMProcessor
+
+        mock_post.side_effect = llm_processor.requests.ConnectionError('provider down')
+        LLMProcessor._breakers.clear()
+        try:
+            processor = LLMProcessor(api_type='openai')
+            for attempt in range(llm_processor.CIRCUIT_BREAKER_THRESHOLD + 2):
+                assert processor.process_text(f'text {attempt}', 'System', mode='instruction') == f'text {attempt}'
+
+            # Only the requests before the breaker opened reached the provider, each with a timeout
+            assert mock_post.call_count == llm_processor.CIRCUIT_BREAKER_THRESHOLD
+            assert mock_post.call_args[1]['timeout'] == llm_processor.REQUEST_TIMEOUT
+
+            LLMProcessor._breakers['openai']['open_until'] = 0.0
+            mock_post.side_effect = None
+            mock_post.return_value.status_code = 200
+            mock_post.return_value.json.return_value = {'choices': [{'message': {'content': 'back'}}]}
+            assert processor.process_text('again', 'System', mode='instruction') == 'back'
+            assert LLMProcessor._breakers['openai']['fail_count'] == 0
+        finally:
+            LLMProcessor._breakers.clear()
+
+    sys.path.pop(0)
@@ -0,0 +1,129 @@
+import sys
+import threading
+import types
+from unittest.mock import MagicMock, patch
+
+
+def test_available_models_are_cached_until_forced_refresh():
+    sys.path.insert(0, 'src')
+
+    with patch('llm_processor.ConfigManager') as mock_config, \
+         patch('llm_processor.KeyringManager') as mock_keyring, \
+         patch('llm_processor.requests.Session.get') as mock_get:
+
+        mock_config.get_config_section.return_value = {'api_type': 'claude', 'enabled': True}
+        mock_config.console_print = lambda *args, **kwargs: None
+        mock_keyring.get_api_key.return_value = 'test-claude-key'
+
+        response = MagicMock()
+        response.status_code = 200
+        response.json.return_value = {'data': [{'id': 'claude-3-5-haiku-latest'}]}
+        mock_get.return_value = response
+
+        from llm_processor import LLMProcessor
+
+        LLMProcessor._models_cache.clear()
+        processor = LLMProcessor(api_type='claude')
+
+        assert processor.get_available_models('claude') == ['claude-3-5-haiku-latest']
+        assert processor.get_available_models('claude') == ['claude-3-5-haiku-latest']
+        assert mock_get.call_count == 1
+
+        assert processor.get_available_models('claude', force_refresh=True) == ['claude-3-5-haiku-latest']
+        assert mock_get.call_count == 2
+        LLMProcessor._models_cache.clear()
+
+    sys.path.pop(0)
+
+
+def test_ollama_model_listing_is_reused_between_requests():
+    sys.path.insert(0, 'src')
+
+    with patch('llm_processor.ConfigManager') as mock_config, \
+         patch('llm_processor.KeyringManager'):
+
+        mock_config.get_config_section.return_value = {'api_type': 'ollama', 'enabled': True}
+        mock_config.console_print = lambda *args, **kwargs: None
+
+        import llm_processor
+
+        fake_ollama = types.SimpleNamespace(
+            list=MagicMock(return_value=types.SimpleNamespace(
+                models=[types.SimpleNamespace(model='llama3.2:latest', details=None)]
+            )),
+            chat=MagicMock(return_value={'message': {'content': 'Done.'}}),
+            ResponseError=Exception
+        )
+        llm_processor.LLMProcessor._ollama_models_cache = None
+
+        with patch.dict(llm_processor._sdk_cache, {'ollama': fake_ollama}):
+            processor = llm_processor.LLMProcessor(api_type='ollama')
+            for _ in range(3):
+                assert processor._process_ollama('text', 'System', 'llama3.2', 'instruction') == 'Done.'
+
+        assert fake_ollama.list.call_count == 1
+        assert fake_ollama.chat.call_count == 3
+        llm_processor.LLMProcessor._ollama_models_cache = None
+
+    sys.path.pop(0)
+
+
+def test_ollama_models_are_listed_through_the_sdk():
+    sys.path.insert(0, 'src')
+
+    with patch('llm_processor.ConfigManager') as mock_config, \
+         patch('llm_processor.KeyringManager'), \
+         patch('llm_processor.requests.Session.get') as mock_get:
+
+        mock_config.get_config_section.return_value = {'api_type': 'ollama', 'enabled': True}
+        mock_config.console_print = lambda *args, **kwargs: None
+
+        import llm_processor
+
+        fake_ollama = types.SimpleNamespace(list=MagicMock(return_value=types.SimpleNamespace(
+            models=[
+                types.SimpleNamespace(model='llama3.2:latest', details=None),
+                types.SimpleNamespace(model='airat/karen-the-editor-v2-strict:latest', details=None),
+            ]
+        )))
+        llm_processor.LLMProcessor._models_cache.clear()
+
+        with patch.dict(llm_processor._sdk_cache, {'ollama': fake_ollama}):
+            processor = llm_processor.LLMProcessor(api_type='ollama')
+            models = processor.get_available_models('ollama')
+
+        assert models == ['airat/karen-the-editor-v2-strict', 'llama3.2']
+        assert not mock_get.called
+        llm_processor.LLMProcessor._models_cache.clear()
+        llm_processor.LLMProcessor._ollama_models_cache = None
+
+    sys.path.pop(0)
+
+
+def test_all_available_models_are_fetched_concurrently():
+    sys.path.insert(0, 'src')
+
+    with patch('llm_processor.ConfigManager') as mock_config, \
+         patch('llm_processor.KeyringManager'):
+
+        mock_config.get_config_section.return_value = {'api_type': 'claude', 'enabled': True}
+        mock_config.console_print = lambda *args, **kwargs: None
+
+        from llm_processor import LLMProcessor
+
+        # Both providers must be queried at the same time for either to answer
+        barrier = threading.Barrier(2, timeout=5)
+
+        def fake_fetch(api_type):
+            barrier.wait()
+            return [f'{api_type}-model']
+
+        LLMProcessor._models_cache.clear()
+        processor = LLMProcessor(api_type='claude')
+        with patch.object(processor, '_fetch_available_models', side_effect=fake_fetch):
+            models = processor.get_all_available_models(['claude', 'openai'])
+
+        assert models == {'claude': ['claude-model'], 'openai': ['openai-model']}
+        LLMProcessor._models_cache.clear()
+
+    sys.path.pop(0)
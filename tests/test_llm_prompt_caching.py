@@ -0,0 +1,49 @@
+import sys
+from unittest.mock import MagicMock, patch
+
+
+def test_claude_system_prompt_is_marked_cacheable():
+    sys.path.insert(0, 'src')
+
+    with patch('llm_processor.ConfigManager') as mock_config, \
+         patch('llm_processor.KeyringManager') as mock_keyring, \
+         patch('llm_processor.requests.Session.post') as mock_post:
+
+        mock_config.get_config_section.return_value = {
+            'api_type': 'claude',
+            'enabled': True,
+            'temperature': 0.3,
+            'endpoint': 'https://api.anthropic.com/v1/messages'
+        }
+
+        def mock_get_config_value(section, key):
+            return {
+                ('llm_post_processing', 'cleanup_model'): 'claude-3-5-haiku-latest',
+                ('llm_post_processing', 'instruction_model'): 'claude-3-5-haiku-latest'
+            }.get((section, key))
+
+        mock_config.get_config_value.side_effect = mock_get_config_value
+        mock_config.console_print = lambda *args, **kwargs: None
+        mock_keyring.get_api_key.return_value = 'test-claude-key'
+
+        mock_response = MagicMock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {
+            'content': [{'type': 'text', 'text': 'To jest test.'}],
+            'usage': {'cache_read_input_tokens': 1200, 'cache_creation_input_tokens': 0}
+        }
+        mock_post.return_value = mock_response
+
+        from llm_processor import LLMProcessor
+
+        processor = LLMProcessor(api_type='claude')
+        result = processor.process_text('to jest test', 'System message', mode='cleanup')
+
+        assert result == 'To jest test.'
+        request_data = mock_post.call_args[1]['json']
+        assert request_data['system'] == [
+            {'type': 'text', 'text': 'System message', 'cache_control': {'type': 'ephemeral'}}
+        ]
+        assert request_data['messages'][-1]['role'] == 'user'
+
+    sys.path.pop(0)
@@ -0,0 +1,90 @@
+import sys
+from unittest.mock import MagicMock, patch
+
+
+def _configure(mock_config, mock_keyring):
+    mock_config.get_config_section.return_value = {
+        'api_type': 'openai',
+        'enabled': True,
+        'temperature': 0.3
+    }
+
+    def mock_get_config_value(section, key):
+        return {
+            ('llm_post_processing', 'cleanup_model'): 'gpt-4o-mini',
+            ('llm_post_processing', 'instruction_model'): 'gpt-4o-mini'
+        }.get((section, key))
+
+    mock_config.get_config_value.side_effect = mock_get_config_value
+    mock_config.console_print = lambda *args, **kwargs: None
+    mock_keyring.get_api_key.return_value = 'test-openai-key'
+
+
+def _chat_response(content, status_code=200):
+    response = MagicMock()
+    response.status_code = status_code
+    response.text = content
+    response.json.return_value = {'choices': [{'message': {'content': content}}]}
+    return response
+
+
+def test_identical_requests_are_served_from_cache():
+    sys.path.insert(0, 'src')
+
+    with patch('llm_processor.ConfigManager') as mock_config, \
+         patch('llm_processor.KeyringManager') as mock_keyring, \
+         patch('llm_processor.requests.Session.post') as mock_post:
+        _configure(mock_config, mock_keyring)
+        mock_post.return_value = _chat_response('{"cleaned_text": "To jest test."}')
+
+        from llm_processor import LLMProcessor
+
+        processor = LLMProcessor(api_type='openai')
+        first = processor.process_text('to jest test', 'System message', mode='cleanup')
+        second = processor.process_text('to jest test', 'System message', mode='cleanup')
+        other = processor.process_text('to jest inny test', 'System message', mode='cleanup')
+
+        assert first == second == 'To jest test.'
+        assert other == 'To jest test.'
+        assert mock_post.call_count == 2
+
+    sys.path.pop(0)
+
+
+def test_failed_requests_are_not_cached():
+    sys.path.insert(0, 'src')
+
+    with patch('llm_processor.ConfigManager') as mock_config, \
+         patch('llm_processor.KeyringManager') as mock_keyring, \
+         patch('llm_processor.requests.Session.post') as mock_post:
+        _configure(mock_config, mock_keyring)
+        mock_post.side_effect = [
+            _chat_response('Service unavailable', status_code=503),
+            _chat_response('{"cleaned_text": "To jest test."}')
+        ]
+
+        from llm_processor import LLMProcessor
+
+        processor = LLMProcessor(api_type='openai')
+        assert processor.process_text('to jest test', 'System message', mode='cleanup') == 'to jest test'
+        assert processor.process_text('to jest test', 'System message', mode='cleanup') == 'To jest test.'
+        assert mock_post.call_count == 2
+
+    sys.path.pop(0)
+
+
+def test_response_cache_evicts_least_frequently_used_entry():
+    sys.path.insert(0, 'src')
+    from llm_processor import ResponseCache
+
+    cache = ResponseCache(max_entries=2)
+    cache.put('a', 'first')
+    cache.put('b', 'second')
+    assert cache.get('a') == 'first'
+
+    cache.put('c', 'third')
+
+    assert cache.get('a') == 'first'
+    assert cache.get('b') is None
+    assert cache.get('c') == 'third'
+    sys.path.pop(0)
@@ -0,0 +1,75 @@
+import json
+import sys
+from unittest.mock import MagicMock, patch
+
+
+def _configure(mock_config, mock_keyring, api_type):
+    mock_config.get_config_section.return_value = {
+        'api_type': api_type,
+        'enabled': True,
+        'temperature': 0.3,
+        'endpoint': 'https://api.anthropic.com/v1/messages'
+    }
+    mock_config.get_config_value.side_effect = lambda section, key: {
+        ('llm_post_processing', 'instruction_model'): 'test-model',
+        ('llm_post_processing', 'instruction_system_message'): 'Instruction'
+    }.get((section, key))
+    mock_config.console_print = lambda *args, **kwargs: None
+    mock_keyring.get_api_key.return_value = 'test-key'
+
+
+def _streaming_response(lines):
+    response = MagicMock()
+    response.status_code = 200
+    response.iter_lines.return_value = iter(lines)
+    response.__enter__.return_value = response
+    return response
+
+
+def test_claude_instruction_stream_yields_text_deltas():
+    sys.path.insert(0, 'src')
+
+    with patch('llm_processor.ConfigManager') as mock_config, \
+         patch('llm_processor.KeyringManager') as mock_keyring, \
+         patch('llm_processor.requests.Session.post') as mock_post:
+        _configure(mock_config, mock_keyring, 'claude')
+        mock_post.return_value = _streaming_response([
+            'event: message_start',
+            'data: ' + json.dumps({'type': 'message_start'}),
+            '',
+            'event: content_block_delta',
+            'data: ' + json.dumps({'type': 'content_block_delta', 'delta': {'type': 'text_delta', 'text': 'Hello'}}),
+            'event: content_block_delta',
+            'data: ' + json.dumps({'type': 'content_block_delta', 'delta': {'type': 'text_delta', 'text': ' world'}}),
+            'data: ' + json.dumps({'type': 'message_stop'}),
+        ])
+
+        from llm_processor import LLMProcessor
+
+        processor = LLMProcessor(api_type='claude')
+        chunks = list(processor.process_text_stream('say hello', 'Instruction'))
+
+        assert chunks == ['Hello', ' world']
+        assert mock_post.call_args[1]['json']['stream'] is True
+        assert mock_post.call_args[1]['stream'] is True
+
+    sys.path.pop(0)
+
+
+def test_openai_stream_falls_back_to_input_on_error():
+    sys.path.insert(0, 'src')
+
+    with patch('llm_processor.ConfigManager') as mock_config, \
+         patch('llm_processor.KeyringManager') as mock_keyring, \
+         patch('llm_processor.requests.Session.post') as mock_post:
+        _configure(mock_config, mock_keyring, 'openai')
+        response = _streaming_response([])
+        response.status_code = 500
+        mock_post.return_value = response
+
+        from llm_processor import LLMProcessor
+
+        processor = LLMProcessor(api_type='openai')
+        assert list(processor.process_text_stream('say hello', 'Instruction')) == ['say hello']
+
+    sys.path.pop(0)
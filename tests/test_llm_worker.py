@@ -0,0 +1,64 @@
+import sys
+from unittest.mock import MagicMock, patch
+
+
+def test_llm_worker_emits_processed_text_and_falls_back_to_none_on_error():
+    sys.path.insert(0, 'src')
+
+    with patch('utils.ConfigManager.console_print'):
+        from llm_worker import LLMWorker
+
+        processor = MagicMock()
+        processor.process_text.return_value = 'Hello, world.'
+        received = []
+
+        worker = LLMWorker(processor, 'hello world', 'System message', 'cleanup')
+        worker.signals.finished.connect(lambda *args: received.append(args))
+        worker.run()
+
+        processor.process_text.side_effect = RuntimeError('boom')
+        worker.run()
+
+    processor.process_text.assert_called_with('hello world', 'System message', mode='cleanup')
+    assert received == [
+        ('hello world', 'Hello, world.', 'cleanup'),
+        ('hello world', None, 'cleanup'),
+    ]
+    sys.path.pop(0)
+
+
+def test_llm_worker_pool_finishes_requests_in_submission_order():
+    sys.path.insert(0, 'src')
+    import threading
+
+    from PyQt5.QtWidgets import QApplication
+
+    from llm_worker import LLMWorker, create_llm_worker_pool
+
+    first_started = threading.Event()
+    release_first = threading.Event()
+
+    def process_text(text, system_message, mode):
+        if text == 'first':
+            first_started.set()
+            # The second request would overtake this one on a pool with more threads
+            release_first.wait(timeout=0.5)
+        return text.upper()
+
+    processor = MagicMock()
+    processor.process_text.side_effect = process_text
+    received = []
+    # The finished signal is delivered through the event loop, as it is to the app's GUI thread
+    app = QApplication.instance() or QApplication([])
+
+    pool = create_llm_worker_pool()
+    workers = [LLMWorker(processor, text, 'System message', 'cleanup') for text in ('first', 'second')]
+    for worker in workers:
+        worker.signals.finished.connect(lambda original, processed, mode: received.append(processed))
+        pool.start(worker)
+    assert first_started.wait(timeout=1)
+    pool.waitForDone()
+    app.processEvents()
+
+    assert received == ['FIRST', 'SECOND']
+    sys.path.pop(0)
@@ -20,6 +20,8 @@ def setup_thread(monkeypatch):
             pass
         def resume_media(self):
             pass
+        def shutdown(self):
+            pass
 
     monkeypatch.setitem(sys.modules, 'media_controller', types.SimpleNamespace(MediaController=DummyMediaController))
 
@@ -93,3 +95,82 @@ def test_transcription_succeeds_after_errors(setup_thread):
     assert transcribe_mock.call_count == 3
     assert not save_mock.called
     assert results == ['ok']
+
+
+def test_record_audio_keeps_every_block_when_the_buffer_grows(setup_thread, monkeypatch):
+    # The fixture replaces _record_audio, so import a fresh class for the real one
+    del sys.modules['result_thread']
+    import result_thread
+
+    blocks = [np.arange(i * 480, (i + 1) * 480, dtype=np.int16).reshape(-1, 1) for i in range(40)]
+
+    class FakeInputStream:
+        def __init__(self, callback, **kwargs):
+            self.callback = callback
+
+        def __enter__(self):
+            for block in blocks:
+                self.callback(block, len(block), None, None)
+            thread.is_recording = False
+            return self
+
+        def __exit__(self, exc_type, exc, tb):
+            return False
+
+    monkeypatch.setattr(result_thread, 'RECORDING_BUFFER_INITIAL_SECONDS', 1)
+    monkeypatch.setattr(result_thread.sd, 'InputStream', FakeInputStream, raising=False)
+
+    thread = result_thread.ResultThread()
+    thread.is_recording = True
+    audio = thread._record_audio()
+
+    assert audio.dtype == np.int16
+    np.testing.assert_array_equal(audio, np.concatenate(blocks)[:, 0])
+
+
+def test_record_audio_hands_vad_a_byte_view_of_each_frame(setup_thread, monkeypatch):
+    del sys.modules['result_thread']
+    import result_thread
+
+    blocks = [np.full((480, 1), i, dtype=np.int16) for i in range(10)]
+    vad_frames = []
+
+    class FakeVad:
+        def is_speech(self, buf, sample_rate):
+            vad_frames.append(np.frombuffer(buf, dtype=np.int16).copy())
+            return False
+
+    class FakeInputStream:
+        def __init__(self, callback, **kwargs):
+            self.callback = callback
+
+        def __enter__(self):
+            for block in blocks:
+                self.callback(block, len(block), None, None)
+            return self
+
+        def __exit__(self, exc_type, exc, tb):
+            return False
+
+    monkeypatch.setattr(result_thread.webrtcvad, 'Vad', lambda mode: FakeVad(), raising=False)
+    monkeypatch.setattr(result_thread.sd, 'InputStream', FakeInputStream, raising=False)
+
+    class StopAfterFirstWait:
+        def wait(self):
+            thread.is_recording = False
+
+        def clear(self):
+            pass
+
+        def set(self):
+            pass
+
+    monkeypatch.setattr(result_thread, 'Event', StopAfterFirstWait)
+
+    thread = result_thread.ResultThread()
+    thread.is_recording = True
+    # The first 0.15 s (five frames) are not checked for speech
+    thread._record_audio()
+
+    assert [frame[0] for frame in vad_frames] == [5, 6, 7, 8, 9]
+    assert all(len(frame) == 480 for frame in vad_frames)
@@ -122,4 +122,34 @@ def test_local_transcription_treats_auto_language_as_detection():
         assert result == 'hello'
         assert mock_model.transcribe.call_args.kwargs['language'] is None
 
-    sys.path.pop(0)
\ No newline at end of file
+    sys.path.pop(0)
+
+def test_warm_up_local_model_runs_whisper_on_silence_without_vad():
+    if 'transcription' in sys.modules:
+        del sys.modules['transcription']
+    sys.path.insert(0, 'src')
+
+    import transcription
+
+    decoded = []
+
+    def segments():
+        decoded.append(True)
+        yield SimpleNamespace(text='')
+
+    model = MagicMock()
+    model.transcribe.return_value = (segments(), None)
+
+    with patch.object(transcription, 'ConfigManager') as mock_config:
+        mock_config.console_print = lambda *args, **kwargs: None
+        transcription.warm_up_local_model(('whisper', model))
+        transcription.warm_up_local_model(('vosk', model))
+        transcription.warm_up_local_model(None)
+
+    assert model.transcribe.call_count == 1
+    audio = model.transcribe.call_args[0][0]
+    assert audio.dtype == np.float32 and audio.shape == (16000,) and not audio.any()
+    assert model.transcribe.call_args[1]['vad_filter'] is False
+    assert decoded == [True]
+
+    sys.path.pop(0)